@@ -1,5 +1,6 @@
-from flask import Flask, request, jsonify, render_template
-from app2 import wikipedia_summary  # 👈 function from your app2.py
+from flask import Flask, request, render_template
+from app2 import json_response, wikipedia_summary  # 👈 functions from your app2.py
+from results import TextReply, reply_payload
 
 app = Flask(__name__)
 
@@ -13,15 +14,16 @@ def ask():
 
     # Check if user asked for a book or science fiction
     if "science fiction" in user_input.lower():
-        return jsonify({"reply": "📚 You can read amazing Sci-Fi books here:\nhttps://www.gutenberg.org/ebooks/bookshelf/76"})
+        result = TextReply("📚 You can read amazing Sci-Fi books here:\nhttps://www.gutenberg.org/ebooks/bookshelf/76")
+        return json_response(reply_payload(result, "reply"))
     
     # Otherwise, respond using your Wikipedia logic
     try:
-        reply = wikipedia_summary(user_input)
+        result = wikipedia_summary(user_input)
     except Exception as e:
-        reply = f"❌ Error: {str(e)}"
+        result = TextReply(f"❌ Error: {str(e)}")
 
-    return jsonify({"reply": reply})
+    return json_response(reply_payload(result, "reply"))
 
 if __name__ == "__main__":
     app.run(debug=True)
@@ -0,0 +1,80 @@
+# Cost of crawling every page of a bookshelf, then of refreshing it, against
+# a local server that mimics gutenberg.org's paging (?start_index=), answers
+# If-None-Match with 304 and adds a fixed latency per request. Compares one
+# worker with CONCURRENCY workers. Requests still go through http_get and
+# its rate limiter (the default budget, since the host is localhost).
+#
+#   python benchmarks/bench_bookshelf_crawler.py [books] [latency_ms]
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ['WIKI_CACHE_PATH'] = ''
+
+import bookshelf_crawler  # noqa: E402
+from bookshelf_crawler import CONCURRENCY, PAGE_SIZE, BookshelfCrawler  # noqa: E402
+from content_cache import LRUCache, TieredCache  # noqa: E402
+
+SHELF = 76
+
+
+def make_handler(books, latency):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(latency)
+            start = int(parse_qs(urlsplit(self.path).query).get('start_index', ['1'])[0])
+            etag = f'"{start}-{books}"'
+            if self.headers.get('If-None-Match') == etag:
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.end_headers()
+                return
+            items = "".join(
+                f'<li class="booklink"><a class="link" href="/ebooks/{i}"><span class="title">Book {i}</span></a></li>'
+                for i in range(start, min(start + PAGE_SIZE, books + 1))
+            )
+            body = f"<html><body><ul>{items}</ul></body></html>".encode()
+            self.send_response(200)
+            self.send_header('ETag', etag)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+    return Handler
+
+
+def timed_crawl(crawler):
+    start = time.perf_counter()
+    books = crawler.crawl([SHELF])[SHELF]
+    return len(books), time.perf_counter() - start
+
+
+def main():
+    books = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    latency = (float(sys.argv[2]) if len(sys.argv) > 2 else 150) / 1000
+    server = ThreadingHTTPServer(('127.0.0.1', 0), make_handler(books, latency))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    bookshelf_crawler.GUTENBERG_BASE_URL = f"http://127.0.0.1:{server.server_port}"
+
+    print(f"{books} books ({-(-books // PAGE_SIZE)} pages), {latency * 1000:.0f} ms per request")
+    print(f"{'workers':>8}{'crawl':>8}{'books':>7}{'seconds':>9}{'200s':>6}{'304s':>6}")
+    for workers in (1, CONCURRENCY):
+        crawler = BookshelfCrawler(store=TieredCache(memory=LRUCache()), max_workers=workers)
+        for label in ('full', 'refresh'):
+            before = crawler.stats()
+            found, seconds = timed_crawl(crawler)
+            after = crawler.stats()
+            print(f"{workers:>8}{label:>8}{found:>7}{seconds:>9.2f}"
+                  f"{after['fetched'] - before['fetched']:>6}{after['not_modified'] - before['not_modified']:>6}")
+    server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
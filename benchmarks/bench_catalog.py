@@ -0,0 +1,92 @@
+# Memory footprint and recommendation latency of the array-backed
+# BookCatalog against the pandas DataFrame path it replaced
+# (df.sample(n) + iterrows), on a synthetic catalog. The Snapshot row is
+# the same catalog saved with save_catalog and mapped with load_catalog:
+# its columns live in the mapped file, shared by every process, so only
+# the per-process heap is counted.
+#
+#   python benchmarks/bench_catalog.py [num_books]
+import os
+import random
+import sys
+import tempfile
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from book_catalog import CatalogBuilder, ebook_url, load_catalog, save_catalog  # noqa: E402
+from results import BookRecommendation  # noqa: E402
+
+AUTHORS = [f"Author {i}" for i in range(2000)]
+K = 5
+NUMBER = 2000
+
+
+def synthetic_books(n, seed=7):
+    rng = random.Random(seed)
+    return [
+        (book_id, f"Science Fiction Story Number {book_id}", rng.choice(AUTHORS), rng.randint(0, 50_000))
+        for book_id in range(1, n + 1)
+    ]
+
+
+def build_catalog(books):
+    builder = CatalogBuilder()
+    for book_id, title, author, downloads in books:
+        builder.add(book_id, title, author, downloads)
+    return builder.build()
+
+
+def build_dataframe(books):
+    import pandas as pd
+
+    return pd.DataFrame([
+        {"title": title, "url": ebook_url(book_id), "author": author, "download_count": downloads}
+        for book_id, title, author, downloads in books
+    ])
+
+
+def recommend_dataframe(df):
+    return [BookRecommendation(row['title'], row['url']) for _, row in df.sample(n=K).iterrows()]
+
+
+def traced(fn, *args):
+    tracemalloc.start()
+    result = fn(*args)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 70_000
+    books = synthetic_books(n)
+    print(f"{n} books, {K} recommendations per request")
+    print(f"{'store':<12}{'resident KB':>13}{'us/request':>12}")
+
+    catalog, size = traced(build_catalog, books)
+    seconds = min(timeit.repeat(lambda: catalog.sample(K), number=NUMBER, repeat=3)) / NUMBER
+    print(f"{'BookCatalog':<12}{size / 1024:>13.0f}{seconds * 1e6:>12.1f}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'catalog.snapshot')
+        save_catalog(catalog, path)
+        mapped, size = traced(load_catalog, path)
+        seconds = min(timeit.repeat(lambda: mapped.sample(K), number=NUMBER, repeat=3)) / NUMBER
+        print(f"{'Snapshot':<12}{size / 1024:>13.0f}{seconds * 1e6:>12.1f}"
+              f"   + {os.path.getsize(path) / 1024:.0f} KB mapped file, shared")
+        del mapped
+
+    try:
+        df, size = traced(build_dataframe, books)
+    except ImportError:
+        print(f"{'DataFrame':<12}{'pandas not installed':>25}")
+        return 0
+    seconds = min(timeit.repeat(lambda: recommend_dataframe(df), number=NUMBER // 10, repeat=3)) / (NUMBER // 10)
+    print(f"{'DataFrame':<12}{size / 1024:>13.0f}{seconds * 1e6:>12.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+# Throughput and peak memory of streaming a pg_catalog.csv-shaped dump into
+# the science fiction BookCatalog. A synthetic dump is written to a temp
+# directory first, so no download is needed. Peak memory tracks the size of
+# the catalog kept, not of the dump: rows are parsed one at a time.
+#
+#   python benchmarks/bench_catalog_ingest.py [rows ...]
+import csv
+import gzip
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gutenberg_catalog import has_tag, read_catalog  # noqa: E402
+
+SUBJECTS = ["Science fiction", "Love stories", "Detective and mystery stories", "Adventure stories",
+            "Fairy tales", "England -- Fiction", "Short stories", "Poetry"]
+BOOKSHELVES = ["Science Fiction", "Best Books Ever Listings", "Children's Literature", "Gothic Fiction", ""]
+
+
+def write_dump(path, rows, seed=7):
+    rng = random.Random(seed)
+    with gzip.open(path, 'wt', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f, quoting=csv.QUOTE_ALL)
+        writer.writerow(["Text#", "Type", "Issued", "Title", "Language", "Authors", "Subjects", "LoCC", "Bookshelves"])
+        for book_id in range(1, rows + 1):
+            writer.writerow([
+                book_id, "Text", "2000-01-01", f"Story Number {book_id}\nA Subtitle", rng.choice(["en", "fr", "de"]),
+                f"Author {rng.randrange(5000)}, 1850-1920", "; ".join(rng.sample(SUBJECTS, 2)), "PR",
+                rng.choice(BOOKSHELVES),
+            ])
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 40_000, 80_000]
+    keep = has_tag('science fiction')
+    print(f"{'rows':>8}{'kept':>8}{'rows/s':>10}{'peak KB':>10}{'catalog KB':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in sizes:
+            path = os.path.join(tmp, f"pg_catalog_{rows}.csv.gz")
+            write_dump(path, rows)
+            tracemalloc.start()
+            start = time.perf_counter()
+            catalog = read_catalog(path, keep=keep)
+            seconds = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"{rows:>8}{len(catalog):>8}{rows / seconds:>10.0f}{peak / 1024:>10.0f}{catalog.nbytes / 1024:>12.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
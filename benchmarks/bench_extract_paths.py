@@ -0,0 +1,67 @@
+# Bytes transferred and CPU per answer for the Wikipedia extraction paths
+# (live network):
+#
+#   intro      prop=extracts&explaintext&exintro   (the summary fast path)
+#   sections   prop=extracts&explaintext           (all sections, on demand)
+#   html       action=parse&prop=text + BeautifulSoup html.parser
+#              (the legacy scraper path, for comparison)
+#
+#   python benchmarks/bench_extract_paths.py
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from http_client import http_get  # noqa: E402
+from wiki_document import parse_plaintext_extract  # noqa: E402
+from wiki_lookup import api_url  # noqa: E402
+
+TITLES = ["Albert Einstein", "Machine learning", "History of the Internet", "Photosynthesis", "Black hole"]
+
+
+def _extract(title, intro):
+    params = {"action": "query", "format": "json", "formatversion": 2, "titles": title,
+              "prop": "extracts", "explaintext": 1, "exsectionformat": "wiki"}
+    if intro:
+        params["exintro"] = 1
+    response = http_get(api_url('en'), params=params)
+    cpu = time.process_time()
+    sections = parse_plaintext_extract(response.json()["query"]["pages"][0].get("extract", ""))
+    return len(response.content), time.process_time() - cpu, sections
+
+
+def _html(title):
+    from bs4 import BeautifulSoup
+
+    response = http_get(api_url('en'), params={"action": "parse", "page": title, "format": "json", "prop": "text"})
+    cpu = time.process_time()
+    soup = BeautifulSoup(response.json()["parse"]["text"]["*"], 'html.parser')
+    content_div = soup.find('div', class_='mw-parser-output') or soup
+    paragraphs = [p.get_text().strip() for p in content_div.find_all('p') if p.get_text().strip()]
+    return len(response.content), time.process_time() - cpu, paragraphs
+
+
+PATHS = {
+    "intro": lambda title: _extract(title, intro=True),
+    "sections": lambda title: _extract(title, intro=False),
+    "html": _html,
+}
+
+
+def main():
+    print(f"{'path':<10}{'KB/answer':>12}{'CPU ms/answer':>16}")
+    for name, fetch in PATHS.items():
+        try:
+            results = [fetch(title) for title in TITLES]
+        except ImportError:
+            print(f"{name:<10}{'bs4 not installed':>28}")
+            continue
+        kb = sum(r[0] for r in results) / len(results) / 1024
+        cpu_ms = sum(r[1] for r in results) / len(results) * 1000
+        print(f"{name:<10}{kb:>12.1f}{cpu_ms:>16.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
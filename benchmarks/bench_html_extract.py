@@ -0,0 +1,97 @@
+# Parse time and peak memory of each html_extract backend over recorded
+# pages. Record the pages once (live network), then compare offline:
+#
+#   python benchmarks/bench_html_extract.py --record
+#   python benchmarks/bench_html_extract.py
+#
+# Every backend runs in a fresh interpreter so its ru_maxrss growth is not
+# hidden by whichever parser ran before it.
+import os
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+PAGES_DIR = os.environ.get('HTML_BENCH_PAGES', os.path.join(REPO_ROOT, 'benchmarks', 'pages'))
+REPEAT = 5
+
+# (file name, extractor, url)
+PAGES = [
+    ("gutenberg_bookshelf.html", "booklinks", "https://www.gutenberg.org/ebooks/bookshelf/68"),
+    ("gutenberg_subject.html", "booklinks", "https://www.gutenberg.org/ebooks/subject/2487"),
+    ("gutenberg_subjects.html", "links", "https://www.gutenberg.org/ebooks/subjects/"),
+    ("wikipedia_black_hole.html", "paragraphs", "https://en.wikipedia.org/wiki/Black_hole"),
+    ("wikipedia_einstein.html", "paragraphs", "https://en.wikipedia.org/wiki/Albert_Einstein"),
+]
+
+_PROBE = """
+import resource, sys, time
+sys.path.insert(0, {root!r})
+import html_extract
+backend = html_extract.get_backend({backend!r})
+pages = [(open(path, encoding='utf-8').read(), getattr(backend, kind)) for path, kind in {pages!r}]
+pages[0][1](pages[0][0])  # import the parser library outside the measurement
+before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+items = 0
+for _ in range({repeat}):
+    for html, extract in pages:
+        items += len(extract(html))
+print(time.perf_counter() - start, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - before, items)
+"""
+
+
+def record():
+    from http_client import http_get
+
+    os.makedirs(PAGES_DIR, exist_ok=True)
+    for name, _, url in PAGES:
+        response = http_get(url)
+        response.raise_for_status()
+        with open(os.path.join(PAGES_DIR, name), 'w', encoding='utf-8') as f:
+            f.write(response.text)
+        print(f"recorded {name} ({len(response.content) / 1024:.0f} KB)")
+
+
+def run_backend(backend, pages):
+    """Returns (ms per pass, peak RSS growth in KB, items extracted per pass), or None."""
+    probe = _PROBE.format(root=REPO_ROOT, backend=backend, pages=pages, repeat=REPEAT)
+    proc = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True)
+    if proc.returncode != 0:
+        return None
+    seconds, rss_kb, items = proc.stdout.split()
+    return float(seconds) / REPEAT * 1000, int(rss_kb), int(items) // REPEAT
+
+
+def main():
+    if '--record' in sys.argv[1:]:
+        record()
+        return 0
+
+    import html_extract
+
+    pages = [(os.path.join(PAGES_DIR, name), kind) for name, kind, _ in PAGES
+             if os.path.exists(os.path.join(PAGES_DIR, name))]
+    if not pages:
+        print(f"No recorded pages in {PAGES_DIR}; run with --record first.")
+        return 1
+
+    installed = html_extract.available_backends()
+    print(f"{len(pages)} pages, {REPEAT} passes")
+    print(f"{'backend':<12}{'ms/pass':>10}{'peak RSS KB':>14}{'items':>8}")
+    for backend in html_extract.PREFERENCE:
+        if backend not in installed:
+            print(f"{backend:<12}{'not installed':>32}")
+            continue
+        result = run_backend(backend, pages)
+        if result is None:
+            print(f"{backend:<12}{'failed':>32}")
+            continue
+        ms, rss_kb, items = result
+        print(f"{backend:<12}{ms:>10.1f}{rss_kb:>14}{items:>8}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+# Per-dependency cold-start report in the spirit of `python -X importtime`.
+#
+# Each backend is imported in a fresh interpreter with -X importtime; the
+# report lists cumulative import time and peak RSS growth per dependency,
+# plus the cost of importing the app itself (which must not pull in any of
+# the lazy backends). A failed import of app2 or app is a failure too.
+# In a running server, /metrics reports the same timings for each backend
+# as it is first loaded (lazy_imports.import_report).
+#
+#   python benchmarks/bench_importtime.py
+import os
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEPENDENCIES = ['flask', 'requests', 'numpy', 'pandas', 'bs4', 'lxml.html', 'selectolax.lexbor', 'googleapiclient.discovery', 'gradio']
+APP_MODULES = ['app2', 'app']
+LAZY_BACKENDS = ['numpy', 'pandas', 'bs4', 'lxml.html', 'selectolax.lexbor', 'googleapiclient.discovery', 'gradio']
+
+_PROBE = (
+    "import resource, sys; before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss; "
+    "import {module}; "
+    "print('RSS_KB', resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - before); "
+    "print('LOADED', ','.join(m for m in {lazy!r} if m in sys.modules))"
+)
+
+
+def profile_import(module):
+    """
+    Returns (cumulative_us, rss_kb, loaded_backends) for importing
+    ``module``, or (None, error message) if the import failed.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE.format(module=module, lazy=LAZY_BACKENDS)],
+        cwd=REPO_ROOT, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        lines = proc.stderr.strip().splitlines()
+        return None, lines[-1] if lines else f"exit status {proc.returncode}"
+
+    cumulative_us = 0
+    for line in proc.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        parts = line.split('|')
+        if len(parts) == 3 and parts[2].strip() == module:
+            cumulative_us = int(parts[1])
+    rss_kb, loaded = 0, []
+    for line in proc.stdout.splitlines():
+        if line.startswith('RSS_KB '):
+            rss_kb = int(line.split()[1])
+        elif line.startswith('LOADED '):
+            loaded = [m for m in line[len('LOADED '):].split(',') if m]
+    return cumulative_us, rss_kb, loaded
+
+
+def main():
+    print(f"{'module':<28}{'import ms':>12}{'RSS KB':>12}")
+    failed = False
+    for module in DEPENDENCIES + APP_MODULES:
+        result = profile_import(module)
+        if result[0] is None:
+            if module in APP_MODULES:
+                print(f"{module:<28}{'import failed':>24}")
+                print(f"  FAIL: {result[1]}")
+                failed = True
+            else:
+                print(f"{module:<28}{'not installed':>24}")
+            continue
+        cumulative_us, rss_kb, loaded = result
+        print(f"{module:<28}{cumulative_us / 1000:>12.1f}{rss_kb:>12}")
+        if module in APP_MODULES and loaded:
+            print(f"  FAIL: importing {module} eagerly loaded {', '.join(loaded)}")
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
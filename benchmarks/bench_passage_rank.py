@@ -0,0 +1,46 @@
+# Article index build time versus per-question cost on full articles (live
+# network for the article text; timings exclude the download). Build is
+# paid once per article and cached; each question then costs a BM25 pass
+# over the paragraphs and one TF-IDF mat-vec over the sentences.
+#
+#   python benchmarks/bench_passage_rank.py
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from passage_rank import ArticleIndex, best_passage  # noqa: E402
+from wiki_document import WikiDocument  # noqa: E402
+from wiki_lookup import fetch_sections  # noqa: E402
+
+CASES = [
+    ("Internet", "history of the internet"),
+    ("Marie Curie", "Marie Curie discoveries"),
+    ("Albert Einstein", "when did einstein emigrate to the united states"),
+    ("World War II", "how did the war in the pacific end"),
+]
+REPEAT = 50
+
+
+def main():
+    print(f"{'article':<18}{'sentences':>10}{'build ms':>10}{'question ms':>13}  best section")
+    for title, question in CASES:
+        document = WikiDocument(title=title, sections=fetch_sections(title), complete=True)
+
+        start = time.perf_counter()
+        index = ArticleIndex(document)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        for _ in range(REPEAT):
+            passage = best_passage(document, question, max_sentences=3, index=index)
+        question_ms = (time.perf_counter() - start) / REPEAT * 1000
+
+        heading = (passage["heading"] or "(lead)") if passage else "-"
+        print(f"{title:<18}{len(index.sentences.sentences):>10}{build_ms:>10.2f}{question_ms:>13.3f}  {heading}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
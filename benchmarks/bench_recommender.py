@@ -0,0 +1,66 @@
+# Cost of popularity-weighted recommendations on a synthetic catalog:
+# building the alias table and top-k once, then per-request latency of a
+# weighted no-repeat draw (alias table) against random.choices over the
+# cumulative weights with duplicates rejected, and of the precomputed top-k
+# against sorting per request.
+#
+#   python benchmarks/bench_recommender.py [num_books]
+import os
+import random
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from book_catalog import CatalogBuilder  # noqa: E402
+from recommender import Recommender  # noqa: E402
+
+K = 5
+NUMBER = 2000
+
+
+def build_catalog(n, seed=7):
+    rng = random.Random(seed)
+    builder = CatalogBuilder()
+    for book_id in range(1, n + 1):
+        # Heavy-tailed, like real download counts.
+        builder.add(book_id, f"Science Fiction Story Number {book_id}", "Author", int(rng.paretovariate(1.2) * 10))
+    return builder.build()
+
+
+def sample_choices(catalog, weights):
+    chosen = set()
+    while len(chosen) < K:
+        chosen.update(random.choices(range(len(catalog)), weights=weights, k=K - len(chosen)))
+    return [catalog[i] for i in chosen]
+
+
+def top_sorted(catalog):
+    order = sorted(range(len(catalog)), key=catalog.download_counts.__getitem__, reverse=True)
+    return [catalog[i] for i in order[:K]]
+
+
+def per_request(fn, number=NUMBER):
+    return min(timeit.repeat(fn, number=number, repeat=3)) / number * 1e6
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 70_000
+    catalog = build_catalog(n)
+    start = time.perf_counter()
+    recommender = Recommender(catalog)
+    print(f"{n} books, {K} recommendations per request; "
+          f"alias table + top-k built in {(time.perf_counter() - start) * 1e3:.1f} ms")
+
+    weights = [count + 1 for count in catalog.download_counts]
+    print(f"{'request':<28}{'us/request':>12}")
+    print(f"{'weighted: alias table':<28}{per_request(lambda: recommender.sample(K)):>12.1f}")
+    print(f"{'weighted: random.choices':<28}{per_request(lambda: sample_choices(catalog, weights), NUMBER // 100):>12.1f}")
+    print(f"{'top-k: precomputed':<28}{per_request(lambda: recommender.top(K)):>12.1f}")
+    print(f"{'top-k: sort per request':<28}{per_request(lambda: top_sorted(catalog), NUMBER // 100):>12.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+# Memory and serialization cost of the /ask and /wikipedia-answer response
+# bodies: the ad-hoc dicts and concatenated strings the answerers used to
+# return versus the slotted result types in results.py.
+#
+#   dicts     content dict -> chat text built by string concatenation ->
+#             {"reply": text}, as app.py sent it
+#   slotted   WikiAnswer/ResultList -> results.reply_payload, i.e. the
+#             chat text plus the structured result (without a second copy
+#             of the text), as the routes send it now
+#
+# Both sides are encoded with results.dumps (orjson when installed), so the
+# encode column compares payloads, not encoders. Allocations count the
+# blocks still held per response once its body has been built.
+#
+#   python benchmarks/bench_results.py
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import results  # noqa: E402
+from results import ResultList, VideoResult, WikiAnswer, reply_payload  # noqa: E402
+
+RESPONSES = 1000
+VIDEOS = 5
+IMAGES = 5
+SUMMARY = (
+    "Albert Einstein was a German-born theoretical physicist who is best known for developing the "
+    "theory of relativity. Einstein also made important contributions to quantum mechanics. "
+) * 4
+DESCRIPTION = "A lecture series on quantum computing, covering qubits, gates and algorithms. " * 3
+
+
+def _legacy_summary(i, images):
+    # get_wikipedia_content's dict; answer_question_from_wikipedia's string.
+    content = {"summary": SUMMARY, "image_url": f"https://upload.wikimedia.org/einstein_{i}.jpg"}
+    if images:
+        content["image_urls"] = [f"https://upload.wikimedia.org/einstein_{i}_{j}.jpg" for j in range(IMAGES)]
+    reply = "Based on Wikipedia (en):\n" + content["summary"]
+    if images:
+        reply += "\n\nImages:"
+        for url in content["image_urls"]:
+            reply += "\n" + url
+    else:
+        reply += "\n\nImage: " + content["image_url"]
+    return reply
+
+
+def _legacy_videos(i):
+    videos = [{
+        "title": f"Quantum computing lecture {i}.{j}",
+        "url": f"https://www.youtube.com/watch?v=vid{i}x{j}",
+        "type": "video",
+        "thumbnail_url": f"https://i.ytimg.com/vi/vid{i}x{j}/default.jpg",
+        "description": DESCRIPTION,
+    } for j in range(VIDEOS)]
+    reply = "Here are some YouTube videos found for 'quantum computing':\n"
+    for video in videos:
+        reply += (
+            f"\nTitle: {video['title']}\nType: {video['type']}\nThumbnail: {video['thumbnail_url']}\n"
+            f"Description: {video['description'][:150]}...\nURL: {video['url']}\n"
+        )
+    return reply
+
+
+def _answer(i, images):
+    return WikiAnswer(
+        "Albert Einstein", 'en', SUMMARY, title="Albert Einstein",
+        image_url=f"https://upload.wikimedia.org/einstein_{i}.jpg",
+        images=[f"https://upload.wikimedia.org/einstein_{i}_{j}.jpg" for j in range(IMAGES)] if images else (),
+        url="https://en.wikipedia.org/wiki/Albert_Einstein",
+    )
+
+
+def _videos(i):
+    return ResultList("videos", "Here are some YouTube videos found for 'quantum computing':\n", [VideoResult(
+        f"Quantum computing lecture {i}.{j}",
+        f"https://www.youtube.com/watch?v=vid{i}x{j}",
+        "video",
+        f"https://i.ytimg.com/vi/vid{i}x{j}/default.jpg",
+        DESCRIPTION,
+    ) for j in range(VIDEOS)])
+
+
+# route -> (dicts body for response i, slotted body for response i)
+CASES = {
+    "/ask (summary)": (
+        lambda i: {"reply": _legacy_summary(i, images=False)},
+        lambda i: reply_payload(_answer(i, images=False), "reply"),
+    ),
+    "/ask (videos)": (
+        lambda i: {"reply": _legacy_videos(i)},
+        lambda i: reply_payload(_videos(i), "reply"),
+    ),
+    "/wikipedia-answer": (
+        lambda i: {"answer": _legacy_summary(i, images=True)},
+        lambda i: reply_payload(_answer(i, images=True), "answer"),
+    ),
+}
+
+
+def measure_allocations(body):
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    payloads = [body(i) for i in range(RESPONSES)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, 'filename')
+    return payloads, sum(s.count_diff for s in stats) / RESPONSES
+
+
+def main():
+    print(f"{RESPONSES} responses per route; "
+          f"encoder: {'orjson' if results._HAS_ORJSON else 'stdlib json (orjson not installed)'}")
+    print(f"{'route':<20}{'path':<10}{'allocs/resp':>13}{'body bytes':>12}{'encode us/resp':>16}")
+    for route, bodies in CASES.items():
+        for name, body in zip(("dicts", "slotted"), bodies):
+            payloads, blocks = measure_allocations(body)
+            size = len(results.dumps(payloads[0]))
+            seconds = min(timeit.repeat(lambda: [results.dumps(p) for p in payloads], number=3, repeat=3)) / 3
+            print(f"{route:<20}{name:<10}{blocks:>13.1f}{size:>12}{seconds / RESPONSES * 1e6:>16.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+# Classification throughput of query_router against the per-call regex
+# routing process_user_query used before, on a synthetic query corpus.
+# Both paths are checked to agree on intent and language, and the router
+# is checked on queries ending in words that are also language names.
+#
+#   python benchmarks/bench_router.py [num_queries]
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from query_router import (  # noqa: E402
+    BOOK_KEYWORDS, WIKIPEDIA_QUESTION_PHRASES, YOUTUBE_KEYWORDS, QueryRouter,
+)
+
+LEGACY_LANGUAGES = {'hindi': 'hi', 'spanish': 'es', 'french': 'fr', 'german': 'de', 'italian': 'it', 'portuguese': 'pt'}
+
+# (query, expected language) for words that also name a Wikipedia edition.
+AMBIGUOUS_QUERIES = [
+    ("What is the weather in Mon?", 'en'),
+    ("Who is the best player in Gun?", 'en'),
+    ("What is the word for peace in Ido?", 'en'),
+    ("Tell me about the festival in Fon", 'en'),
+    ("Who lives in Twi?", 'en'),
+    ("What is the capital in Lak?", 'en'),
+    ("Where is the castle in Scots?", 'en'),
+    ("What happened in Norman?", 'en'),
+    ("What is the town hall in Picard?", 'en'),
+    ("Explain what they sing in Patois", 'en'),
+    ("What is the weather in Mon language?", 'mnw'),
+    ("Tell me about tea in Scots Wikipedia", 'sco'),
+    ("What is photosynthesis in espanol?", 'es'),
+    ("Who is Gandhi in हिन्दी?", 'hi'),
+]
+
+TOPICS = ["quantum computing", "the Eiffel Tower", "Marie Curie", "black holes", "machine learning",
+          "the history of Rome", "photosynthesis", "jazz music", "cooking pasta", "the French Revolution"]
+
+
+def legacy_route(query):
+    """The routing steps process_user_query ran inline, rebuilt on every call."""
+    query_lower = query.lower()
+    without_lang = query.strip()
+    language = 'en'
+    language_match = re.search(r'\bin\s+(hindi|spanish|french|german|italian|portuguese)\b', query_lower)
+    if language_match:
+        language = LEGACY_LANGUAGES.get(language_match.group(1), 'en')
+        without_lang = re.sub(r'\bin\s+(hindi|spanish|french|german|italian|portuguese)\b', '', query, 1,
+                              flags=re.IGNORECASE).strip()
+    book_pattern = re.compile(r'\b(?:' + '|'.join(map(re.escape, BOOK_KEYWORDS)) + r')\b', flags=re.IGNORECASE)
+    if book_pattern.search(without_lang.lower()):
+        return 'books', language
+    youtube_pattern = re.compile(r'\b(?:' + '|'.join(map(re.escape, YOUTUBE_KEYWORDS)) + r')\b', flags=re.IGNORECASE)
+    if youtube_pattern.search(query_lower):
+        search_term = query
+        for phrase in YOUTUBE_KEYWORDS:
+            search_term = re.sub(r'^\s*' + re.escape(phrase) + r'\b', '', search_term, flags=re.IGNORECASE).strip()
+            if query.lower().startswith(phrase.lower()):
+                break
+        return 'youtube', language
+    search_query = without_lang
+    for phrase in WIKIPEDIA_QUESTION_PHRASES:
+        search_query = re.sub(r'^\s*' + re.escape(phrase) + r'\b', '', search_query, flags=re.IGNORECASE).strip()
+    return 'wikipedia', language
+
+
+def synthetic_corpus(n, seed=42):
+    rng = random.Random(seed)
+    languages = list(LEGACY_LANGUAGES)
+    queries = []
+    for _ in range(n):
+        topic = rng.choice(TOPICS)
+        kind = rng.random()
+        if kind < 0.15:
+            query = f"{rng.choice(BOOK_KEYWORDS)} about {topic}"
+        elif kind < 0.35:
+            query = f"{rng.choice(YOUTUBE_KEYWORDS)} {topic}"
+        else:
+            query = f"{rng.choice(WIKIPEDIA_QUESTION_PHRASES)} {topic}?"
+        if rng.random() < 0.3:
+            query += f" in {rng.choice(languages)}"
+        queries.append(query.capitalize() if rng.random() < 0.5 else query)
+    return queries
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    queries = synthetic_corpus(n)
+
+    start = time.perf_counter()
+    router = QueryRouter()
+    compile_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    legacy = [legacy_route(q) for q in queries]
+    legacy_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    routes = [router.route(q) for q in queries]
+    router_s = time.perf_counter() - start
+
+    mismatches = sum(1 for old, new in zip(legacy, routes) if old != (new.intent, new.lang))
+    misrouted = [(query, router.route(query).lang, lang) for query, lang in AMBIGUOUS_QUERIES
+                 if router.route(query).lang != lang]
+    print(f"{n} queries, router compiled once in {compile_ms:.2f} ms")
+    print(f"{'path':<10}{'queries/s':>14}{'us/query':>10}")
+    for name, seconds in (("legacy", legacy_s), ("router", router_s)):
+        print(f"{name:<10}{n / seconds:>14,.0f}{seconds / n * 1e6:>10.2f}")
+    print(f"intent/language mismatches: {mismatches}")
+    print(f"ambiguous language names misrouted: {len(misrouted)} of {len(AMBIGUOUS_QUERIES)}")
+    for query, got, expected in misrouted:
+        print(f"  {query!r}: {got}, expected {expected}")
+    return 1 if mismatches or misrouted else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+# Micro-benchmark: segmenter.first_sentences against the re.split answerer
+# it replaces, on a long article.
+#
+#   python benchmarks/bench_segmenter.py [article.txt]
+#
+# Without an argument a ~300 KB article is synthesized from a paragraph
+# with abbreviations, initials and decimals in it.
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from segmenter import first_sentences, iter_sentences  # noqa: E402
+
+OLD_PATTERN = r'(?<!\w\.\w.)(?<![A-Z][a-z]\.)(?<=\.|\?)\s'
+
+PARAGRAPH = (
+    "Albert Einstein (14 March 1879 - 18 April 1955) was a German-born theoretical physicist. "
+    "He is best known for developing the theory of relativity, e.g. the mass-energy equivalence formula. "
+    "Dr. Einstein received the 1921 Nobel Prize in Physics for his services to theoretical physics. "
+    "In 1933 he emigrated to the U.S. and joined the Institute for Advanced Study in Princeton, N.J. "
+    "The speed of light is approx. 2.998 x 10^8 m/s, a value central to his work! "
+    "Was he the most influential physicist of the 20th century? Many historians, incl. A. Pais, think so.\n"
+)
+K = 3
+NUMBER = 20
+
+
+def old_first_sentences(text, k):
+    return re.split(OLD_PATTERN, text)[:k]
+
+
+def main():
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], encoding='utf-8') as f:
+            article = f.read()
+    else:
+        article = PARAGRAPH * 500
+
+    cases = [
+        (f"old re.split, first {K}", lambda: old_first_sentences(article, K)),
+        (f"segmenter, first {K}", lambda: first_sentences(article, K)),
+        ("old re.split, all", lambda: re.split(OLD_PATTERN, article)),
+        ("segmenter, all", lambda: list(iter_sentences(article))),
+    ]
+    print(f"article: {len(article) / 1024:.0f} KB")
+    print(f"{'case':<26}{'ms/call':>10}")
+    for name, fn in cases:
+        seconds = min(timeit.repeat(fn, number=NUMBER, repeat=3)) / NUMBER
+        print(f"{name:<26}{seconds * 1000:>10.3f}")
+
+    print("\nfirst sentences:")
+    print("  old:      ", old_first_sentences(article, K))
+    print("  segmenter:", first_sentences(article, K))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,53 @@
+# Startup-time benchmark: measures a cold `import app` in a fresh interpreter
+# and exits non-zero when the median exceeds the budget.
+#
+#   python benchmarks/bench_startup.py [--budget-ms 1500] [--runs 5]
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Fixed budget for importing the web entry point. Importing must not do any
+# network I/O, so this only ever covers interpreter + library import cost.
+DEFAULT_BUDGET_MS = 1500
+
+_TIMER = (
+    "import time; t = time.perf_counter(); import {module}; "
+    "print((time.perf_counter() - t) * 1000)"
+)
+
+
+def time_import(module, runs):
+    """Imports ``module`` in ``runs`` fresh interpreters and returns the timings in ms."""
+    timings = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", _TIMER.format(module=module)],
+            cwd=REPO_ROOT, check=True, capture_output=True, text=True,
+        ).stdout
+        timings.append(float(output.strip().splitlines()[-1]))
+    return timings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--module", default="app")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    timings = time_import(args.module, args.runs)
+    median = statistics.median(timings)
+    print(f"import {args.module}: median {median:.1f} ms over {args.runs} runs "
+          f"(min {min(timings):.1f} ms, budget {args.budget_ms:.0f} ms)")
+    if median > args.budget_ms:
+        print("FAIL: import time is over budget")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
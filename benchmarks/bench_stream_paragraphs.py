@@ -0,0 +1,64 @@
+# Bytes downloaded and time to the first N lead paragraphs of long articles
+# (live network):
+#
+#   full     download the whole rendered page, then parse it
+#   stream   iter_paragraphs over the streamed body, closing early
+#
+#   python benchmarks/bench_stream_paragraphs.py [N]
+import codecs
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from html_extract import extract_paragraphs, iter_paragraphs  # noqa: E402
+from http_client import http_get  # noqa: E402
+from wiki_lookup import STREAM_CHUNK_SIZE  # noqa: E402
+
+TITLES = ["United States", "World War II", "Albert Einstein", "History of the Internet", "Black hole"]
+RENDER_URL = "https://en.wikipedia.org/w/index.php"
+
+
+def _full(title, n):
+    response = http_get(RENDER_URL, params={"title": title, "action": "render"})
+    return len(response.content), extract_paragraphs(response.text)[:n]
+
+
+def _stream(title, n):
+    response = http_get(RENDER_URL, params={"title": title, "action": "render"}, stream=True)
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    received = 0
+
+    def chunks():
+        nonlocal received
+        for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+            received += len(chunk)
+            yield decoder.decode(chunk)
+
+    paragraphs = []
+    try:
+        for paragraph in iter_paragraphs(chunks(), lead_only=True):
+            paragraphs.append(paragraph)
+            if len(paragraphs) >= n:
+                break
+    finally:
+        response.close()
+    return received, paragraphs
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    print(f"first {n} paragraphs of {len(TITLES)} articles")
+    print(f"{'path':<8}{'KB/article':>12}{'ms/article':>12}")
+    for name, fetch in (("full", _full), ("stream", _stream)):
+        start = time.perf_counter()
+        results = [fetch(title, n) for title in TITLES]
+        elapsed_ms = (time.perf_counter() - start) / len(TITLES) * 1000
+        kb = sum(r[0] for r in results) / len(results) / 1024
+        print(f"{name:<8}{kb:>12.1f}{elapsed_ms:>12.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
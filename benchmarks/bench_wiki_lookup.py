@@ -0,0 +1,72 @@
+# Upstream calls and latency per answered Wikipedia question (live network).
+#
+# Before the single-round-trip lookup every question cost three requests:
+# the wikipedia-api info and extracts queries plus a pageimages call (and
+# the older search+parse answerer repeated its two calls on top). This
+# reports the current cost with caching disabled and fails unless every
+# English question costs exactly one upstream fetch. Other editions may
+# take a second one: the English page's langlink, then the localized page.
+# Questions go through process_user_query, as chat prompts do, so routing
+# and the passage-ranking decision are part of what is measured. Only
+# requests to Wikipedia hosts are counted, per question. The offline
+# version of this check is tests/test_wiki_lookup.py.
+#
+#   python benchmarks/bench_wiki_lookup.py
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ['WIKI_CACHE_PATH'] = ''
+
+import http_client  # noqa: E402
+from app2 import process_user_query  # noqa: E402
+from query_router import router  # noqa: E402
+
+BASELINE_CALLS_PER_QUESTION = 3
+
+QUESTIONS = [
+    "Who is Albert Einstein?",
+    "What is machine learning?",
+    "What is the history of the Internet?",
+    "Explain photosynthesis",
+    "Black holes",
+    "Tell me about USA",
+    "Who is Marie Curie in Spanish?",
+    "Tour Eiffel in French",
+    "Nepal in Hindi",
+]
+
+
+def wikipedia_calls():
+    """Requests made to Wikipedia hosts since the last reset (other upstreams are ignored)."""
+    return sum(s['requests'] for host, s in http_client.connection_stats().items() if host.endswith('.wikipedia.org'))
+
+
+def main():
+    latencies = []
+    calls = []
+    failures = []
+    for query in QUESTIONS:
+        lang = router.route(query).lang
+        http_client.reset_connection_stats()
+        start = time.perf_counter()
+        process_user_query(query)
+        latencies.append((time.perf_counter() - start) * 1000)
+        calls.append(wikipedia_calls())
+        budget = 1 if lang == 'en' else 2
+        if calls[-1] > budget:
+            failures.append(f"{query} ({lang}): {calls[-1]} calls, budget {budget}")
+
+    print(f"questions: {len(QUESTIONS)}")
+    print(f"upstream calls per question: {sum(calls) / len(QUESTIONS):.2f} "
+          f"(baseline {BASELINE_CALLS_PER_QUESTION})")
+    print(f"latency ms: median {statistics.median(latencies):.0f}, max {max(latencies):.0f}")
+    for failure in failures:
+        print(f"FAIL {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,290 @@
+# Compact, read-only catalog of Project Gutenberg books.
+#
+# Books are stored column-wise in parallel arrays: numeric columns in
+# array.array, text columns in tuples of interned strings (an author or
+# language shared by thousands of books is stored once). Row i of every
+# column describes the same book, so any book is an O(1) index away and
+# sampling k books costs O(k). Multi-valued columns (languages, subjects,
+# bookshelves) are TagColumns: each distinct tag is stored once and books
+# hold offsets into an array of tag ids. A catalog is built once per
+# process and never mutated; a reload builds a new one and swaps it in, so
+# request threads can read it without locks.
+#
+# save_catalog writes the columns to a snapshot file and load_catalog maps
+# it back read-only with mmap, with strings decoded only when a book is
+# read. Every process that loads the same snapshot shares one copy of its
+# pages through the OS page cache.
+import mmap
+import os
+import random
+import re
+import struct
+import sys
+import tempfile
+from array import array
+
+from results import BookRecommendation
+
+GUTENBERG_BASE_URL = "https://www.gutenberg.org"
+
+_EBOOK_ID = re.compile(r'/ebooks/(\d+)')
+
+# Snapshot layout: magic, section count, then (offset, length) per section,
+# all native-endian uint64; every section starts on an 8-byte boundary.
+_SNAPSHOT_MAGIC = b'PGCAT\x00v1'
+_WORD = struct.Struct('=Q')
+
+
+def ebook_url(book_id):
+    return f"{GUTENBERG_BASE_URL}/ebooks/{book_id}"
+
+
+def ebook_id(url):
+    """Extracts the numeric ebook id from a Gutenberg book URL or path, or None."""
+    match = _EBOOK_ID.search(url or "")
+    return int(match.group(1)) if match else None
+
+
+class StringColumn:
+    """
+    Read-only string column over UTF-8 bytes, as mapped from a snapshot.
+
+    String i is ``blob[offsets[i]:offsets[i + 1]]``, decoded on access.
+    """
+
+    __slots__ = ('offsets', 'blob')
+
+    def __init__(self, offsets, blob):
+        self.offsets = offsets
+        self.blob = blob
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        if not -len(self) <= i < len(self):
+            raise IndexError('string column index out of range')
+        i %= len(self)
+        return str(self.blob[self.offsets[i]:self.offsets[i + 1]], 'utf-8')
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    @property
+    def nbytes(self):
+        return self.offsets.nbytes + self.blob.nbytes
+
+
+def _strings_nbytes(*columns):
+    """Memory held by string columns, counting each interned string once."""
+    if all(isinstance(column, StringColumn) for column in columns):
+        return sum(column.nbytes for column in columns)
+    strings = {id(s): s for column in columns for s in column}
+    return sum(sys.getsizeof(column) for column in columns) + sum(sys.getsizeof(s) for s in strings.values())
+
+
+class TagColumn:
+    """
+    Multi-valued string column in CSR form.
+
+    Tags of book i are ``terms[t] for t in ids[ptr[i]:ptr[i + 1]]``.
+    """
+
+    __slots__ = ('terms', 'ptr', 'ids')
+
+    def __init__(self, terms, ptr, ids):
+        self.terms = terms
+        self.ptr = ptr
+        self.ids = ids
+
+    def __len__(self):
+        return len(self.ptr) - 1
+
+    def __getitem__(self, i):
+        return tuple(self.terms[t] for t in self.ids[self.ptr[i]:self.ptr[i + 1]])
+
+    @property
+    def nbytes(self):
+        return (
+            self.ptr.itemsize * len(self.ptr) + self.ids.itemsize * len(self.ids)
+            + _strings_nbytes(self.terms)
+        )
+
+
+class _TagColumnBuilder:
+    def __init__(self):
+        self._vocabulary = {}
+        self._ptr = array('L', [0])
+        self._ids = array('L')
+
+    def append(self, tags):
+        vocabulary = self._vocabulary
+        for tag in tags:
+            self._ids.append(vocabulary.setdefault(sys.intern(tag), len(vocabulary)))
+        self._ptr.append(len(self._ids))
+
+    def build(self):
+        return TagColumn(tuple(self._vocabulary), self._ptr, self._ids)
+
+
+class BookCatalog:
+    """
+    Parallel-array store of books.
+
+    Build one with CatalogBuilder. Indexing returns a BookRecommendation;
+    ``languages[i]``, ``subjects[i]`` and ``bookshelves[i]`` give book i's
+    tags.
+    """
+
+    __slots__ = ('ids', 'titles', 'authors', 'download_counts', 'languages', 'subjects', 'bookshelves')
+
+    def __init__(self, ids, titles, authors, download_counts, languages, subjects, bookshelves):
+        self.ids = ids
+        self.titles = titles
+        self.authors = authors
+        self.download_counts = download_counts
+        self.languages = languages
+        self.subjects = subjects
+        self.bookshelves = bookshelves
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, i):
+        return BookRecommendation(
+            self.titles[i], ebook_url(self.ids[i]), author=self.authors[i] or None,
+            download_count=self.download_counts[i],
+        )
+
+    def sample(self, k, rng=random):
+        """Returns up to ``k`` distinct books chosen uniformly at random, in O(k)."""
+        return [self[i] for i in rng.sample(range(len(self)), min(k, len(self)))]
+
+    @property
+    def nbytes(self):
+        """Approximate memory held by the columns, counting each interned string once."""
+        return (
+            self.ids.itemsize * len(self.ids)
+            + self.download_counts.itemsize * len(self.download_counts)
+            + _strings_nbytes(self.titles, self.authors)
+            + self.languages.nbytes + self.subjects.nbytes + self.bookshelves.nbytes
+        )
+
+
+class CatalogBuilder:
+    """Accumulates books, de-duplicated by ebook id, then freezes them into a BookCatalog."""
+
+    def __init__(self):
+        self._ids = array('L')
+        self._titles = []
+        self._authors = []
+        self._download_counts = array('L')
+        self._languages = _TagColumnBuilder()
+        self._subjects = _TagColumnBuilder()
+        self._bookshelves = _TagColumnBuilder()
+        self._seen = set()
+
+    def add(self, book_id, title, author='', download_count=0, languages=(), subjects=(), bookshelves=()):
+        """Adds a book; returns False if the id is already in the catalog."""
+        if book_id in self._seen:
+            return False
+        self._seen.add(book_id)
+        self._ids.append(book_id)
+        self._titles.append(sys.intern(title))
+        self._authors.append(sys.intern(author or ''))
+        self._download_counts.append(download_count or 0)
+        self._languages.append(languages)
+        self._subjects.append(subjects)
+        self._bookshelves.append(bookshelves)
+        return True
+
+    def add_link(self, title, url):
+        """Adds a scraped title/url pair; links that are not ebooks are skipped."""
+        book_id = ebook_id(url)
+        return book_id is not None and self.add(book_id, title)
+
+    def __len__(self):
+        return len(self._ids)
+
+    def build(self):
+        return BookCatalog(
+            self._ids, tuple(self._titles), tuple(self._authors), self._download_counts,
+            self._languages.build(), self._subjects.build(), self._bookshelves.build(),
+        )
+
+
+def _string_sections(strings):
+    offsets, blob = array('Q', [0]), bytearray()
+    for string in strings:
+        blob += string.encode('utf-8')
+        offsets.append(len(blob))
+    return [offsets.tobytes(), bytes(blob)]
+
+
+def _tag_sections(column):
+    return _string_sections(column.terms) + [array('Q', column.ptr).tobytes(), array('Q', column.ids).tobytes()]
+
+
+def save_catalog(catalog, path):
+    """
+    Writes ``catalog`` to a snapshot file for load_catalog.
+
+    The file is written next to ``path`` and renamed into place, so a
+    process loading it never sees a partial snapshot.
+    """
+    sections = (
+        [array('Q', catalog.ids).tobytes(), array('Q', catalog.download_counts).tobytes()]
+        + _string_sections(catalog.titles) + _string_sections(catalog.authors)
+        + _tag_sections(catalog.languages) + _tag_sections(catalog.subjects) + _tag_sections(catalog.bookshelves)
+    )
+    offset = len(_SNAPSHOT_MAGIC) + _WORD.size * (1 + 2 * len(sections))
+    table = []
+    for section in sections:
+        table += [offset, len(section)]
+        offset += -(-len(section) // 8) * 8
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), prefix='.catalog-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_SNAPSHOT_MAGIC)
+            f.write(array('Q', [len(sections)] + table).tobytes())
+            for section in sections:
+                f.write(section)
+                f.write(b'\0' * (-len(section) % 8))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def load_catalog(path):
+    """
+    Maps a snapshot written by save_catalog into a read-only BookCatalog.
+
+    Raises:
+      OSError: If the file cannot be read.
+      ValueError: If it is not a catalog snapshot.
+    """
+    with open(path, 'rb') as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mapped)
+    header = len(_SNAPSHOT_MAGIC)
+    if bytes(view[:header]) != _SNAPSHOT_MAGIC or len(view) < header + _WORD.size:
+        raise ValueError(f"{path} is not a catalog snapshot")
+    count = _WORD.unpack_from(view, header)[0]
+    table = view[header + _WORD.size:header + _WORD.size * (1 + 2 * count)].cast('Q')
+    if len(table) != 2 * count or any(table[2 * i] + table[2 * i + 1] > len(view) for i in range(count)):
+        raise ValueError(f"{path} is truncated")
+    sections = iter([view[table[2 * i]:table[2 * i] + table[2 * i + 1]] for i in range(count)])
+
+    def words():
+        return next(sections).cast('Q')
+
+    def strings():
+        return StringColumn(words(), next(sections))
+
+    def tags():
+        return TagColumn(strings(), words(), words())
+
+    ids, download_counts = words(), words()
+    titles, authors = strings(), strings()
+    return BookCatalog(ids, titles, authors, download_counts, tags(), tags(), tags())
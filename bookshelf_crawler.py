@@ -0,0 +1,191 @@
+# Crawler for Project Gutenberg bookshelves.
+#
+# A bookshelf lists PAGE_SIZE books per HTML page, paged with
+# ?start_index=. Pages are fetched in waves on a bounded thread pool, for
+# every shelf at once, and each request goes through http_get and so through
+# the shared per-host rate limiter. Every page's ETag/Last-Modified and the
+# books it listed are stored in a TieredCache (the same SQLite file as the
+# Wikipedia cache), so the next crawl sends conditional requests and a
+# refresh of unchanged shelves costs one 304 per page.
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from book_catalog import GUTENBERG_BASE_URL, CatalogBuilder
+from content_cache import DISK_PATH, LRUCache, SQLiteCache, TieredCache
+from html_extract import extract_booklinks
+from http_client import http_get
+
+# Books listed per bookshelf page by gutenberg.org.
+PAGE_SIZE = 25
+# Hard stop for a single shelf, in case a page never comes back empty.
+MAX_PAGES = 400
+# Pages in flight at once, across all shelves. The rate limiter still caps
+# requests per second; this bounds threads and open connections.
+CONCURRENCY = 4
+# How long stored validators and page contents are kept.
+PAGE_TTL = 30 * 24 * 60 * 60
+PAGE_CACHE_MAX_BYTES = 8 * 1024 * 1024
+
+
+def _build_catalog(shelves):
+    builder = CatalogBuilder()
+    for shelf_books in shelves:
+        for title, url in shelf_books:
+            builder.add_link(title, url)
+    return builder.build() if len(builder) else None
+
+
+def bookshelf_page_url(shelf_id, page):
+    return f"{GUTENBERG_BASE_URL}/ebooks/bookshelf/{shelf_id}?start_index={page * PAGE_SIZE + 1}"
+
+
+def page_key(shelf_id, page):
+    return f"shelf:{shelf_id}:{page}"
+
+
+def shelf_key(shelf_id):
+    return f"shelf:{shelf_id}:pages"
+
+
+class BookshelfCrawler:
+    """
+    Crawls every page of one or more bookshelves with conditional GETs.
+
+    Pages are requested CONCURRENCY at a time. A shelf ends at its first
+    page without books (or one that fails). The number of pages found is
+    remembered, so a refresh requests all known pages in a single wave.
+    """
+
+    def __init__(self, store=None, max_workers=CONCURRENCY, clock=time.time):
+        if store is None:
+            store = TieredCache(
+                memory=LRUCache(max_bytes=PAGE_CACHE_MAX_BYTES, ttl=PAGE_TTL),
+                disk=SQLiteCache() if DISK_PATH else None,
+            )
+        self.store = store
+        self.max_workers = max_workers
+        self._clock = clock
+        self._stats = {'fetched': 0, 'not_modified': 0, 'failed': 0}
+        self._stats_lock = threading.Lock()
+
+    def _count(self, key):
+        with self._stats_lock:
+            self._stats[key] += 1
+
+    def fetch_page(self, shelf_id, page):
+        """
+        Fetches one bookshelf page, revalidating the stored copy if there is one.
+
+        Returns:
+          A list of [title, url] pairs (empty past the last page), or None if
+          the page could not be fetched and nothing is stored for it.
+        """
+        key = page_key(shelf_id, page)
+        stored = self.store.get(key)
+        headers = {}
+        if stored is not None:
+            if stored.get('etag'):
+                headers['If-None-Match'] = stored['etag']
+            if stored.get('last_modified'):
+                headers['If-Modified-Since'] = stored['last_modified']
+
+        try:
+            response = http_get(bookshelf_page_url(shelf_id, page), headers=headers)
+        except requests.exceptions.RequestException as e:
+            print(f"An error occurred while fetching bookshelf {shelf_id} page {page}: {e}")
+            self._count('failed')
+            return stored['books'] if stored is not None else None
+
+        if response.status_code == 304 and stored is not None:
+            self._count('not_modified')
+            # Re-store so the entry's TTL restarts from this validation.
+            self.store.set(key, dict(stored, checked_at=self._clock()), ttl=PAGE_TTL, disk_ttl=PAGE_TTL)
+            return stored['books']
+        if response.status_code != 200:
+            self._count('failed')
+            return stored['books'] if stored is not None else None
+
+        self._count('fetched')
+        books = [[book['title'], book['url']] for book in extract_booklinks(response.text)]
+        self.store.set(key, {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'checked_at': self._clock(),
+            'books': books,
+        }, ttl=PAGE_TTL, disk_ttl=PAGE_TTL)
+        return books
+
+    def crawl(self, shelf_ids, max_pages=MAX_PAGES):
+        """
+        Crawls all pages of ``shelf_ids``, or the first ``max_pages`` of each.
+
+        Returns:
+          {shelf_id: [[title, url], ...]} in page order.
+        """
+        max_pages = min(max_pages, MAX_PAGES)
+        books = {shelf_id: [] for shelf_id in shelf_ids}
+        # shelf_id -> index of the next page to request
+        next_page = {shelf_id: 0 for shelf_id in shelf_ids}
+        # The first wave covers every page seen last time, plus the empty
+        # page after them that confirms the shelf did not grow.
+        wave_size = {shelf_id: max(self.max_workers, (self.store.get(shelf_key(shelf_id)) or 0) + 1)
+                     for shelf_id in shelf_ids}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='bookshelf') as pool:
+            while next_page:
+                wave = {
+                    shelf_id: [pool.submit(self.fetch_page, shelf_id, page)
+                               for page in range(start, min(start + wave_size[shelf_id], max_pages))]
+                    for shelf_id, start in next_page.items()
+                }
+                for shelf_id, futures in wave.items():
+                    done = failed = False
+                    for future in futures:
+                        page_books = future.result()
+                        if done:
+                            # Pages requested past the end of the shelf.
+                            continue
+                        if not page_books:
+                            done = True
+                            failed = page_books is None
+                            continue
+                        books[shelf_id].extend(page_books)
+                        next_page[shelf_id] += 1
+                    if not done and next_page[shelf_id] < max_pages:
+                        wave_size[shelf_id] = self.max_workers
+                        continue
+                    pages = next_page.pop(shelf_id)
+                    # Only a crawl that reached the end knows how long the shelf is.
+                    if (done and not failed) or pages >= MAX_PAGES:
+                        self.store.set(shelf_key(shelf_id), pages, ttl=PAGE_TTL, disk_ttl=PAGE_TTL)
+        return books
+
+    def crawl_catalog(self, shelf_ids, max_pages=MAX_PAGES):
+        """Crawls ``shelf_ids`` into one BookCatalog, or returns None if no books were found."""
+        return _build_catalog(self.crawl(shelf_ids, max_pages).values())
+
+    def cached_catalog(self, shelf_ids):
+        """
+        Builds a BookCatalog from the pages stored by the last complete crawl,
+        without any request, or returns None if nothing is stored.
+        """
+        shelves = []
+        for shelf_id in shelf_ids:
+            shelf_books = []
+            for page in range(self.store.get(shelf_key(shelf_id)) or 0):
+                stored = self.store.get(page_key(shelf_id, page))
+                if stored is None:
+                    break
+                shelf_books.extend(stored['books'])
+            shelves.append(shelf_books)
+        return _build_catalog(shelves)
+
+    def stats(self):
+        with self._stats_lock:
+            return dict(self._stats)
+
+
+bookshelf_crawler = BookshelfCrawler()
@@ -0,0 +1,370 @@
+# Two-tier cache for fetched Wikipedia content.
+#
+# Tier 1 is an in-process LRU with a TTL and a byte budget. Tier 2 is a
+# SQLite file that survives restarts and is shared by every worker process
+# on the box. Entries are keyed by (lang, canonical title); aliases map the
+# raw queries users type (redirects, case variants) onto canonical titles.
+# Search structures derived from cached articles (BM25 and TF-IDF indexes)
+# live in a separate memory-only cache keyed the same way.
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+_SEPARATORS = re.compile(r'[\s_]+')
+
+MEMORY_TTL = 60 * 60
+MEMORY_MAX_BYTES = 32 * 1024 * 1024
+# Content is fresh for FRESH_TTL, then served stale (while a background
+# refresh runs) for STALE_GRACE more. The disk tier keeps entries for a
+# week so they can still be served when Wikipedia is failing.
+FRESH_TTL = 60 * 60
+STALE_GRACE = 24 * 60 * 60
+DISK_TTL = 7 * 24 * 60 * 60
+# Bump when the shape of cached page values changes so old entries are ignored.
+CACHE_VERSION = 2
+# Budget for per-article search indexes; they are rebuilt cheaply from content.
+INDEX_MAX_BYTES = 64 * 1024 * 1024
+# Expired disk rows are deleted every this many writes.
+PURGE_EVERY = 1000
+# Set WIKI_CACHE_PATH to an empty string to disable the disk tier.
+DISK_PATH = os.environ.get('WIKI_CACHE_PATH', os.path.join('/tmp', 'sameergpt_wiki_cache.sqlite3'))
+
+
+def canonical_title(title):
+    """
+    Normalizes a page title the way MediaWiki does: underscores become
+    spaces, whitespace is collapsed and the first letter is upper-cased.
+    """
+    title = _SEPARATORS.sub(' ', title).strip()
+    return title[:1].upper() + title[1:]
+
+
+def content_key(lang, title):
+    return f"page:v{CACHE_VERSION}:{lang.lower()}:{canonical_title(title)}"
+
+
+def index_key(lang, title):
+    return f"index:v{CACHE_VERSION}:{lang.lower()}:{canonical_title(title)}"
+
+
+def langlink_key(lang, query):
+    return f"langlink:{lang.lower()}:{normalize_query(query)}"
+
+
+def normalize_query(query):
+    """Queries are matched case-insensitively; titles keep their case."""
+    return _SEPARATORS.sub(' ', query).strip().lower()
+
+
+def alias_key(lang, query):
+    return f"alias:{lang.lower()}:{normalize_query(query)}"
+
+
+class LRUCache:
+    """
+    Thread-safe in-memory LRU with per-entry TTL and a total byte budget.
+
+    Values are stored alongside their encoded size so the budget can be
+    enforced without re-measuring on eviction.
+    """
+
+    def __init__(self, max_bytes=MEMORY_MAX_BYTES, ttl=MEMORY_TTL, clock=time.time):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._clock = clock
+        self._entries = OrderedDict()  # key -> (expires_at, size, value)
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= self._clock():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry[2]
+
+    def set(self, key, value, size, ttl=None):
+        if size > self.max_bytes:
+            return
+        expires_at = self._clock() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (expires_at, size, value)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def delete(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def _remove(self, key):
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def size_bytes(self):
+        return self._bytes
+
+
+class SQLiteCache:
+    """
+    Key/value store in a SQLite file, safe to share between processes.
+
+    Each thread gets its own connection; WAL mode lets readers in other
+    workers proceed while one writes. The file is opened, and the schema
+    created, on first use. Expired rows are otherwise only removed when
+    their key is read again, so they are purged every ``purge_every``
+    writes, through an index on the expiry time.
+    """
+
+    def __init__(self, path=DISK_PATH, ttl=DISK_TTL, clock=time.time, purge_every=PURGE_EVERY):
+        self.path = path
+        self.ttl = ttl
+        self.purge_every = purge_every
+        self._clock = clock
+        self._local = threading.local()
+        self._schema_ready = False
+        self._writes = 0
+        self._writes_lock = threading.Lock()
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5)
+            conn.execute('PRAGMA synchronous=NORMAL')
+            if not self._schema_ready:
+                # WAL mode is stored in the file, so this runs once per
+                # process rather than for every thread's connection.
+                conn.execute('PRAGMA journal_mode=WAL')
+                conn.execute(
+                    'CREATE TABLE IF NOT EXISTS cache '
+                    '(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)'
+                )
+                conn.execute('CREATE INDEX IF NOT EXISTS cache_expires_at ON cache (expires_at)')
+                self._schema_ready = True
+            self._local.conn = conn
+        return conn
+
+    def get(self, key):
+        conn = self._connection()
+        row = conn.execute('SELECT value, expires_at FROM cache WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            return None
+        if row[1] <= self._clock():
+            with conn:
+                conn.execute('DELETE FROM cache WHERE key = ?', (key,))
+            return None
+        return row[0]
+
+    def set(self, key, encoded, ttl=None):
+        expires_at = self._clock() + (self.ttl if ttl is None else ttl)
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)',
+                (key, encoded, expires_at),
+            )
+        with self._writes_lock:
+            self._writes += 1
+            purge = self._writes % self.purge_every == 0
+        if purge:
+            self.purge_expired()
+
+    def delete(self, key):
+        conn = self._connection()
+        with conn:
+            conn.execute('DELETE FROM cache WHERE key = ?', (key,))
+
+    def purge_expired(self):
+        conn = self._connection()
+        with conn:
+            conn.execute('DELETE FROM cache WHERE expires_at <= ?', (self._clock(),))
+
+
+class TieredCache:
+    """
+    Memory LRU in front of an optional SQLite tier for JSON-serializable values.
+
+    Disk hits are promoted into memory. Disk errors (locked file, read-only
+    filesystem) degrade to memory-only caching instead of failing requests.
+    """
+
+    def __init__(self, memory=None, disk=None):
+        self.memory = memory if memory is not None else LRUCache()
+        self.disk = disk
+        self.hits = {'memory': 0, 'disk': 0, 'miss': 0}
+
+    def get(self, key):
+        value = self.memory.get(key)
+        if value is not None:
+            self.hits['memory'] += 1
+            return value
+        if self.disk is not None:
+            try:
+                encoded = self.disk.get(key)
+            except sqlite3.Error:
+                encoded = None
+            if encoded is not None:
+                value = json.loads(encoded)
+                self.memory.set(key, value, len(encoded))
+                self.hits['disk'] += 1
+                return value
+        self.hits['miss'] += 1
+        return None
+
+    def set(self, key, value, ttl=None, disk_ttl=None):
+        encoded = json.dumps(value, ensure_ascii=False)
+        self.memory.set(key, value, len(encoded), ttl=ttl)
+        if self.disk is not None:
+            try:
+                self.disk.set(key, encoded, ttl=disk_ttl)
+            except sqlite3.Error:
+                pass
+
+    def delete(self, key):
+        self.memory.delete(key)
+        if self.disk is not None:
+            try:
+                self.disk.delete(key)
+            except sqlite3.Error:
+                pass
+
+    def stats(self):
+        return dict(self.hits, memory_entries=len(self.memory), memory_bytes=self.memory.size_bytes)
+
+
+class CachedContent:
+    """
+    A cached value plus the time it was fetched, for freshness checks.
+
+    Ages are measured with ``clock`` (the owning cache's clock) unless a
+    ``now`` is passed.
+    """
+
+    __slots__ = ('value', 'fetched_at', '_clock')
+
+    def __init__(self, value, fetched_at, clock=time.time):
+        self.value = value
+        self.fetched_at = fetched_at
+        self._clock = clock
+
+    def age(self, now=None):
+        return (self._clock() if now is None else now) - self.fetched_at
+
+    def is_fresh(self, now=None):
+        return self.age(now) < FRESH_TTL
+
+    def is_servable_stale(self, now=None):
+        """True while the entry is past FRESH_TTL but inside the grace window."""
+        return self.age(now) < FRESH_TTL + STALE_GRACE
+
+
+class WikipediaContentCache:
+    """
+    Wikipedia content keyed by (lang, canonical title), with query aliases.
+
+    ``lookup(lang, query)`` follows the alias recorded for ``query`` (so a
+    redirect or a case variant lands on the same entry) and falls back to
+    treating the query itself as a title. Entries are returned whatever
+    their age; callers decide whether to serve, refresh or fall back.
+    """
+
+    def __init__(self, store=None, clock=time.time):
+        self.store = store if store is not None else TieredCache(disk=SQLiteCache() if DISK_PATH else None)
+        self._clock = clock
+
+    def lookup(self, lang, query):
+        title = self.store.get(alias_key(lang, query)) or query
+        envelope = self.store.get(content_key(lang, title))
+        if not isinstance(envelope, dict) or 'fetched_at' not in envelope:
+            return None
+        return CachedContent(envelope['value'], envelope['fetched_at'], self._clock)
+
+    def get(self, lang, query):
+        """Returns the cached value only while it is fresh."""
+        entry = self.lookup(lang, query)
+        if entry is not None and entry.is_fresh():
+            return entry.value
+        return None
+
+    def set(self, lang, query, title, value, fetched_at=None):
+        """
+        Stores ``value`` for ``query`` and ``title``. Pass ``fetched_at`` to
+        keep an entry's age when only adding to it (e.g. loading sections).
+        """
+        envelope = {'fetched_at': self._clock() if fetched_at is None else fetched_at, 'value': value}
+        # Memory keeps entries and aliases for the whole stale window; disk retains them longer.
+        memory_ttl = FRESH_TTL + STALE_GRACE
+        self.store.set(content_key(lang, title), envelope, ttl=memory_ttl)
+        self.store.set(alias_key(lang, query), canonical_title(title), ttl=memory_ttl)
+        if alias_key(lang, title) != alias_key(lang, query):
+            self.store.set(alias_key(lang, title), canonical_title(title), ttl=memory_ttl)
+
+    def get_langlink(self, lang, query):
+        """
+        Returns {"title": localized title or None} if the ``lang`` title for
+        ``query`` has been resolved before, else None.
+        """
+        return self.store.get(langlink_key(lang, query))
+
+    def set_langlink(self, lang, query, title):
+        # Interlanguage links rarely change; keep them as long as page content.
+        self.store.set(langlink_key(lang, query), {'title': title}, ttl=FRESH_TTL + STALE_GRACE)
+
+    def stats(self):
+        return self.store.stats()
+
+
+wikipedia_cache = WikipediaContentCache()
+
+
+class ArticleIndexCache:
+    """
+    Per-article search indexes, kept next to the content they were built from.
+
+    Entries are stored with the fingerprint of the article text; when the
+    content is refreshed the fingerprint changes and the index is rebuilt.
+    Indexes hold NumPy arrays, so they stay in memory and are never written
+    to the disk tier.
+    """
+
+    def __init__(self, max_bytes=INDEX_MAX_BYTES, ttl=FRESH_TTL + STALE_GRACE, clock=time.time):
+        self.memory = LRUCache(max_bytes=max_bytes, ttl=ttl, clock=clock)
+        self.hits = {'hit': 0, 'miss': 0}
+
+    def get_or_build(self, lang, title, fingerprint, build):
+        """
+        Returns the cached index for (lang, title) if it matches ``fingerprint``,
+        otherwise calls ``build()`` and caches the result.
+
+        ``build`` must return an object with an ``nbytes`` size estimate.
+        """
+        key = index_key(lang, title)
+        entry = self.memory.get(key)
+        if entry is not None and entry[0] == fingerprint:
+            self.hits['hit'] += 1
+            return entry[1]
+        self.hits['miss'] += 1
+        index = build()
+        self.memory.set(key, (fingerprint, index), index.nbytes)
+        return index
+
+    def stats(self):
+        return dict(self.hits, entries=len(self.memory), bytes=self.memory.size_bytes)
+
+
+article_indexes = ArticleIndexCache()
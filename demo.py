@@ -0,0 +1,95 @@
+# Notebook-style walkthrough of the assistant, kept out of app2 so that
+# importing the core module never touches the network.
+#
+#   python demo.py            # run the comprehensive query sweep
+#   python demo.py --gradio   # launch the Gradio chat UI
+import sys
+
+from app2 import process_user_query
+from lazy_imports import lazy_import
+
+gr = lazy_import('gradio')
+
+DEMO_QUERIES = {
+    "Wikipedia queries (English)": [
+        "What is Albert Einstein?",
+        "History of the Internet",
+        "Photosynthesis?",
+        "Black holes",
+        "Machine learning",
+    ],
+    "Wikipedia queries (with Language)": [
+        "Explain Quantum physics in french",
+        "Who was Marie Curie in spanish?",
+        "Capital of France? in german",
+        "What is machine learning? in italian",
+        "Eiffel Tower in French",
+        "Quantum Mechanics in Spanish",
+        "Nepal in Hindi",
+    ],
+    "Wikipedia queries (Non-existent Pages)": [
+        "A very specific and obscure topic that likely doesn't have a Wikipedia page. in portuguese",
+        "This page does not exist 12345",
+    ],
+    "Book Recommendation queries": [
+        "Recommend some science fiction books",
+        "Find science fiction books",
+        "sci-fi recommendations",
+        "recommend sci-fi",
+        "Project Gutenberg sci-fi",
+        "I want science fiction book recommendations",
+    ],
+    "YouTube Video queries": [
+        "Find youtube videos on deep learning tutorial",
+        "recommend youtube videos about python programming",
+        "watch video on climate change",
+        "search youtube for data science projects",
+        "youtube videos",
+        "video about machine learning",
+        "youtube clips of funny animals",
+        "youtube tutorial for beginners",
+    ],
+    "Unhandled queries": [
+        "Tell me a joke",
+        "How tall are you?",
+        "What is the weather today?",
+        "Give me cooking recipes",
+        "What time is it?",
+    ],
+}
+
+
+def run_comprehensive_tests():
+    """Runs every demo query through process_user_query and prints the responses."""
+    print("\n--- Conducting Comprehensive Testing of Integrated process_user_query ---")
+    for section, queries in DEMO_QUERIES.items():
+        print(f"\nTesting {section}:")
+        for query in queries:
+            print(process_user_query(query).format())
+            print("-" * 30)
+
+
+def chatbot_interface(user_input):
+    """
+    Processes user input and returns a response using the integrated functionalities.
+    """
+    return process_user_query(user_input).format()
+
+
+def launch_gradio():
+    """Creates and launches the Gradio chat interface."""
+    iface = gr.Interface(
+        fn=chatbot_interface,
+        inputs=gr.Textbox(lines=2, placeholder="Enter your query here..."),
+        outputs="text",
+        title="LLM Powered Assistant",
+        description="Ask me questions from Wikipedia, get science fiction book recommendations from Project Gutenberg, or find YouTube videos."
+    )
+    iface.launch()
+
+
+if __name__ == '__main__':
+    if '--gradio' in sys.argv[1:]:
+        launch_gradio()
+    else:
+        run_comprehensive_tests()
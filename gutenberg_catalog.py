@@ -0,0 +1,185 @@
+# Streaming reader for Project Gutenberg's offline catalog dumps.
+#
+#   pg_catalog.csv[.gz|.bz2]   https://www.gutenberg.org/cache/epub/feeds/
+#                              one row per book; has no download counts
+#   rdf-files.tar[.bz2|.gz]    one RDF/XML file per book, with downloads
+#   pg<id>.rdf                 a single book's RDF file
+#
+# Files are read row by row (CSV) or member by member (tar stream), so
+# memory stays flat apart from the BookCatalog being built. Everything runs
+# from a local file; nothing here touches the network.
+import bz2
+import csv
+import gzip
+import tarfile
+import xml.etree.ElementTree as ET
+from collections import namedtuple
+
+from book_catalog import CatalogBuilder
+
+# Fields are in CatalogBuilder.add order, so builder.add(*entry) works.
+CatalogEntry = namedtuple(
+    'CatalogEntry', 'book_id title author download_count languages subjects bookshelves',
+)
+
+# Only text ebooks are recommended; audio books and other types are skipped.
+BOOK_TYPE = 'Text'
+
+_NS = {
+    'rdf': 'http://www.w3.org/1999/02/22-rdf-syntax-ns#',
+    'dcterms': 'http://purl.org/dc/terms/',
+    'pgterms': 'http://www.gutenberg.org/2009/pgterms/',
+    'dcam': 'http://purl.org/dc/dcam/',
+}
+_RDF_ABOUT = f"{{{_NS['rdf']}}}about"
+_RDF_RESOURCE = f"{{{_NS['rdf']}}}resource"
+_LCSH = 'http://purl.org/dc/terms/LCSH'
+
+
+def _open_text(path):
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rt', encoding='utf-8', newline='')
+    if path.endswith('.bz2'):
+        return bz2.open(path, 'rt', encoding='utf-8', newline='')
+    return open(path, encoding='utf-8', newline='')
+
+
+def _split(value):
+    """Splits a '; '-separated CSV field into its non-empty parts."""
+    return tuple(part.strip() for part in (value or '').split(';') if part.strip())
+
+
+def _clean_title(title):
+    # Titles span several lines when they have a subtitle.
+    return ' '.join((title or '').split())
+
+
+def iter_csv_entries(lines):
+    """
+    Yields a CatalogEntry per text ebook in pg_catalog.csv.
+
+    Args:
+      lines: An iterable of CSV lines, e.g. a file opened with newline=''.
+    """
+    for row in csv.DictReader(lines):
+        if row.get('Type', BOOK_TYPE) != BOOK_TYPE:
+            continue
+        try:
+            book_id = int(row['Text#'])
+        except (KeyError, TypeError, ValueError):
+            continue
+        yield CatalogEntry(
+            book_id,
+            _clean_title(row.get('Title')),
+            (row.get('Authors') or '').strip(),
+            0,
+            _split(row.get('Language')),
+            _split(row.get('Subjects')),
+            _split(row.get('Bookshelves')),
+        )
+
+
+def _values(ebook, path):
+    return tuple(
+        node.text.strip() for node in ebook.iterfind(path, _NS) if node.text and node.text.strip()
+    )
+
+
+def _lcsh_subjects(ebook):
+    # LCC class codes are skipped; the CSV lists only LCSH headings too.
+    subjects = []
+    for description in ebook.iterfind('dcterms:subject/rdf:Description', _NS):
+        scheme = description.find('dcam:memberOf', _NS)
+        value = description.findtext('rdf:value', '', _NS).strip()
+        if scheme is not None and scheme.get(_RDF_RESOURCE) == _LCSH and value:
+            subjects.append(value)
+    return tuple(subjects)
+
+
+def parse_rdf(source):
+    """
+    Parses one book's RDF/XML file.
+
+    Args:
+      source: A path or binary file object.
+
+    Returns:
+      A CatalogEntry, or None if the file describes no text ebook.
+    """
+    ebook = ET.parse(source).getroot().find('pgterms:ebook', _NS)
+    if ebook is None:
+        return None
+    if BOOK_TYPE not in _values(ebook, 'dcterms:type/rdf:Description/rdf:value'):
+        return None
+    try:
+        book_id = int(ebook.get(_RDF_ABOUT, '').rsplit('/', 1)[-1])
+    except ValueError:
+        return None
+    downloads = ebook.findtext('pgterms:downloads', '0', _NS).strip()
+    return CatalogEntry(
+        book_id,
+        _clean_title(ebook.findtext('dcterms:title', '', _NS)),
+        '; '.join(_values(ebook, 'dcterms:creator/pgterms:agent/pgterms:name')),
+        int(downloads) if downloads.isdigit() else 0,
+        _values(ebook, 'dcterms:language/rdf:Description/rdf:value'),
+        _lcsh_subjects(ebook),
+        _values(ebook, 'pgterms:bookshelf/rdf:Description/rdf:value'),
+    )
+
+
+def iter_rdf_entries(path):
+    """Yields a CatalogEntry per text ebook in an RDF tarball, streaming its members."""
+    with tarfile.open(path, 'r|*') as archive:
+        for member in archive:
+            if not (member.isfile() and member.name.endswith('.rdf')):
+                continue
+            try:
+                entry = parse_rdf(archive.extractfile(member))
+            except ET.ParseError as e:
+                print(f"Skipping unreadable catalog file {member.name}: {e}")
+                continue
+            if entry is not None:
+                yield entry
+
+
+def iter_entries(path):
+    """Yields CatalogEntry records from a CSV, RDF tarball or single RDF file."""
+    if path.endswith('.rdf'):
+        entry = parse_rdf(path)
+        if entry is not None:
+            yield entry
+    elif '.csv' in path:
+        with _open_text(path) as lines:
+            yield from iter_csv_entries(lines)
+    else:
+        yield from iter_rdf_entries(path)
+
+
+def has_tag(phrase):
+    """
+    Returns a predicate matching entries whose subjects or bookshelves
+    mention ``phrase``, ignoring case and hyphens ("Science-Fiction").
+    """
+    phrase = phrase.lower().replace('-', ' ')
+
+    def matches(entry):
+        return any(phrase in tag.lower().replace('-', ' ') for tag in entry.subjects + entry.bookshelves)
+    return matches
+
+
+def read_catalog(path, keep=None):
+    """
+    Builds a BookCatalog from a local catalog dump.
+
+    Args:
+      path: pg_catalog.csv (optionally .gz/.bz2), an RDF tarball, or a .rdf file.
+      keep: Optional predicate on CatalogEntry; other books are left out.
+
+    Returns:
+      A BookCatalog; empty if nothing matched.
+    """
+    builder = CatalogBuilder()
+    for entry in iter_entries(path):
+        if keep is None or keep(entry):
+            builder.add(*entry)
+    return builder.build()
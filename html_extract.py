@@ -0,0 +1,329 @@
+# Pluggable HTML extraction for Wikipedia and Project Gutenberg pages.
+#
+# Each backend implements the same three extractors. selectolax (Lexbor)
+# and lxml (libxml2) parse in C and are preferred when installed, then
+# BeautifulSoup; the standard library's html.parser is the last resort, so
+# extraction works with none of them installed. Set HTML_BACKEND to force
+# one.
+#
+# iter_paragraphs is a separate, incremental path for Wikipedia article
+# HTML: it is fed the response body chunk by chunk and yields paragraphs as
+# they complete, so callers can stop reading once they have enough.
+import importlib.util
+import os
+from collections import deque
+from html.parser import HTMLParser
+
+from lazy_imports import lazy_import
+
+bs4 = lazy_import('bs4')
+lxml_html = lazy_import('lxml.html')
+# selectolax.lexbor, not selectolax.parser: the Modest-based parser module
+# was removed in selectolax 1.0.
+selectolax_lexbor = lazy_import('selectolax.lexbor')
+
+GUTENBERG_BASE_URL = "https://www.gutenberg.org"
+
+
+class SelectolaxBackend:
+    name = 'selectolax'
+    module = 'selectolax.lexbor'
+
+    def booklinks(self, html):
+        results = []
+        for item in selectolax_lexbor.LexborHTMLParser(html).css('li.booklink'):
+            link_tag = item.css_first('a')
+            href = link_tag.attributes.get('href') if link_tag is not None else None
+            if href:
+                results.append((link_tag.text().strip(), href))
+        return results
+
+    def links(self, html):
+        return [(a.text(), a.attributes.get('href')) for a in selectolax_lexbor.LexborHTMLParser(html).css('a')]
+
+    def paragraphs(self, html):
+        tree = selectolax_lexbor.LexborHTMLParser(html)
+        root = tree.css_first('div.mw-parser-output') or tree.body or tree.root
+        texts = (p.text().strip() for p in root.css('p'))
+        return [text for text in texts if text]
+
+
+class LxmlBackend:
+    name = 'lxml'
+    module = 'lxml'
+
+    _BOOKLINK = '//li[contains(concat(" ", normalize-space(@class), " "), " booklink ")]'
+    _CONTENT = '//div[contains(concat(" ", normalize-space(@class), " "), " mw-parser-output ")]'
+
+    def booklinks(self, html):
+        results = []
+        for item in lxml_html.fromstring(html).xpath(self._BOOKLINK):
+            link_tag = item.find('.//a')
+            if link_tag is not None and link_tag.get('href'):
+                results.append((link_tag.text_content().strip(), link_tag.get('href')))
+        return results
+
+    def links(self, html):
+        return [(a.text_content(), a.get('href')) for a in lxml_html.fromstring(html).iter('a')]
+
+    def paragraphs(self, html):
+        tree = lxml_html.fromstring(html)
+        content = tree.xpath(self._CONTENT)
+        root = content[0] if content else tree
+        texts = (p.text_content().strip() for p in root.iter('p'))
+        return [text for text in texts if text]
+
+
+class BeautifulSoupBackend:
+    name = 'bs4'
+    module = 'bs4'
+
+    def booklinks(self, html):
+        results = []
+        for item in bs4.BeautifulSoup(html, 'html.parser').find_all('li', class_='booklink'):
+            link_tag = item.find('a')
+            if link_tag and link_tag.get('href'):
+                results.append((link_tag.get_text().strip(), link_tag.get('href')))
+        return results
+
+    def links(self, html):
+        return [(a.get_text(), a.get('href')) for a in bs4.BeautifulSoup(html, 'html.parser').find_all('a')]
+
+    def paragraphs(self, html):
+        soup = bs4.BeautifulSoup(html, 'html.parser')
+        root = soup.find('div', class_='mw-parser-output') or soup
+        texts = (p.get_text().strip() for p in root.find_all('p'))
+        return [text for text in texts if text]
+
+
+class _AnchorParser(HTMLParser):
+    """
+    Collects (text, href, booklink) for every anchor on a page, where
+    ``booklink`` numbers the enclosing ``li.booklink`` (None outside one).
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.anchors = []
+        self._booklinks = 0
+        self._booklink = None
+        self._anchor = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'li':
+            self._booklink = None
+            if 'booklink' in (dict(attrs).get('class') or '').split():
+                self._booklinks += 1
+                self._booklink = self._booklinks
+        elif tag == 'a':
+            self._close_anchor()
+            self._anchor = ([], dict(attrs).get('href'), self._booklink)
+
+    def handle_endtag(self, tag):
+        if tag == 'a':
+            self._close_anchor()
+        elif tag == 'li':
+            self._booklink = None
+
+    def handle_data(self, data):
+        if self._anchor is not None:
+            self._anchor[0].append(data)
+
+    def _close_anchor(self):
+        if self._anchor is not None:
+            text, href, booklink = self._anchor
+            self.anchors.append((''.join(text), href, booklink))
+            self._anchor = None
+
+    def close(self):
+        super().close()
+        self._close_anchor()
+
+
+class StdlibBackend:
+    """
+    Pure-Python fallback on html.parser, for when no parser library is installed.
+
+    Paragraphs come from the streaming parser, so they are limited to the
+    ``mw-parser-output`` div and skip tables and reference markers.
+    """
+
+    name = 'html.parser'
+    module = 'html.parser'
+
+    @staticmethod
+    def _anchors(html):
+        parser = _AnchorParser()
+        parser.feed(html)
+        parser.close()
+        return parser.anchors
+
+    def booklinks(self, html):
+        results, seen = [], set()
+        for text, href, booklink in self._anchors(html):
+            # Only the first anchor of each li.booklink, like the other backends.
+            if booklink is None or booklink in seen:
+                continue
+            seen.add(booklink)
+            if href:
+                results.append((text.strip(), href))
+        return results
+
+    def links(self, html):
+        return [(text, href) for text, href, _ in self._anchors(html)]
+
+    def paragraphs(self, html):
+        return list(iter_paragraphs([html]))
+
+
+BACKENDS = {
+    backend.name: backend
+    for backend in (SelectolaxBackend(), LxmlBackend(), BeautifulSoupBackend(), StdlibBackend())
+}
+PREFERENCE = ('selectolax', 'lxml', 'bs4', 'html.parser')
+
+_selected = None
+
+
+def available_backends():
+    """Names of the backends whose parser library is installed, fastest first."""
+    return [name for name in PREFERENCE if importlib.util.find_spec(BACKENDS[name].module) is not None]
+
+
+def get_backend(name=None):
+    """
+    Returns the named backend, or the configured/fastest installed one.
+
+    Raises:
+      ValueError: If ``name`` is not a known backend.
+    """
+    global _selected
+    if name is not None:
+        if name not in BACKENDS:
+            raise ValueError(f"Unknown HTML backend '{name}'. Choose from: {', '.join(PREFERENCE)}")
+        return BACKENDS[name]
+    if _selected is None:
+        configured = os.environ.get('HTML_BACKEND')
+        if configured:
+            _selected = get_backend(configured)
+        else:
+            installed = available_backends()
+            _selected = BACKENDS[installed[0]]
+    return _selected
+
+
+def extract_booklinks(html, backend=None):
+    """Returns title/url dicts for the ``li.booklink`` entries of a Gutenberg listing page."""
+    return [
+        {"title": title, "url": f"{GUTENBERG_BASE_URL}{href}"}
+        for title, href in get_backend(backend).booklinks(html)
+    ]
+
+
+def extract_links(html, backend=None):
+    """Returns (text, href) for every anchor on the page."""
+    return get_backend(backend).links(html)
+
+
+def extract_paragraphs(html, backend=None):
+    """Returns the non-empty paragraph texts inside a Wikipedia ``mw-parser-output`` div."""
+    return get_backend(backend).paragraphs(html)
+
+
+class _StreamingParagraphParser(HTMLParser):
+    """
+    Collects the text of ``<p>`` elements inside ``mw-parser-output``.
+
+    Paragraph text inside tables (infoboxes, navboxes), styles, scripts and
+    reference markers is skipped. With ``lead_only`` the parser marks
+    itself done at the first ``<h2>``, where the lead section ends.
+    """
+
+    _SKIPPED = frozenset({'table', 'style', 'script'})
+    # Block elements that implicitly close an open <p>.
+    _CLOSES_P = frozenset({'div', 'table', 'ul', 'ol', 'dl', 'blockquote', 'h2', 'h3', 'h4', 'h5', 'h6'})
+
+    def __init__(self, lead_only=False):
+        super().__init__(convert_charrefs=True)
+        self.lead_only = lead_only
+        self.paragraphs = deque()
+        self.done = False
+        self._content_depth = 0
+        self._skip_tag = None
+        self._skip_depth = 0
+        self._text = None
+
+    def handle_starttag(self, tag, attrs):
+        if self.done:
+            return
+        if self._skip_tag is not None:
+            if tag == self._skip_tag:
+                self._skip_depth += 1
+            return
+        if tag in self._CLOSES_P:
+            self._flush()
+        if tag == 'div':
+            if self._content_depth:
+                self._content_depth += 1
+            elif 'mw-parser-output' in (dict(attrs).get('class') or '').split():
+                self._content_depth = 1
+            return
+        if not self._content_depth:
+            return
+        if tag in self._SKIPPED or (tag == 'sup' and 'reference' in (dict(attrs).get('class') or '')):
+            self._skip_tag, self._skip_depth = tag, 1
+        elif tag == 'p':
+            self._flush()
+            self._text = []
+        elif tag == 'h2' and self.lead_only:
+            self.done = True
+
+    def handle_endtag(self, tag):
+        if self.done:
+            return
+        if self._skip_tag is not None:
+            if tag == self._skip_tag:
+                self._skip_depth -= 1
+                if not self._skip_depth:
+                    self._skip_tag = None
+            return
+        if tag == 'div' and self._content_depth:
+            self._content_depth -= 1
+        elif tag == 'p':
+            self._flush()
+
+    def _flush(self):
+        if self._text is not None:
+            text = ' '.join(''.join(self._text).split())
+            if text:
+                self.paragraphs.append(text)
+            self._text = None
+
+    def handle_data(self, data):
+        if self._text is not None and self._skip_tag is None and not self.done:
+            self._text.append(data)
+
+
+def iter_paragraphs(chunks, lead_only=False):
+    """
+    Yields paragraph texts from Wikipedia article HTML as it arrives.
+
+    Args:
+      chunks: Iterable of decoded HTML text chunks, e.g. a streamed
+        response's ``iter_content(decode_unicode=True)``.
+      lead_only: Stop at the first section heading.
+
+    The caller can stop iterating at any point; nothing past the chunk that
+    completed the last yielded paragraph is consumed.
+    """
+    parser = _StreamingParagraphParser(lead_only)
+    for chunk in chunks:
+        parser.feed(chunk)
+        while parser.paragraphs:
+            yield parser.paragraphs.popleft()
+        if parser.done:
+            return
+    parser.close()
+    parser._flush()
+    while parser.paragraphs:
+        yield parser.paragraphs.popleft()
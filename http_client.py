@@ -0,0 +1,123 @@
+# Process-wide pooled HTTP client shared by every upstream fetcher.
+#
+# One requests.Session per upstream host keeps TCP+TLS connections alive
+# between calls to en.wikipedia.org, gutenberg.org and friends. Connection
+# counters make it possible to confirm handshakes go away under load.
+import threading
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from rate_limit import throttle
+from retry import call_with_retry
+
+# Wikipedia's API policy requires a descriptive user agent; reuse it everywhere.
+USER_AGENT = 'LLM Assistant (your_email@example.com)'
+
+# (connect, read) timeout applied when a caller does not pass one.
+DEFAULT_TIMEOUT = (3.05, 10)
+
+# Distinct pools kept per session, and connections kept alive per pool.
+# POOL_MAXSIZE should cover the number of threads serving requests.
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 32
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+# host -> {"requests": n, "connections": n}
+_stats = {}
+_stats_lock = threading.Lock()
+
+
+def _count(host, key):
+    with _stats_lock:
+        host_stats = _stats.setdefault(host, {"requests": 0, "connections": 0})
+        host_stats[key] += 1
+
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    def _new_conn(self):
+        _count(self.host, "connections")
+        return super()._new_conn()
+
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    def _new_conn(self):
+        _count(self.host, "connections")
+        return super()._new_conn()
+
+
+class PooledAdapter(HTTPAdapter):
+    """HTTPAdapter whose pools record every new connection they open."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CountingHTTPConnectionPool,
+            "https": _CountingHTTPSConnectionPool,
+        }
+
+
+def _new_session():
+    session = requests.Session()
+    adapter = PooledAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["User-Agent"] = USER_AGENT
+    return session
+
+
+def get_session(host):
+    """Returns the shared keep-alive session for ``host``, creating it on first use."""
+    session = _sessions.get(host)
+    if session is None:
+        with _sessions_lock:
+            session = _sessions.get(host)
+            if session is None:
+                session = _sessions[host] = _new_session()
+    return session
+
+
+def http_get(url, params=None, **kwargs):
+    """
+    Performs a GET through the pooled session for the URL's host.
+
+    Accepts the same keyword arguments as ``requests.get``; a default
+    timeout is applied when none is given. Each attempt waits on the
+    host's rate limiter; transient failures are retried with backoff.
+    """
+    host = urlsplit(url).hostname or ""
+    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+    session = get_session(host)
+
+    def send():
+        throttle(host)
+        _count(host, "requests")
+        return session.get(url, params=params, **kwargs)
+
+    return call_with_retry(send, host)
+
+
+def connection_stats():
+    """
+    Returns per-host request and connection counts.
+
+    ``reuse_ratio`` is the share of requests served over an already open
+    connection; it approaches 1.0 once keep-alive is doing its job.
+    """
+    with _stats_lock:
+        report = {}
+        for host, host_stats in _stats.items():
+            n_requests = host_stats["requests"]
+            n_connections = host_stats["connections"]
+            reuse_ratio = max(0.0, 1 - n_connections / n_requests) if n_requests else 0.0
+            report[host] = dict(host_stats, reuse_ratio=reuse_ratio)
+        return report
+
+
+def reset_connection_stats():
+    with _stats_lock:
+        _stats.clear()
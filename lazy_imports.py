@@ -0,0 +1,70 @@
+# Lazy-import layer for heavy optional backends (numpy, bs4,
+# googleapiclient, gradio). Each backend is imported the first time one of
+# its attributes is touched, so a worker that only serves /recommend-books
+# never pays for numpy or the Google client.
+import importlib
+import threading
+import time
+import types
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+_lock = threading.Lock()
+
+# name -> {"seconds": import wall time, "rss_kb": peak RSS growth}
+_load_stats = {}
+
+
+def _peak_rss_kb():
+    if resource is None:
+        return 0
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+class LazyModule(types.ModuleType):
+    """Module proxy that imports the real module on first attribute access."""
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.__dict__['_lazy_target'] = None
+
+    def _load(self):
+        module = self.__dict__['_lazy_target']
+        if module is not None:
+            return module
+        with _lock:
+            module = self.__dict__['_lazy_target']
+            if module is None:
+                rss_before = _peak_rss_kb()
+                start = time.perf_counter()
+                module = importlib.import_module(self.__name__)
+                _load_stats[self.__name__] = {
+                    "seconds": time.perf_counter() - start,
+                    "rss_kb": _peak_rss_kb() - rss_before,
+                }
+                self.__dict__['_lazy_target'] = module
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = 'loaded' if self.__dict__['_lazy_target'] is not None else 'not loaded'
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+
+def lazy_import(name):
+    """Returns a proxy for ``name`` that defers the import until first use."""
+    return LazyModule(name)
+
+
+def import_report():
+    """Returns a copy of the per-dependency import timings recorded so far."""
+    with _lock:
+        return {name: dict(stats) for name, stats in _load_stats.items()}
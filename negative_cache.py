@@ -0,0 +1,102 @@
+# Negative cache for (lang, title) lookups that Wikipedia answered with
+# "no such page". A compact Bloom filter answers the common "never missed"
+# case without touching the dict; confirmed misses expire after a short TTL
+# so newly created pages become reachable again.
+import hashlib
+import math
+import threading
+import time
+
+from content_cache import normalize_query
+
+NEGATIVE_TTL = 10 * 60
+BLOOM_CAPACITY = 100_000
+BLOOM_ERROR_RATE = 0.01
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings.
+
+    Sized for ``capacity`` items at ``error_rate`` false positives; the k
+    bit positions come from double hashing one blake2b digest.
+    """
+
+    def __init__(self, capacity=BLOOM_CAPACITY, error_rate=BLOOM_ERROR_RATE):
+        self.capacity = capacity
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item):
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, item):
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, item):
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+class NegativeCache:
+    """
+    Remembers lookups that found no page, for ``ttl`` seconds.
+
+    The Bloom filter is rebuilt from the live entries whenever it fills up,
+    which also drops bits for misses that have since expired.
+    """
+
+    def __init__(self, ttl=NEGATIVE_TTL, capacity=BLOOM_CAPACITY, clock=time.time):
+        self.ttl = ttl
+        self.capacity = capacity
+        self._clock = clock
+        self._bloom = BloomFilter(capacity)
+        self._expires = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+
+    @staticmethod
+    def _key(lang, title):
+        return f"{lang.lower()}:{normalize_query(title)}"
+
+    def is_missing(self, lang, title):
+        key = self._key(lang, title)
+        if key not in self._bloom:
+            return False
+        with self._lock:
+            expires_at = self._expires.get(key)
+            if expires_at is None:
+                return False
+            if expires_at <= self._clock():
+                del self._expires[key]
+                return False
+            self.hits += 1
+            return True
+
+    def add(self, lang, title):
+        key = self._key(lang, title)
+        with self._lock:
+            if self._bloom.count >= self._bloom.capacity:
+                self._rebuild()
+            self._expires[key] = self._clock() + self.ttl
+            self._bloom.add(key)
+
+    def _rebuild(self):
+        now = self._clock()
+        self._expires = {k: t for k, t in self._expires.items() if t > now}
+        # Leave headroom so a large live set does not trigger a rebuild per add.
+        self._bloom = BloomFilter(max(self.capacity, 2 * len(self._expires)))
+        for key in self._expires:
+            self._bloom.add(key)
+
+    def stats(self):
+        return {'hits': self.hits, 'entries': len(self._expires)}
+
+
+missing_pages = NegativeCache()
@@ -0,0 +1,132 @@
+# BM25 passage ranking over a WikiDocument's paragraphs.
+#
+# Term statistics are computed once per index: every (term, paragraph)
+# posting carries its precomputed BM25 weight, grouped by term, so scoring
+# a question is one slice per query term and a single np.bincount. The
+# best paragraph is then narrowed to its best-matching sentences with the
+# article's TF-IDF sentence matrix.
+from lazy_imports import lazy_import
+from segmenter import tokenize
+from tfidf import SentenceMatrix
+
+np = lazy_import('numpy')
+
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+
+class BM25Index:
+    """
+    BM25 index over a list of (heading, text) passages.
+
+    Attributes:
+      passages: The indexed (heading, text) pairs.
+      vocabulary: Term -> term id.
+      idf: BM25 inverse document frequency per term id.
+    """
+
+    def __init__(self, passages, k1=BM25_K1, b=BM25_B):
+        self.passages = list(passages)
+        n = len(self.passages)
+
+        vocabulary = {}
+        term_ids, passage_ids, lengths = [], [], []
+        for i, (_, text) in enumerate(self.passages):
+            tokens = tokenize(text)
+            lengths.append(len(tokens))
+            term_ids.extend(vocabulary.setdefault(token, len(vocabulary)) for token in tokens)
+            passage_ids.extend([i] * len(tokens))
+        self.vocabulary = vocabulary
+
+        # Unique (term, passage) keys come back sorted by term, then passage.
+        keys, tf = np.unique(
+            np.asarray(term_ids, dtype=np.int64) * max(n, 1) + np.asarray(passage_ids, dtype=np.int64),
+            return_counts=True,
+        )
+        terms = keys // max(n, 1)
+        self._postings = keys % max(n, 1)
+        self._indptr = np.searchsorted(terms, np.arange(len(vocabulary) + 1))
+
+        df = np.diff(self._indptr)
+        self.idf = np.log1p((n - df + 0.5) / (df + 0.5))
+
+        lengths = np.asarray(lengths, dtype=np.float64)
+        avgdl = lengths.mean() if n and lengths.mean() else 1.0
+        norm = k1 * (1 - b + b * lengths / avgdl)
+        self._weights = self.idf[terms] * tf * (k1 + 1) / (tf + norm[self._postings])
+
+    def scores(self, query):
+        """Returns the BM25 score of every passage for ``query`` as an array."""
+        term_ids = {self.vocabulary[t] for t in tokenize(query) if t in self.vocabulary}
+        if not term_ids:
+            return np.zeros(len(self.passages))
+        slices = [slice(self._indptr[t], self._indptr[t + 1]) for t in term_ids]
+        postings = np.concatenate([self._postings[s] for s in slices])
+        weights = np.concatenate([self._weights[s] for s in slices])
+        return np.bincount(postings, weights=weights, minlength=len(self.passages))
+
+    @property
+    def nbytes(self):
+        arrays = (self._postings, self._indptr, self._weights, self.idf)
+        text = sum(len(h) + len(t) for h, t in self.passages) + sum(len(t) for t in self.vocabulary)
+        return sum(a.nbytes for a in arrays) + text
+
+
+class ArticleIndex:
+    """
+    Everything needed to answer questions about one article: a BM25 index
+    over its paragraphs and a TF-IDF matrix over their sentences. Built once
+    per article version and cached, so repeated or related questions reuse it.
+    """
+
+    __slots__ = ('paragraphs', 'sentences')
+
+    def __init__(self, document):
+        self.paragraphs = BM25Index(document.paragraphs())
+        self.sentences = SentenceMatrix((text for _, text in self.paragraphs.passages), document.lang)
+
+    @property
+    def nbytes(self):
+        return self.paragraphs.nbytes + self.sentences.nbytes
+
+
+def best_sentences(index, paragraph, query, k):
+    """
+    Returns the ``k`` consecutive sentences of paragraph number ``paragraph``
+    with the highest total TF-IDF similarity to ``query``.
+    """
+    matrix = index.sentences
+    start, end = int(matrix.paragraph_ptr[paragraph]), int(matrix.paragraph_ptr[paragraph + 1])
+    if end - start > k:
+        window = np.convolve(matrix.scores(query)[start:end], np.ones(k), mode='valid')
+        start += int(np.argmax(window))
+        end = start + k
+    return " ".join(matrix.sentences[start:end])
+
+
+def best_passage(document, query, max_sentences=0, index=None):
+    """
+    Finds the paragraph of ``document`` that best answers ``query``.
+
+    Args:
+      document: A found WikiDocument; load all sections first to rank beyond the lead.
+      query: The user's question.
+      max_sentences: If positive, trim the passage to this many sentences.
+      index: The document's ArticleIndex, if the caller caches one.
+
+    Returns:
+      A {"heading", "text", "score"} dict, or None if no paragraph shares a
+      term with the question.
+    """
+    index = index or ArticleIndex(document)
+    if not index.paragraphs.passages:
+        return None
+    scores = index.paragraphs.scores(query)
+    best = int(np.argmax(scores))
+    score = float(scores[best])
+    if score <= 0:
+        return None
+    heading, text = index.paragraphs.passages[best]
+    if max_sentences > 0:
+        text = best_sentences(index, best, query, max_sentences)
+    return {"heading": heading, "text": text, "score": score}
@@ -0,0 +1,145 @@
+# Intent routing for free-form chat queries.
+#
+# All intent keywords and language markers are compiled once into a single
+# alternation, so classifying a query is one left-to-right scan. Cleaning
+# the topic only looks at the start of the query, with one anchored pattern
+# per intent.
+import re
+
+from wiki_languages import language_names, marker_names
+
+BOOK_KEYWORDS = [
+    "recommend science fiction books", "sci-fi books", "science fiction recommendations", "gutenberg sci-fi",
+    "suggest science fiction", "best sci-fi books", "science fiction book recommendations",
+    "find science fiction books", "recommend sci-fi",
+]
+YOUTUBE_KEYWORDS = [
+    "find youtube videos on", "recommend youtube videos about", "watch video on", "search youtube for",
+    "youtube tutorial", "video about", "youtube clips", "recommend youtube videos", "youtube videos",
+]
+# Leading phrases removed from the topic; the first one that matches wins.
+YOUTUBE_STRIP_PHRASES = YOUTUBE_KEYWORDS
+# Words after a language name that make the marker unambiguous ("in Mon language").
+LANGUAGE_SUFFIXES = ["language", "wikipedia"]
+# Leading question phrases removed, repeatedly, from Wikipedia topics.
+WIKIPEDIA_QUESTION_PHRASES = [
+    "what is", "who is", "where is", "how to", "explain", "define", "tell me about", "information on",
+    "about", "history of",
+]
+# Words of those phrases that ask for the topic itself, not for part of it.
+TOPIC_REQUEST_WORDS = frozenset({"explain", "define", "information"})
+
+BOOKS = 'books'
+YOUTUBE = 'youtube'
+WIKIPEDIA = 'wikipedia'
+
+
+def _alternation(phrases):
+    return '|'.join(map(re.escape, phrases))
+
+
+class Route:
+    """
+    How a query should be answered.
+
+    Attributes:
+      intent: BOOKS, YOUTUBE or WIKIPEDIA.
+      lang: Wikipedia language code requested with "in <language>", else 'en'.
+      topic: The query with routing phrases removed (for YouTube, the
+        language marker is kept, as the video search is not localized).
+      question: The query with only the language marker removed.
+    """
+
+    __slots__ = ('intent', 'lang', 'topic', 'question')
+
+    def __init__(self, intent, lang, topic, question):
+        self.intent = intent
+        self.lang = lang
+        self.topic = topic
+        self.question = question
+
+    def __repr__(self):
+        return f"Route({self.intent!r}, {self.lang!r}, {self.topic!r})"
+
+
+class QueryRouter:
+    """
+    Classifies queries with patterns compiled once at construction.
+
+    Args:
+      languages: Mapping of language names that select an edition on their
+        own after "in" to Wikipedia language codes. Defaults to
+        wiki_languages.marker_names(): common editions and names in
+        non-Latin scripts.
+      qualified_languages: Names that select an edition only when followed
+        by "language" or "Wikipedia" ("in Mon language"). Defaults to
+        every edition in the registry, by English and native name, when
+        ``languages`` is not given, else to ``languages``.
+
+    A language marker only counts at the end of the query or before
+    punctuation, so "in Latin" selects la.wikipedia but "countries in
+    Latin America" does not.
+    """
+
+    def __init__(self, languages=None, book_keywords=BOOK_KEYWORDS, youtube_keywords=YOUTUBE_KEYWORDS,
+                 youtube_strip_phrases=YOUTUBE_STRIP_PHRASES, question_phrases=WIKIPEDIA_QUESTION_PHRASES,
+                 qualified_languages=None):
+        if qualified_languages is None:
+            qualified_languages = languages or language_names()
+        self.languages = {name.lower(): code for name, code in (languages or marker_names()).items()}
+        self.qualified_languages = {name.lower(): code for name, code in qualified_languages.items()}
+        # Longest names first so "in old english" is not read as "in old".
+        names = sorted(self.languages, key=len, reverse=True)
+        qualified_names = sorted(self.qualified_languages, key=len, reverse=True)
+        self._scanner = re.compile(
+            r'(?P<lang>\bin\s+(?:(?P<qualified_name>' + _alternation(qualified_names) + r')\s+(?:'
+            + _alternation(LANGUAGE_SUFFIXES) + r')|(?P<lang_name>' + _alternation(names) + r'))'
+            r'(?=\s*(?:[,.!?;:]|$)))'
+            r'|(?P<books>\b(?:' + _alternation(book_keywords) + r')\b)'
+            r'|(?P<youtube>\b(?:' + _alternation(youtube_keywords) + r')\b)',
+            re.IGNORECASE,
+        )
+        self._youtube_prefix = re.compile(r'\s*(?:' + _alternation(youtube_strip_phrases) + r')\b', re.IGNORECASE)
+        self._question_prefix = re.compile(
+            r'(?:\s*(?:' + _alternation(question_phrases) + r')\b)+\s*', re.IGNORECASE
+        )
+
+    def route(self, query):
+        """Returns the Route for ``query`` after a single scan of it."""
+        lang_match = None
+        books = youtube = False
+        for match in self._scanner.finditer(query):
+            group = match.lastgroup
+            if group == 'books':
+                books = True
+            elif group == 'youtube':
+                youtube = True
+            elif lang_match is None:
+                lang_match = match
+
+        if lang_match is not None:
+            if lang_match.group('qualified_name'):
+                lang = self.qualified_languages.get(lang_match.group('qualified_name').lower(), 'en')
+            else:
+                lang = self.languages.get(lang_match.group('lang_name').lower(), 'en')
+            question = (query[:lang_match.start()] + query[lang_match.end():]).strip()
+        else:
+            lang = 'en'
+            question = query.strip()
+
+        if books:
+            return Route(BOOKS, lang, question, question)
+        if youtube:
+            prefix = self._youtube_prefix.match(query)
+            topic = query[prefix.end():] if prefix else query
+            return Route(YOUTUBE, lang, topic.strip(), question)
+
+        prefix = self._question_prefix.match(question)
+        topic = question[prefix.end():] if prefix else question
+        topic = topic.strip()
+        if topic.endswith('?'):
+            topic = topic[:-1].strip()
+        return Route(WIKIPEDIA, lang, topic or question, question)
+
+
+router = QueryRouter()
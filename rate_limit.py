@@ -0,0 +1,110 @@
+# Token-bucket rate limiting per upstream (each language Wikipedia host,
+# Project Gutenberg, YouTube). Callers only wait when they actually exceed
+# the budget; buckets are thread-safe and shared by every thread in the
+# process.
+import threading
+import time
+from urllib.parse import urlsplit
+
+# upstream key -> (tokens per second, burst capacity)
+UPSTREAM_LIMITS = {
+    'wikipedia': (5.0, 10),
+    'www.gutenberg.org': (2.0, 4),
+    'youtube': (5.0, 5),
+}
+DEFAULT_LIMIT = (5.0, 10)
+
+_buckets = {}
+_buckets_lock = threading.Lock()
+
+
+class TokenBucket:
+    """
+    Classic token bucket: ``rate`` tokens are added per second up to ``capacity``.
+
+    Args:
+      rate: Sustained requests per second.
+      capacity: Maximum burst size.
+    """
+
+    def __init__(self, rate, capacity, clock=time.monotonic, sleep=time.sleep):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self._tokens = float(capacity)
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self, tokens=1):
+        """Takes ``tokens`` if available right now; never blocks."""
+        with self._lock:
+            self._refill()
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def acquire(self, tokens=1, timeout=None):
+        """
+        Takes ``tokens``, sleeping only as long as needed for them to refill.
+
+        Returns:
+          True once the tokens were taken, False if ``timeout`` seconds passed first.
+        """
+        deadline = None if timeout is None else self._clock() + timeout
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return True
+                wait = (tokens - self._tokens) / self.rate
+            if deadline is not None:
+                remaining = deadline - self._clock()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            self._sleep(wait)
+
+
+def upstream_key(url_or_host):
+    """
+    Maps a URL or host to its rate-limit key.
+
+    Every Wikipedia language edition gets its own bucket (keyed by host, e.g.
+    'fr.wikipedia.org'); YouTube API hosts share one 'youtube' bucket.
+    """
+    host = urlsplit(url_or_host).hostname if '://' in url_or_host else url_or_host
+    host = (host or '').lower()
+    if host.endswith('.googleapis.com') or host.endswith('youtube.com'):
+        return 'youtube'
+    return host
+
+
+def _limit_for(key):
+    if key.endswith('.wikipedia.org'):
+        return UPSTREAM_LIMITS['wikipedia']
+    return UPSTREAM_LIMITS.get(key, DEFAULT_LIMIT)
+
+
+def get_limiter(key):
+    """Returns the shared bucket for an upstream key, creating it on first use."""
+    bucket = _buckets.get(key)
+    if bucket is None:
+        with _buckets_lock:
+            bucket = _buckets.get(key)
+            if bucket is None:
+                rate, capacity = _limit_for(key)
+                bucket = _buckets[key] = TokenBucket(rate, capacity)
+    return bucket
+
+
+def throttle(url_or_host, tokens=1):
+    """Blocks until the upstream serving ``url_or_host`` has budget for one more call."""
+    get_limiter(upstream_key(url_or_host)).acquire(tokens)
@@ -0,0 +1,93 @@
+# Popularity-weighted book recommendations over a BookCatalog.
+#
+# A Walker/Vose alias table over download counts is built once per catalog,
+# after which each weighted draw is O(1) and k distinct books cost O(k)
+# expected draws. The most-downloaded books are ranked once at the same
+# time. Catalogs are immutable, so both are only rebuilt for a new catalog.
+import heapq
+import itertools
+import random
+from array import array
+
+# How many of the most popular books to keep ranked.
+TOP_K = 100
+# Draws allowed per requested book before falling back to the popular list,
+# for catalogs whose weight sits on fewer books than were asked for.
+MAX_DRAWS_PER_BOOK = 32
+
+
+class AliasTable:
+    """
+    Walker alias table for sampling indexes in proportion to ``weights``.
+
+    Built with Vose's O(n) method; ``draw`` is O(1).
+    """
+
+    __slots__ = ('prob', 'alias')
+
+    def __init__(self, weights):
+        n = len(weights)
+        total = float(sum(weights))
+        self.prob = array('d', [0.0]) * n
+        self.alias = array('L', [0]) * n
+        if not n or total <= 0:
+            return
+        scaled = [w * n / total for w in weights]
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s, g = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = g
+            scaled[g] -= 1.0 - scaled[s]
+            (small if scaled[g] < 1.0 else large).append(g)
+        # Whatever is left has probability 1 up to rounding error.
+        for i in large + small:
+            self.prob[i] = 1.0
+
+    def __len__(self):
+        return len(self.prob)
+
+    def draw(self, rng=random):
+        i = int(rng.random() * len(self.prob))
+        return i if rng.random() < self.prob[i] else self.alias[i]
+
+
+class Recommender:
+    """
+    Weighted and top-k recommendations for one catalog.
+
+    Books are weighted by download count + 1, so a catalog without
+    download counts (e.g. scraped from a bookshelf page) samples uniformly.
+    """
+
+    def __init__(self, catalog, top_k=TOP_K):
+        self.catalog = catalog
+        counts = catalog.download_counts
+        self._alias = AliasTable([count + 1 for count in counts])
+        self._top = array('L', heapq.nlargest(top_k, range(len(counts)), key=counts.__getitem__))
+
+    def sample(self, k, rng=random):
+        """Returns up to ``k`` distinct books, drawn in proportion to popularity."""
+        k = max(0, min(k, len(self.catalog)))
+        chosen = []
+        seen = set()
+        for _ in range(k * MAX_DRAWS_PER_BOOK):
+            if len(chosen) == k:
+                break
+            i = self._alias.draw(rng)
+            if i not in seen:
+                seen.add(i)
+                chosen.append(i)
+        # Rarely reached: fill up from the most popular, then any, unseen books.
+        for i in itertools.chain(self._top, range(len(self.catalog))):
+            if len(chosen) == k:
+                break
+            if i not in seen:
+                seen.add(i)
+                chosen.append(i)
+        return [self.catalog[i] for i in chosen]
+
+    def top(self, k):
+        """The ``k`` most downloaded books (at most TOP_K), most popular first."""
+        return [self.catalog[i] for i in self._top[:max(0, k)]]
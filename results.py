@@ -0,0 +1,196 @@
+# Structured results returned by the assistant's answerers.
+#
+# Answerers return these slotted objects instead of pre-formatted strings or
+# ad-hoc dicts. A result is turned into chat text with format() where a
+# human reads it, and into JSON exactly once, at the Flask boundary, by
+# dumps(). orjson is used for that when installed; the stdlib json
+# module is the fallback.
+import importlib.util
+import json
+
+from lazy_imports import lazy_import
+
+orjson = lazy_import('orjson')
+
+_HAS_ORJSON = importlib.util.find_spec('orjson') is not None
+
+
+class WikiAnswer:
+    """
+    An answer read from a Wikipedia page, or the reason there is none.
+
+    Attributes:
+      query: The search query that was answered.
+      lang: Wikipedia language code.
+      text: The summary or passage, or the failure message if not found.
+      title: Page title, or None if the lookup failed.
+      section: Heading of the section the passage came from; None for the lead.
+      image_url: Page thumbnail URL, if any.
+      images: Content image URLs, when requested.
+      url: Canonical page URL.
+    """
+
+    __slots__ = ('query', 'lang', 'text', 'title', 'section', 'image_url', 'images', 'url')
+
+    def __init__(self, query, lang, text, title=None, section=None, image_url=None, images=(), url=None):
+        self.query = query
+        self.lang = lang
+        self.text = text
+        self.title = title
+        self.section = section
+        self.image_url = image_url
+        self.images = images
+        self.url = url
+
+    @property
+    def found(self):
+        return self.title is not None
+
+    def format(self):
+        if not self.found:
+            return self.text
+        if self.section:
+            formatted = f"Based on Wikipedia ({self.lang}), section '{self.section}':\n{self.text}"
+        else:
+            formatted = f"Based on Wikipedia ({self.lang}):\n{self.text}"
+        if self.images:
+            formatted += "\n\nImages:" + "".join(f"\n{url}" for url in self.images)
+        elif self.image_url:
+            formatted += f"\n\nImage: {self.image_url}"
+        return formatted
+
+    def as_dict(self):
+        return {
+            "type": "wikipedia",
+            "query": self.query,
+            "lang": self.lang,
+            "found": self.found,
+            "title": self.title,
+            "section": self.section,
+            "text": self.text,
+            "image_url": self.image_url,
+            "images": list(self.images),
+            "url": self.url,
+        }
+
+
+class BookRecommendation:
+    """One Project Gutenberg book; author and download count when the catalog has them."""
+
+    __slots__ = ('title', 'url', 'author', 'download_count')
+
+    def __init__(self, title, url, author=None, download_count=None):
+        self.title = title
+        self.url = url
+        self.author = author
+        self.download_count = download_count
+
+    def format(self):
+        if self.author:
+            return f"- {self.title} by {self.author}: {self.url}"
+        return f"- {self.title}: {self.url}"
+
+    def as_dict(self):
+        return {"title": self.title, "url": self.url, "author": self.author, "download_count": self.download_count}
+
+
+class VideoResult:
+    """One YouTube video or playlist."""
+
+    __slots__ = ('title', 'url', 'type', 'thumbnail_url', 'description')
+
+    # Descriptions are cut to this length in chat text.
+    DESCRIPTION_PREVIEW = 150
+
+    def __init__(self, title, url, type, thumbnail_url, description):
+        self.title = title
+        self.url = url
+        self.type = type
+        self.thumbnail_url = thumbnail_url
+        self.description = description
+
+    def format(self):
+        description = self.description
+        if len(description) > self.DESCRIPTION_PREVIEW:
+            description = description[:self.DESCRIPTION_PREVIEW] + "..."
+        return (
+            f"\nTitle: {self.title}\n"
+            f"Type: {self.type}\n"
+            f"Thumbnail: {self.thumbnail_url}\n"
+            f"Description: {description}\n"
+            f"URL: {self.url}\n"
+        )
+
+    def as_dict(self):
+        return {
+            "title": self.title,
+            "url": self.url,
+            "type": self.type,
+            "thumbnail_url": self.thumbnail_url,
+            "description": self.description,
+        }
+
+
+class ResultList:
+    """
+    A list of book or video results with the heading shown above them.
+
+    ``message`` replaces the list in chat text when there are no items.
+    """
+
+    __slots__ = ('kind', 'heading', 'items', 'message')
+
+    def __init__(self, kind, heading, items, message=None):
+        self.kind = kind
+        self.heading = heading
+        self.items = items
+        self.message = message
+
+    def format(self):
+        if not self.items:
+            return self.message
+        separator = "\n" if self.kind == "books" else ""
+        return self.heading + separator + separator.join(item.format() for item in self.items)
+
+    def as_dict(self):
+        return {"type": self.kind, "message": self.message, "items": [item.as_dict() for item in self.items]}
+
+
+class TextReply:
+    """A plain message, e.g. usage help or a configuration error."""
+
+    __slots__ = ('text',)
+
+    def __init__(self, text):
+        self.text = text
+
+    def format(self):
+        return self.text
+
+    def as_dict(self):
+        return {"type": "text", "text": self.text}
+
+
+def reply_payload(result, key):
+    """
+    The JSON body for a route answering with ``result``: its chat text under
+    ``key`` and its structured fields under "result". A result's "text" is
+    already in the chat text, so it is not sent a second time.
+    """
+    fields = result.as_dict()
+    fields.pop("text", None)
+    return {key: result.format(), "result": fields}
+
+
+def _default(value):
+    as_dict = getattr(value, 'as_dict', None)
+    if as_dict is None:
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+    return as_dict()
+
+
+def dumps(payload):
+    """Encodes ``payload`` (which may contain result objects) to UTF-8 JSON bytes."""
+    if _HAS_ORJSON:
+        return orjson.dumps(payload, default=_default)
+    return json.dumps(payload, default=_default, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
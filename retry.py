@@ -0,0 +1,139 @@
+# Retry policy for idempotent upstream calls: decorrelated-jitter
+# exponential backoff, Retry-After support on 429/503, and a per-request
+# deadline. Per-upstream counters record how many user requests a retry
+# rescued.
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+
+import requests
+
+RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+# upstream -> {"calls", "retries", "rescued", "exhausted"}
+_stats = {}
+_stats_lock = threading.Lock()
+
+
+class RetryPolicy:
+    """
+    How hard to try before giving up on an upstream call.
+
+    Args:
+      max_attempts: Total attempts, including the first one.
+      base_delay: Smallest backoff in seconds.
+      max_delay: Largest single backoff in seconds.
+      deadline: Total seconds a single call may spend, sleeps included.
+    """
+
+    def __init__(self, max_attempts=4, base_delay=0.25, max_delay=8.0, deadline=15.0):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+
+    def backoff(self, previous_delay):
+        """Decorrelated jitter: a random delay between base and 3x the previous one."""
+        return min(self.max_delay, random.uniform(self.base_delay, previous_delay * 3))
+
+
+DEFAULT_POLICY = RetryPolicy()
+
+
+def _count(upstream, key):
+    with _stats_lock:
+        upstream_stats = _stats.setdefault(upstream, {"calls": 0, "retries": 0, "rescued": 0, "exhausted": 0})
+        upstream_stats[key] += 1
+
+
+def parse_retry_after(value, now=None):
+    """
+    Parses a Retry-After header (delta-seconds or HTTP-date) into seconds.
+
+    Returns:
+      The number of seconds to wait, or None if the header is missing or invalid.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    now = now or datetime.now(timezone.utc)
+    return max(0.0, (retry_at - now).total_seconds())
+
+
+def is_retryable_exception(exc):
+    """Connection failures and timeouts are transient; anything else is a bug or a hard failure."""
+    return isinstance(exc, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+
+
+def is_retryable_response(response):
+    return response.status_code in RETRYABLE_STATUS
+
+
+def call_with_retry(send, upstream, policy=DEFAULT_POLICY, sleep=time.sleep, clock=time.monotonic):
+    """
+    Calls ``send()`` until it returns a non-retryable response.
+
+    Only use this for idempotent requests. The last response is returned
+    as-is once attempts or the deadline run out, so callers keep handling
+    error statuses with ``raise_for_status()``; the last retryable exception
+    is re-raised instead.
+
+    Args:
+      send: Zero-argument callable performing one attempt and returning a response.
+      upstream: Key the retry counters are recorded under.
+      policy: The RetryPolicy to apply.
+    """
+    _count(upstream, "calls")
+    start = clock()
+    delay = policy.base_delay
+    attempt = 0
+    while True:
+        attempt += 1
+        response, error = None, None
+        try:
+            response = send()
+        except Exception as exc:
+            if not is_retryable_exception(exc):
+                raise
+            error = exc
+
+        if error is None and not is_retryable_response(response):
+            if attempt > 1:
+                _count(upstream, "rescued")
+            return response
+
+        if attempt >= policy.max_attempts:
+            break
+        delay = policy.backoff(delay)
+        if response is not None:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                delay = retry_after
+        if clock() - start + delay > policy.deadline:
+            break
+
+        if response is not None:
+            response.close()
+        _count(upstream, "retries")
+        sleep(delay)
+
+    _count(upstream, "exhausted")
+    if error is not None:
+        raise error
+    return response
+
+
+def retry_stats():
+    """Returns a copy of the per-upstream retry counters."""
+    with _stats_lock:
+        return {upstream: dict(upstream_stats) for upstream, upstream_stats in _stats.items()}
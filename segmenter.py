@@ -0,0 +1,116 @@
+# Language-aware sentence segmentation.
+#
+# Sentences are produced lazily from a single precompiled boundary pattern
+# per language, so asking for the first k sentences of an article only
+# scans as far as the k-th boundary. Abbreviations ("Dr.", "e.g.",
+# "U.S."), initials ("J. R. R. Tolkien") and decimals are not treated as
+# sentence ends. Hindi text ends sentences with the danda (।) and double
+# danda (॥); CJK text ends them with full-width punctuation and needs no
+# following space. tokenize splits text into the word tokens used by the
+# passage rankers.
+import re
+from functools import lru_cache
+from itertools import islice
+
+_DEFAULT_TERMINATORS = '.?!'
+
+TERMINATORS = {
+    'hi': '.?!।॥',
+    'ar': '.?!؟',
+    'ja': '.?!。！？',
+    'zh': '.?!。！？',
+}
+
+# Scripts that do not put spaces between sentences.
+_NO_SPACE_LANGS = frozenset({'ja', 'zh'})
+
+# Lowercased, without the final period.
+ABBREVIATIONS = {
+    'en': frozenset({
+        'mr', 'mrs', 'ms', 'dr', 'prof', 'sr', 'jr', 'st', 'mt', 'ft', 'gen', 'gov', 'sen', 'rep',
+        'rev', 'capt', 'col', 'lt', 'sgt', 'vs', 'etc', 'approx', 'ca', 'cf', 'al', 'inc', 'ltd',
+        'co', 'corp', 'incl', 'no', 'nos', 'vol', 'pp', 'fig', 'est', 'jan', 'feb', 'mar', 'apr', 'jun',
+        'jul', 'aug', 'sep', 'sept', 'oct', 'nov', 'dec',
+    }),
+    'es': frozenset({'sr', 'sra', 'srta', 'dr', 'dra', 'ud', 'uds', 'etc', 'pág', 'núm', 'aprox', 'ee', 'uu'}),
+    'fr': frozenset({'m', 'mm', 'mme', 'mlle', 'dr', 'st', 'ste', 'etc', 'env', 'av', 'apr', 'cf', 'p'}),
+    'de': frozenset({'dr', 'prof', 'hr', 'fr', 'nr', 'bzw', 'ca', 'usw', 'vgl', 'evtl', 'ggf', 'inkl', 'st', 'z', 'b'}),
+    'it': frozenset({'sig', 'sigg', 'dott', 'prof', 'ecc', 'pag', 'es', 'ca', 'st'}),
+    'pt': frozenset({'sr', 'sra', 'dr', 'dra', 'etc', 'pág', 'aprox', 'av', 'prof'}),
+}
+
+# Quotes and brackets that may close a sentence after its terminator.
+_CLOSERS = '"\'”’»)]'
+
+
+@lru_cache(maxsize=None)
+def _boundary_pattern(lang):
+    terminators = re.escape(TERMINATORS.get(lang, _DEFAULT_TERMINATORS))
+    gap = r'\s*' if lang in _NO_SPACE_LANGS else r'(?:\s+|$)'
+    return re.compile(f'[{terminators}]+[{re.escape(_CLOSERS)}]*{gap}')
+
+
+def _is_abbreviation(text, end, abbreviations):
+    """True if the period ending at ``end`` belongs to an abbreviation or initial."""
+    start = end
+    while start > 0 and not text[start - 1].isspace():
+        start -= 1
+    token = text[start:end].lstrip(_CLOSERS + '(')
+    # A number before the period ("is 5.", "rose 3.5.") ends the sentence.
+    if not token or token[-1].isdigit():
+        return False
+    # Initials ("J."), dotted abbreviations ("U.S", "e.g") and known short forms.
+    return (len(token) == 1 and token.isalpha()) or '.' in token or token.lower() in abbreviations
+
+
+def iter_sentences(text, lang='en'):
+    """
+    Yields the sentences of ``text`` one at a time.
+
+    Args:
+      text: Plain text, e.g. a Wikipedia extract paragraph.
+      lang: Wikipedia language code; selects terminators and abbreviations.
+    """
+    if not text:
+        return
+    abbreviations = ABBREVIATIONS.get(lang, ABBREVIATIONS['en'])
+    start = 0
+    for match in _boundary_pattern(lang).finditer(text):
+        end = match.end()
+        if end >= len(text):
+            break
+        terminator_end = match.start() + len(match.group().rstrip().rstrip(_CLOSERS))
+        if text[terminator_end - 1] == '.':
+            if _is_abbreviation(text, terminator_end - 1, abbreviations):
+                continue
+            # A lowercase continuation means the period did not end the sentence.
+            if text[end].islower():
+                continue
+        sentence = text[start:end].strip()
+        if sentence:
+            yield sentence
+        start = end
+    sentence = text[start:].strip()
+    if sentence:
+        yield sentence
+
+
+def first_sentences(text, k, lang='en'):
+    """Returns at most the first ``k`` sentences of ``text``; the rest is never scanned."""
+    return list(islice(iter_sentences(text, lang), k))
+
+
+_TOKEN = re.compile(r'\w+')
+
+# Question words and function words that would otherwise dominate scoring.
+STOPWORDS = frozenset({
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'did', 'do', 'does', 'for', 'from', 'had',
+    'has', 'have', 'how', 'in', 'is', 'it', 'its', 'me', 'of', 'on', 'or', 'tell', 'that', 'the',
+    'their', 'this', 'to', 'was', 'were', 'what', 'when', 'where', 'which', 'who', 'whom', 'why',
+    'will', 'with', 'about',
+})
+
+
+def tokenize(text):
+    """Lowercased word tokens of ``text`` without stopwords."""
+    return [token for token in _TOKEN.findall(text.lower()) if token not in STOPWORDS]
@@ -0,0 +1,7 @@
+# The modules live at the repository root, next to app.py. Tests never
+# touch the shared SQLite cache file.
+import os
+import sys
+
+os.environ['WIKI_CACHE_PATH'] = ''
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,73 @@
+# Catalog snapshots: a mapped catalog reads back exactly what was saved,
+# and app2 maps the snapshot instead of re-reading the dump.
+import os
+import shutil
+
+import pytest
+
+from book_catalog import CatalogBuilder, StringColumn, load_catalog, save_catalog
+from recommender import Recommender
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+def make_catalog():
+    builder = CatalogBuilder()
+    builder.add(84, "Frankenstein", "Shelley, Mary", 12345, ('en',), ('Science fiction', 'Monsters -- Fiction'),
+                ('Gothic Fiction',))
+    builder.add(35, "The Time Machine", "Wells, H. G.", 678, ('en', 'fr'), ('Science fiction',), ())
+    builder.add(7, "Ünïcödé — title", "", 0)
+    return builder.build()
+
+
+def test_snapshot_round_trip(tmp_path):
+    catalog = make_catalog()
+    path = str(tmp_path / 'catalog.snapshot')
+    save_catalog(catalog, path)
+    mapped = load_catalog(path)
+
+    assert isinstance(mapped.titles, StringColumn)
+    assert list(mapped.ids) == [84, 35, 7]
+    assert list(mapped.titles) == list(catalog.titles)
+    assert list(mapped.download_counts) == [12345, 678, 0]
+    for i in range(len(catalog)):
+        assert mapped[i].as_dict() == catalog[i].as_dict()
+        assert mapped.languages[i] == catalog.languages[i]
+        assert mapped.subjects[i] == catalog.subjects[i]
+        assert mapped.bookshelves[i] == catalog.bookshelves[i]
+    assert mapped[2].author is None
+    assert [book.title for book in Recommender(mapped).top(2)] == ["Frankenstein", "The Time Machine"]
+
+
+def test_empty_catalog_round_trip(tmp_path):
+    path = str(tmp_path / 'catalog.snapshot')
+    save_catalog(CatalogBuilder().build(), path)
+    assert len(load_catalog(path)) == 0
+
+
+def test_other_files_are_rejected(tmp_path):
+    path = tmp_path / 'catalog.snapshot'
+    path.write_bytes(b'not a snapshot')
+    with pytest.raises(ValueError):
+        load_catalog(str(path))
+
+
+def test_app_maps_the_snapshot_instead_of_rereading_the_dump(monkeypatch, tmp_path):
+    pytest.importorskip('flask')
+    pytest.importorskip('requests')
+    import app2
+
+    dump = str(tmp_path / 'pg_catalog.csv')
+    shutil.copy(os.path.join(FIXTURES, 'pg_catalog.csv'), dump)
+    snapshot = str(tmp_path / 'sf.snapshot')
+
+    first = app2._read_science_fiction_catalog(dump, snapshot)
+    assert isinstance(first.titles, StringColumn)
+    assert os.path.exists(snapshot)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("the dump was read again")
+
+    monkeypatch.setattr(app2, 'read_catalog', fail)
+    second = app2._read_science_fiction_catalog(dump, snapshot)
+    assert list(second.ids) == list(first.ids)
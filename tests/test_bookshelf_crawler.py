@@ -0,0 +1,134 @@
+# Bookshelf crawling against a fake gutenberg.org: pagination, conditional
+# refreshes, failed pages and partial crawls.
+import re
+
+import pytest
+
+requests = pytest.importorskip('requests')
+
+import bookshelf_crawler  # noqa: E402
+from bookshelf_crawler import PAGE_SIZE, BookshelfCrawler, page_key, shelf_key  # noqa: E402
+from content_cache import TieredCache  # noqa: E402
+
+SHELF = 76
+# Page contents of the fake shelf; every later page lists no books.
+PAGES = [
+    [(84, "Frankenstein"), (35, "The Time Machine")],
+    [(36, "The War of the Worlds")],
+]
+ETAG = '"v1"'
+LAST_MODIFIED = "Sat, 01 Jun 2024 00:00:00 GMT"
+
+
+class FakeResponse:
+    def __init__(self, status_code, text="", headers=None):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+
+
+def page_html(books):
+    items = "".join(f'<li class="booklink"><a class="link" href="/ebooks/{book_id}">{title}</a></li>'
+                    for book_id, title in books)
+    return f'<html><body><ul class="results">{items}</ul></body></html>'
+
+
+class FakeGutenberg:
+    """Serves PAGES with validators, answering matching conditional requests with 304."""
+
+    def __init__(self):
+        self.requests = []  # (page, request headers)
+        self.failing = {}  # page -> exception to raise or status code to return
+
+    def __call__(self, url, headers=None, **kwargs):
+        page = (int(re.search(r'start_index=(\d+)', url).group(1)) - 1) // PAGE_SIZE
+        headers = headers or {}
+        self.requests.append((page, headers))
+        failure = self.failing.get(page)
+        if isinstance(failure, Exception):
+            raise failure
+        if failure is not None:
+            return FakeResponse(failure)
+        if headers.get('If-None-Match') == ETAG:
+            return FakeResponse(304)
+        books = PAGES[page] if page < len(PAGES) else []
+        return FakeResponse(200, page_html(books), {'ETag': ETAG, 'Last-Modified': LAST_MODIFIED})
+
+    def pages_requested(self):
+        return sorted(page for page, _ in self.requests)
+
+
+@pytest.fixture
+def gutenberg(monkeypatch):
+    fake = FakeGutenberg()
+    monkeypatch.setattr(bookshelf_crawler, 'http_get', fake)
+    return fake
+
+
+@pytest.fixture
+def crawler():
+    return BookshelfCrawler(store=TieredCache())
+
+
+def titles(books):
+    return [title for title, _ in books[SHELF]]
+
+
+ALL_TITLES = ["Frankenstein", "The Time Machine", "The War of the Worlds"]
+
+
+def test_pagination_ends_at_the_first_empty_page(gutenberg, crawler):
+    books = crawler.crawl((SHELF,))
+    assert titles(books) == ALL_TITLES
+    assert books[SHELF][0] == ["Frankenstein", "https://www.gutenberg.org/ebooks/84"]
+    assert crawler.store.get(shelf_key(SHELF)) == 2
+    # One wave of CONCURRENCY pages covers the shelf; nothing past it is requested.
+    assert gutenberg.pages_requested() == list(range(crawler.max_workers))
+
+
+def test_refresh_revalidates_and_reuses_stored_books(gutenberg, crawler):
+    crawler.crawl((SHELF,))
+    gutenberg.requests.clear()
+
+    books = crawler.crawl((SHELF,))
+    assert titles(books) == ALL_TITLES
+    for page, headers in gutenberg.requests:
+        assert headers == {'If-None-Match': ETAG, 'If-Modified-Since': LAST_MODIFIED}
+    assert crawler.stats()['not_modified'] == len(gutenberg.requests)
+
+
+def test_failed_page_falls_back_to_its_stored_copy(gutenberg, crawler):
+    crawler.crawl((SHELF,))
+    gutenberg.failing[0] = requests.exceptions.ConnectionError("reset")
+    gutenberg.failing[1] = 503
+
+    books = crawler.crawl((SHELF,))
+    assert titles(books) == ALL_TITLES
+    assert crawler.stats()['failed'] == 2
+    assert crawler.store.get(shelf_key(SHELF)) == 2
+
+
+def test_failed_page_without_a_stored_copy_ends_the_shelf(gutenberg, crawler):
+    gutenberg.failing[1] = requests.exceptions.ConnectionError("reset")
+    books = crawler.crawl((SHELF,))
+    assert titles(books) == ["Frankenstein", "The Time Machine"]
+    # The crawl never saw the end of the shelf, so its length is not recorded.
+    assert crawler.store.get(shelf_key(SHELF)) is None
+
+
+def test_partial_crawl_does_not_record_a_page_count(gutenberg, crawler):
+    books = crawler.crawl((SHELF,), max_pages=1)
+    assert titles(books) == ["Frankenstein", "The Time Machine"]
+    assert gutenberg.pages_requested() == [0]
+    assert crawler.store.get(shelf_key(SHELF)) is None
+    assert crawler.store.get(page_key(SHELF, 0))['etag'] == ETAG
+
+
+def test_cached_catalog_reads_the_last_complete_crawl_without_requests(gutenberg, crawler):
+    assert crawler.cached_catalog((SHELF,)) is None
+    crawler.crawl((SHELF,))
+    gutenberg.requests.clear()
+
+    catalog = crawler.cached_catalog((SHELF,))
+    assert list(catalog.titles) == ALL_TITLES
+    assert gutenberg.requests == []
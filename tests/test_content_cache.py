@@ -0,0 +1,43 @@
+# Expired rows in the SQLite tier are purged without being read again.
+from content_cache import SQLiteCache
+
+
+class Clock:
+    now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def row_count(cache):
+    return cache._connection().execute('SELECT COUNT(*) FROM cache').fetchone()[0]
+
+
+def test_expired_rows_are_purged_every_n_writes(tmp_path):
+    clock = Clock()
+    cache = SQLiteCache(str(tmp_path / 'cache.sqlite3'), ttl=10, clock=clock, purge_every=3)
+    cache.set('one-off query', '"a"')
+    cache.set('alias', '"b"')
+    clock.now += 60
+    cache.set('fresh', '"c"')  # third write purges the two expired rows
+    assert row_count(cache) == 1
+    assert cache.get('fresh') == '"c"'
+
+
+def test_opening_a_connection_does_not_purge(tmp_path):
+    clock = Clock()
+    path = str(tmp_path / 'cache.sqlite3')
+    SQLiteCache(path, ttl=10, clock=clock).set('one-off query', '"a"')
+    clock.now += 60
+    cache = SQLiteCache(path, ttl=10, clock=clock)
+    assert row_count(cache) == 1
+    cache.purge_expired()
+    assert row_count(cache) == 0
+
+
+def test_purge_uses_the_expiry_index(tmp_path):
+    cache = SQLiteCache(str(tmp_path / 'cache.sqlite3'))
+    plan = cache._connection().execute(
+        'EXPLAIN QUERY PLAN DELETE FROM cache WHERE expires_at <= ?', (0,)
+    ).fetchall()
+    assert any('cache_expires_at' in row[-1] for row in plan)
@@ -0,0 +1,70 @@
+# Offline tests for the Gutenberg catalog dump reader; everything is read
+# from tests/fixtures.
+import os
+
+from gutenberg_catalog import has_tag, iter_csv_entries, parse_rdf, read_catalog
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+def fixture(name):
+    return os.path.join(FIXTURES, name)
+
+
+def csv_entries():
+    with open(fixture('pg_catalog.csv'), encoding='utf-8', newline='') as lines:
+        return list(iter_csv_entries(lines))
+
+
+def test_csv_entries_skip_non_text_rows():
+    assert [entry.book_id for entry in csv_entries()] == [84, 35, 1342]
+
+
+def test_csv_entry_fields():
+    frankenstein, time_machine, _ = csv_entries()
+    assert frankenstein.title == "Frankenstein Or, The Modern Prometheus"
+    assert frankenstein.author == "Shelley, Mary Wollstonecraft, 1797-1851"
+    assert frankenstein.download_count == 0
+    assert frankenstein.languages == ('en',)
+    assert frankenstein.subjects == ('Science fiction', 'Monsters -- Fiction')
+    assert frankenstein.bookshelves == ('Category: Science-Fiction & Fantasy', 'Gothic Fiction')
+    assert time_machine.languages == ('en', 'fr')
+
+
+def test_parse_rdf():
+    entry = parse_rdf(fixture('pg84.rdf'))
+    assert entry.book_id == 84
+    assert entry.title == "Frankenstein; Or, The Modern Prometheus"
+    assert entry.author == "Shelley, Mary Wollstonecraft"
+    assert entry.download_count == 12345
+    assert entry.languages == ('en',)
+    # The LCC class code "PR" is not a subject heading.
+    assert entry.subjects == ('Science fiction',)
+    assert entry.bookshelves == ('Gothic Fiction',)
+
+
+def test_has_tag_matches_subjects_and_bookshelves():
+    science_fiction = has_tag('science fiction')
+    frankenstein, time_machine, pride = csv_entries()
+    assert science_fiction(frankenstein)
+    assert science_fiction(time_machine)  # bookshelf only
+    assert not science_fiction(pride)
+
+
+def test_read_catalog_csv_gz_with_keep():
+    catalog = read_catalog(fixture('pg_catalog.csv.gz'), keep=has_tag('science fiction'))
+    assert list(catalog.ids) == [84, 35]
+    assert catalog[1].title == "The Time Machine"
+    assert catalog[1].url == "https://www.gutenberg.org/ebooks/35"
+    assert catalog.languages[1] == ('en', 'fr')
+    assert catalog.subjects[0] == ('Science fiction', 'Monsters -- Fiction')
+
+
+def test_read_catalog_rdf_tarball():
+    catalog = read_catalog(fixture('rdf-files.tar.gz'))
+    assert len(catalog) == 1
+    book = catalog[0]
+    assert (book.title, book.author, book.download_count) == (
+        "Frankenstein; Or, The Modern Prometheus", "Shelley, Mary Wollstonecraft", 12345,
+    )
+    assert catalog.bookshelves[0] == ('Gothic Fiction',)
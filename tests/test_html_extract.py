@@ -0,0 +1,54 @@
+# Every installed HTML backend extracts the same booklinks and links from a
+# bookshelf page; the stdlib html.parser backend always runs.
+import os
+
+import pytest
+
+from html_extract import BACKENDS, available_backends, extract_booklinks, get_backend
+
+FIXTURE = os.path.join(os.path.dirname(__file__), 'fixtures', 'bookshelf.html')
+
+BOOKLINKS = [
+    ("Frankenstein; Or, The Modern PrometheusMary Wollstonecraft Shelley12345 downloads", "/ebooks/84"),
+    ("The Time Machine H. G. Wells", "/ebooks/35"),
+    ("The War of the Worlds — Illustrated", "/ebooks/36"),
+]
+LINKS = [
+    ("Project Gutenberg", "/"),
+    ("Subjects & Bookshelves", "/browse/subjects"),
+    ("Sort Alphabetically", "/ebooks/bookshelf/76?sort_order=title"),
+    ("Frankenstein; Or, The Modern PrometheusMary Wollstonecraft Shelley12345 downloads", "/ebooks/84"),
+    ("The Time Machine H. G. Wells", "/ebooks/35"),
+    ("EPUB", "/ebooks/35.epub3.images"),
+    ("No link", None),
+    ("The War of the Worlds — Illustrated", "/ebooks/36"),
+    ("Next", "/ebooks/bookshelf/76?start_index=26"),
+]
+
+
+@pytest.fixture(scope='module')
+def html():
+    with open(FIXTURE, encoding='utf-8') as f:
+        return f.read()
+
+
+@pytest.mark.parametrize('name', available_backends())
+def test_backend_booklinks(html, name):
+    assert get_backend(name).booklinks(html) == BOOKLINKS
+
+
+@pytest.mark.parametrize('name', available_backends())
+def test_backend_links(html, name):
+    # Parsers differ only in the whitespace they keep around nested tags.
+    links = [(' '.join(text.split()), href) for text, href in get_backend(name).links(html)]
+    assert links == LINKS
+
+
+def test_stdlib_backend_is_always_available():
+    assert available_backends()[-1] == 'html.parser'
+    assert set(available_backends()) <= set(BACKENDS)
+
+
+def test_extract_booklinks_makes_absolute_urls(html):
+    books = extract_booklinks(html, backend='html.parser')
+    assert books[0] == {"title": BOOKLINKS[0][0], "url": "https://www.gutenberg.org/ebooks/84"}
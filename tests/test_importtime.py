@@ -0,0 +1,29 @@
+# Importing app or app2 in a fresh interpreter (under -X importtime) must
+# succeed without loading any of the lazy backends.
+import os
+import subprocess
+import sys
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LAZY_BACKENDS = ['numpy', 'pandas', 'bs4', 'lxml', 'selectolax', 'googleapiclient', 'gradio', 'wikipediaapi']
+
+_PROBE = (
+    "import sys; import {module}; "
+    "print(','.join(m for m in {lazy!r} if m in sys.modules))"
+)
+
+
+@pytest.mark.parametrize('module', ['app2', 'app'])
+def test_app_import_loads_no_lazy_backend(module):
+    pytest.importorskip('flask')
+    pytest.importorskip('requests')
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE.format(module=module, lazy=LAZY_BACKENDS)],
+        cwd=REPO_ROOT, capture_output=True, text=True,
+    )
+    assert proc.returncode == 0, proc.stderr.strip().splitlines()[-1:]
+    assert f"| {module}\n" in proc.stderr + "\n"
+    assert proc.stdout.strip() == "", f"importing {module} eagerly loaded {proc.stdout.strip()}"
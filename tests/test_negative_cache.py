@@ -0,0 +1,73 @@
+# Misses expire after their TTL, survive a Bloom filter rebuild, and keep
+# repeated lookups of a missing page off the network.
+import pytest
+
+from negative_cache import BloomFilter, NegativeCache
+
+
+class Clock:
+    now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=100)
+    for i in range(100):
+        bloom.add(f"en:page {i}")
+    assert all(f"en:page {i}" in bloom for i in range(100))
+    assert bloom.count == 100
+
+
+def test_miss_expires_after_ttl():
+    clock = Clock()
+    cache = NegativeCache(ttl=60, clock=clock)
+    cache.add('en', "Asdfghjkl")
+    assert cache.is_missing('en', "asdfghjkl")
+    assert not cache.is_missing('fr', "Asdfghjkl")
+    clock.now += 61
+    assert not cache.is_missing('en', "Asdfghjkl")
+    assert cache.stats() == {'hits': 1, 'entries': 0}
+
+
+def test_full_filter_is_rebuilt_from_live_entries():
+    clock = Clock()
+    cache = NegativeCache(ttl=60, capacity=4, clock=clock)
+    for i in range(4):
+        cache.add('en', f"old {i}")
+    clock.now += 61
+    cache.add('en', "new")  # the filter is full: expired misses are dropped
+    assert cache.stats()['entries'] == 1
+    assert cache._bloom.count == 1
+    assert cache.is_missing('en', "new")
+    assert not cache.is_missing('en', "old 0")
+
+
+def test_repeated_miss_makes_no_upstream_call(monkeypatch):
+    pytest.importorskip('flask')
+    pytest.importorskip('requests')
+    import app2
+    import wiki_lookup
+    from content_cache import TieredCache, WikipediaContentCache
+
+    class EmptySearch:
+        status_code = 200
+
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return {"batchcomplete": True}
+
+    calls = []
+    monkeypatch.setattr(wiki_lookup, 'http_get', lambda url, params=None, **kwargs: calls.append(params) or EmptySearch())
+    monkeypatch.setattr(app2, 'wikipedia_cache', WikipediaContentCache(store=TieredCache()))
+    monkeypatch.setattr(app2, 'missing_pages', NegativeCache())
+
+    first = app2.get_wikipedia_content("Asdfghjkl")
+    assert first.missing and len(calls) == 1
+    repeat = app2.get_wikipedia_content("asdfghjkl")
+    assert repeat.missing and not repeat.found
+    assert len(calls) == 1
+    assert app2.missing_pages.stats()['hits'] == 1
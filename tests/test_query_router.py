@@ -0,0 +1,35 @@
+# Language markers: ordinary words that also name an edition stay English.
+import pytest
+
+from query_router import BOOKS, WIKIPEDIA, router
+
+
+@pytest.mark.parametrize('query', [
+    "What is the weather in Mon?",
+    "Who is the best player in Gun?",
+    "What is the word for peace in Ido?",
+    "Who lives in Twi?",
+    "Where is the castle in Scots?",
+    "What happened in Norman?",
+    "Explain what they sing in Patois",
+    "What are the countries in Latin America?",
+])
+def test_ambiguous_names_do_not_select_an_edition(query):
+    assert router.route(query).lang == 'en'
+
+
+@pytest.mark.parametrize('query, lang, topic', [
+    ("What is photosynthesis in Spanish?", 'es', "photosynthesis"),
+    ("What is photosynthesis in espanol?", 'es', "photosynthesis"),
+    ("Who is Gandhi in हिन्दी?", 'hi', "Gandhi"),
+    ("What is the weather in Mon language?", 'mnw', "the weather"),
+    ("Tell me about tea in Scots Wikipedia", 'sco', "tea"),
+])
+def test_language_markers(query, lang, topic):
+    route = router.route(query)
+    assert (route.intent, route.lang, route.topic) == (WIKIPEDIA, lang, topic)
+
+
+def test_books_intent_keeps_language():
+    route = router.route("Recommend sci-fi books in French")
+    assert (route.intent, route.lang) == (BOOKS, 'fr')
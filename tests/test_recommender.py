@@ -0,0 +1,31 @@
+# Weighted and top-k recommendations over a small catalog.
+import random
+
+from book_catalog import CatalogBuilder
+from recommender import Recommender
+
+
+def make_recommender(counts):
+    builder = CatalogBuilder()
+    for book_id, count in enumerate(counts, 1):
+        builder.add(book_id, f"Book {book_id}", "Author", count)
+    return Recommender(builder.build())
+
+
+def test_sample_returns_distinct_books():
+    recommender = make_recommender([0, 5, 50, 500, 5000])
+    books = recommender.sample(5, rng=random.Random(1))
+    assert sorted(book.title for book in books) == [f"Book {i}" for i in range(1, 6)]
+    assert len(recommender.sample(10)) == 5
+
+
+def test_top_is_ordered_by_downloads():
+    recommender = make_recommender([3, 30, 1, 300])
+    assert [book.title for book in recommender.top(2)] == ["Book 4", "Book 2"]
+
+
+def test_non_positive_k_returns_nothing():
+    recommender = make_recommender([1, 2, 3])
+    assert recommender.sample(0) == []
+    assert recommender.sample(-1) == []
+    assert recommender.top(-1) == []
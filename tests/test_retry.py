@@ -0,0 +1,144 @@
+# Retry engine branches, driven offline with a fake clock and sleep.
+from datetime import datetime, timezone
+
+import pytest
+
+requests = pytest.importorskip('requests')
+
+from retry import RetryPolicy, call_with_retry, parse_retry_after, retry_stats  # noqa: E402
+
+
+class FakeResponse:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def sequence(*outcomes):
+    """A send() returning (or raising) each outcome in turn."""
+    outcomes = list(outcomes)
+    calls = []
+
+    def send():
+        calls.append(1)
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    send.calls = calls
+    return send
+
+
+def run(send, upstream, policy=None):
+    clock = Clock()
+    result = call_with_retry(send, upstream, policy or RetryPolicy(), sleep=clock.sleep, clock=clock)
+    return result, clock
+
+
+def test_retry_after_delta_seconds():
+    assert parse_retry_after("120") == 120.0
+    assert parse_retry_after(" 3 ") == 3.0
+
+
+def test_retry_after_http_date():
+    now = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+    assert parse_retry_after("Mon, 01 Jan 2024 12:00:30 GMT", now=now) == 30.0
+    # A date in the past means "retry now".
+    assert parse_retry_after("Mon, 01 Jan 2024 11:00:00 GMT", now=now) == 0.0
+
+
+def test_retry_after_missing_or_invalid():
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("") is None
+    assert parse_retry_after("soon") is None
+
+
+def test_first_success_is_not_retried():
+    send = sequence(FakeResponse(200))
+    response, clock = run(send, 'test-ok')
+    assert response.status_code == 200
+    assert clock.sleeps == []
+    assert retry_stats()['test-ok'] == {"calls": 1, "retries": 0, "rescued": 0, "exhausted": 0}
+
+
+def test_retryable_status_is_rescued():
+    failed = FakeResponse(503)
+    send = sequence(failed, FakeResponse(200))
+    response, clock = run(send, 'test-rescued')
+    assert response.status_code == 200
+    assert failed.closed
+    assert len(clock.sleeps) == 1
+    assert retry_stats()['test-rescued'] == {"calls": 1, "retries": 1, "rescued": 1, "exhausted": 0}
+
+
+def test_retry_after_overrides_backoff():
+    send = sequence(FakeResponse(429, {"Retry-After": "2"}), FakeResponse(200))
+    response, clock = run(send, 'test-retry-after')
+    assert response.status_code == 200
+    assert clock.sleeps == [2.0]
+
+
+def test_non_retryable_status_is_returned_as_is():
+    send = sequence(FakeResponse(404))
+    response, clock = run(send, 'test-404')
+    assert response.status_code == 404
+    assert len(send.calls) == 1
+    assert clock.sleeps == []
+
+
+def test_exhausted_attempts_return_the_last_response():
+    last = FakeResponse(502)
+    send = sequence(FakeResponse(502), FakeResponse(502), last)
+    response, clock = run(send, 'test-exhausted', RetryPolicy(max_attempts=3))
+    assert response is last
+    assert len(clock.sleeps) == 2
+    assert retry_stats()['test-exhausted'] == {"calls": 1, "retries": 2, "rescued": 0, "exhausted": 1}
+
+
+def test_deadline_stops_before_an_oversized_sleep():
+    send = sequence(FakeResponse(429, {"Retry-After": "60"}), FakeResponse(200))
+    response, clock = run(send, 'test-deadline', RetryPolicy(deadline=15.0))
+    assert response.status_code == 429
+    assert clock.sleeps == []
+    assert len(send.calls) == 1
+    assert retry_stats()['test-deadline']["exhausted"] == 1
+
+
+def test_transient_exception_is_retried():
+    send = sequence(requests.exceptions.ConnectionError("reset"), FakeResponse(200))
+    response, clock = run(send, 'test-connection')
+    assert response.status_code == 200
+    assert retry_stats()['test-connection']["rescued"] == 1
+
+
+def test_last_transient_exception_is_reraised():
+    send = sequence(requests.exceptions.Timeout("slow"), requests.exceptions.Timeout("still slow"))
+    with pytest.raises(requests.exceptions.Timeout, match="still slow"):
+        run(send, 'test-timeout', RetryPolicy(max_attempts=2))
+    assert retry_stats()['test-timeout']["exhausted"] == 1
+
+
+def test_non_retryable_exception_is_raised_at_once():
+    send = sequence(ValueError("bad url"), FakeResponse(200))
+    with pytest.raises(ValueError):
+        run(send, 'test-bug')
+    assert len(send.calls) == 1
+    assert retry_stats()['test-bug']["retries"] == 0
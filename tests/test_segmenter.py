@@ -0,0 +1,25 @@
+# Sentence boundaries around numbers, initials and abbreviations.
+from segmenter import first_sentences, iter_sentences
+
+
+def test_numbers_end_sentences():
+    assert list(iter_sentences("The answer is 5. The next one is 6. It rose by 3.5. Done.")) == [
+        "The answer is 5.", "The next one is 6.", "It rose by 3.5.", "Done.",
+    ]
+
+
+def test_initials_and_abbreviations_do_not_end_sentences():
+    text = "J. R. R. Tolkien was born in 1892. Dr. Smith lives in the U.S. today. See e.g. chapter 2."
+    assert list(iter_sentences(text)) == [
+        "J. R. R. Tolkien was born in 1892.", "Dr. Smith lives in the U.S. today.", "See e.g. chapter 2.",
+    ]
+
+
+def test_non_letter_single_characters_are_not_initials():
+    assert list(iter_sentences("Scores: 10 / 2 = 5 ! Then 7 % . Next one.")) == [
+        "Scores: 10 / 2 = 5 !", "Then 7 % .", "Next one.",
+    ]
+
+
+def test_first_sentences_hindi_danda():
+    assert first_sentences("यह पहला वाक्य है। यह दूसरा है। तीसरा।", 2, 'hi') == ["यह पहला वाक्य है।", "यह दूसरा है।"]
@@ -0,0 +1,77 @@
+# Concurrent callers for one key share a single run of the function.
+import threading
+import time
+
+import pytest
+
+from singleflight import SingleFlight
+
+CALLERS = 8
+
+
+def run_concurrently(flights, fn):
+    """Calls flights.do('key', fn) from CALLERS threads; returns (results, errors)."""
+    results, errors = [], []
+
+    def caller():
+        try:
+            results.append(flights.do('key', fn))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=caller) for _ in range(CALLERS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+    return results, errors
+
+
+def blocking(flights, outcome):
+    """A function that waits until every other caller has joined the flight."""
+    runs = []
+
+    def fn():
+        runs.append(1)
+        deadline = time.monotonic() + 5
+        while flights.coalesced < CALLERS - 1 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        return outcome()
+
+    return fn, runs
+
+
+def test_concurrent_callers_share_one_result():
+    flights = SingleFlight()
+    fn, runs = blocking(flights, lambda: object())
+    results, errors = run_concurrently(flights, fn)
+    assert errors == []
+    assert len(runs) == 1
+    assert len(results) == CALLERS
+    assert all(result is results[0] for result in results)
+    assert flights.stats() == {'executed': 1, 'coalesced': CALLERS - 1}
+
+
+def test_concurrent_callers_share_one_exception():
+    flights = SingleFlight()
+    error = RuntimeError("upstream down")
+
+    def fail():
+        raise error
+
+    fn, runs = blocking(flights, fail)
+    results, errors = run_concurrently(flights, fn)
+    assert results == []
+    assert len(runs) == 1
+    assert len(errors) == CALLERS
+    assert all(e is error for e in errors)
+    assert flights.coalesced == CALLERS - 1
+
+
+def test_completed_call_is_not_remembered():
+    flights = SingleFlight()
+    assert flights.do('key', lambda: 1) == 1
+    assert flights.do('key', lambda: 2) == 2
+    with pytest.raises(ValueError):
+        flights.do('key', lambda: int('x'))
+    assert flights.stats() == {'executed': 3, 'coalesced': 0}
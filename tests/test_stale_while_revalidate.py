@@ -0,0 +1,132 @@
+# Fresh, stale and hard-expired cache entries in get_wikipedia_content,
+# with a fake http_get and an injected cache clock.
+import threading
+import time
+
+import pytest
+
+pytest.importorskip('flask')
+requests = pytest.importorskip('requests')
+
+import app2  # noqa: E402
+import wiki_lookup  # noqa: E402
+from content_cache import (  # noqa: E402
+    FRESH_TTL, STALE_GRACE, LRUCache, SQLiteCache, TieredCache, WikipediaContentCache,
+)
+from negative_cache import NegativeCache  # noqa: E402
+
+
+class Clock:
+    now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+def page(extract):
+    return {"query": {"pages": [{
+        "index": 1, "title": "Albert Einstein", "extract": extract,
+        "fullurl": "https://en.wikipedia.org/wiki/Albert_Einstein",
+    }]}}
+
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, data):
+        self._data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._data
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def cache(monkeypatch, tmp_path, clock):
+    # Memory drops entries after the stale window; the disk tier keeps them
+    # for a week, which is what lets a hard-expired entry still be served.
+    store = TieredCache(memory=LRUCache(clock=clock), disk=SQLiteCache(str(tmp_path / 'cache.sqlite3'), clock=clock))
+    cache = WikipediaContentCache(store=store, clock=clock)
+    monkeypatch.setattr(app2, 'wikipedia_cache', cache)
+    monkeypatch.setattr(app2, 'missing_pages', NegativeCache())
+    document = wiki_lookup.parse_lookup_response(page("Einstein was a physicist. Old text."))
+    cache.set('en', "Albert Einstein", document.title, document.to_dict())
+    return cache
+
+
+def fake_upstream(monkeypatch, respond):
+    calls = []
+
+    def fake_http_get(url, params=None, **kwargs):
+        calls.append(params)
+        return respond()
+
+    monkeypatch.setattr(wiki_lookup, 'http_get', fake_http_get)
+    return calls
+
+
+def wait_for_refreshes():
+    deadline = time.monotonic() + 5
+    while app2._pending_refreshes and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not app2._pending_refreshes
+
+
+def test_fresh_entry_is_served_without_upstream_call(monkeypatch, cache, clock):
+    calls = fake_upstream(monkeypatch, lambda: FakeResponse(page("New text.")))
+    clock.now += FRESH_TTL - 1
+    document = app2.get_wikipedia_content("Albert Einstein")
+    assert "Old text." in document.summary
+    assert calls == []
+
+
+def test_stale_entry_is_served_while_one_refresh_runs(monkeypatch, cache, clock):
+    release = threading.Event()
+
+    def respond():
+        release.wait(timeout=5)
+        return FakeResponse(page("Einstein was a physicist. New text."))
+
+    calls = fake_upstream(monkeypatch, respond)
+    clock.now += FRESH_TTL + 1
+    for _ in range(3):
+        document = app2.get_wikipedia_content("Albert Einstein")
+        assert "Old text." in document.summary
+    # One refresh is in flight; the other two requests did not start one.
+    assert len(app2._pending_refreshes) == 1
+    release.set()
+    wait_for_refreshes()
+    assert len(calls) == 1
+
+    entry = cache.lookup('en', "Albert Einstein")
+    assert entry.is_fresh()
+    assert "New text." in app2.get_wikipedia_content("Albert Einstein").summary
+
+
+def test_expired_entry_is_served_when_refetch_fails(monkeypatch, cache, clock):
+    def respond():
+        raise requests.exceptions.ConnectionError("Wikipedia is down")
+
+    calls = fake_upstream(monkeypatch, respond)
+    clock.now += FRESH_TTL + STALE_GRACE + 1
+    assert not cache.lookup('en', "Albert Einstein").is_servable_stale()
+    document = app2.get_wikipedia_content("Albert Einstein")
+    assert len(calls) == 1
+    assert document.found
+    assert "Old text." in document.summary
+
+
+def test_expired_entry_is_replaced_when_refetch_succeeds(monkeypatch, cache, clock):
+    calls = fake_upstream(monkeypatch, lambda: FakeResponse(page("Einstein was a physicist. New text.")))
+    clock.now += FRESH_TTL + STALE_GRACE + 1
+    document = app2.get_wikipedia_content("Albert Einstein")
+    assert len(calls) == 1
+    assert "New text." in document.summary
+    assert cache.lookup('en', "Albert Einstein").is_fresh()
@@ -0,0 +1,211 @@
+# Upstream calls per answered Wikipedia question, counted offline with a
+# fake http_get in place of the network.
+import pytest
+
+pytest.importorskip('flask')
+pytest.importorskip('requests')
+
+import app2  # noqa: E402
+import wiki_lookup  # noqa: E402
+from content_cache import TieredCache, WikipediaContentCache  # noqa: E402
+
+EINSTEIN = {"query": {"pages": [{
+    "index": 1,
+    "title": "Albert Einstein",
+    "extract": "Albert Einstein was a theoretical physicist. He developed the theory of relativity.",
+    "thumbnail": {"source": "https://upload.wikimedia.org/einstein.jpg"},
+    "fullurl": "https://en.wikipedia.org/wiki/Albert_Einstein",
+}]}}
+
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, data):
+        self._data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._data
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    calls = []
+
+    def fake_http_get(url, params=None, **kwargs):
+        calls.append((url, params))
+        return FakeResponse(EINSTEIN)
+
+    monkeypatch.setattr(wiki_lookup, 'http_get', fake_http_get)
+    monkeypatch.setattr(app2, 'wikipedia_cache', WikipediaContentCache(store=TieredCache()))
+    return calls
+
+
+def test_one_upstream_call_per_question_and_none_on_repeat(upstream):
+    answer = app2.answer_question_from_wikipedia("Albert Einstein")
+    assert answer.found
+    assert answer.title == "Albert Einstein"
+    assert answer.image_url == "https://upload.wikimedia.org/einstein.jpg"
+    assert len(upstream) == 1
+
+    repeat = app2.answer_question_from_wikipedia("Albert Einstein")
+    assert repeat.text == answer.text
+    assert len(upstream) == 1
+
+
+def test_localized_question_is_answered_from_the_lead(monkeypatch):
+    calls = []
+
+    def fake_http_get(url, params=None, **kwargs):
+        calls.append(params)
+        if 'lllang' in params:
+            return FakeResponse({"query": {"pages": [
+                {"index": 1, "title": "Photosynthesis", "langlinks": [{"lang": "es", "title": "Fotosíntesis"}]},
+            ]}})
+        return FakeResponse({"query": {"pages": [{
+            "title": "Fotosíntesis",
+            "extract": "La fotosíntesis es la conversión de materia inorgánica en materia orgánica.",
+            "fullurl": "https://es.wikipedia.org/wiki/Fotos%C3%ADntesis",
+        }]}})
+
+    monkeypatch.setattr(wiki_lookup, 'http_get', fake_http_get)
+    monkeypatch.setattr(app2, 'wikipedia_cache', WikipediaContentCache(store=TieredCache()))
+    answer = app2.answer_question_from_wikipedia("Photosynthesis", lang='es', question="What is Photosynthesis?")
+    assert answer.title == "Fotosíntesis"
+    assert answer.section is None
+    # The langlink and the localized lead; the full article is never fetched.
+    assert len(calls) == 2
+
+
+def _cached_lead(monkeypatch, fetched_at):
+    cache = WikipediaContentCache(store=TieredCache())
+    monkeypatch.setattr(app2, 'wikipedia_cache', cache)
+    document = wiki_lookup.parse_lookup_response(EINSTEIN)
+    cache.set('en', "Albert Einstein", document.title, document.to_dict(), fetched_at=fetched_at)
+    return cache, document
+
+
+def test_loading_sections_keeps_the_lead_fetch_time(monkeypatch):
+    cache, document = _cached_lead(monkeypatch, fetched_at=1000.0)
+    sections = [{"heading": "Early life", "level": 2, "paragraphs": ["Einstein was born in Ulm."]}]
+    monkeypatch.setattr(app2, 'fetch_sections', lambda title, lang: sections)
+
+    full = app2.load_full_document(document)
+    assert full.complete
+    entry = cache.lookup('en', "Albert Einstein")
+    assert entry.fetched_at == 1000.0
+    assert entry.value['complete']
+
+
+def test_empty_sections_are_not_cached_as_complete(monkeypatch):
+    cache, document = _cached_lead(monkeypatch, fetched_at=1000.0)
+    monkeypatch.setattr(app2, 'fetch_sections', lambda title, lang: [])
+
+    assert app2.load_full_document(document) is document
+    assert not cache.lookup('en', "Albert Einstein").value['complete']
+
+
+IMAGES = {"query": {"pages": [
+    {"title": "File:Einstein 1921.jpg",
+     "imageinfo": [{"url": "https://upload.wikimedia.org/einstein_1921.jpg", "width": 800, "height": 1000,
+                    "mime": "image/jpeg"}]},
+    {"title": "File:Commons-logo.svg",
+     "imageinfo": [{"url": "https://upload.wikimedia.org/commons-logo.svg", "width": 1024, "height": 1376,
+                    "mime": "image/svg+xml"}]},
+    {"title": "File:Einstein patent office.jpg",
+     "imageinfo": [{"url": "https://upload.wikimedia.org/einstein_patent.jpg", "width": 640, "height": 480,
+                    "mime": "image/jpeg"}]},
+]}}
+
+
+def test_image_lists_are_cached_on_the_document(monkeypatch):
+    calls = []
+
+    def fake_http_get(url, params=None, **kwargs):
+        calls.append(params)
+        return FakeResponse(IMAGES if params.get("generator") == "images" else EINSTEIN)
+
+    monkeypatch.setattr(wiki_lookup, 'http_get', fake_http_get)
+    monkeypatch.setattr(app2, 'wikipedia_cache', WikipediaContentCache(store=TieredCache()))
+    images = ["https://upload.wikimedia.org/einstein_1921.jpg", "https://upload.wikimedia.org/einstein_patent.jpg"]
+
+    assert app2.answer_question_from_wikipedia("Albert Einstein", max_images=2).images == images
+    assert len(calls) == 2
+    assert app2.answer_question_from_wikipedia("Albert Einstein", max_images=2).images == images
+    assert app2.answer_question_from_wikipedia("Albert Einstein", max_images=1).images == images[:1]
+    assert len(calls) == 2
+    # More images than were resolved before means one more image request.
+    assert app2.answer_question_from_wikipedia("Albert Einstein", max_images=5).images == images
+    assert len(calls) == 3
+
+
+@pytest.mark.parametrize('images', ['abc', '-1', str(app2.MAX_IMAGES + 1)])
+def test_invalid_image_count_is_rejected(upstream, images):
+    response = app2.app.test_client().get('/wikipedia-answer', query_string={'query': "Einstein", 'images': images})
+    assert response.status_code == 400
+    assert 'error' in response.get_json()
+    assert upstream == []
+
+
+@pytest.mark.parametrize('sentences', ['two', '-1', str(app2.MAX_SENTENCES + 1)])
+def test_invalid_sentence_count_is_rejected(upstream, sentences):
+    response = app2.app.test_client().get('/wikipedia-answer', query_string={'query': "Einstein", 'sentences': sentences})
+    assert response.status_code == 400
+    assert 'error' in response.get_json()
+    assert upstream == []
+
+
+def test_sentence_count_trims_the_summary(upstream):
+    response = app2.app.test_client().get('/wikipedia-answer', query_string={'query': "Einstein", 'sentences': '1'})
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body['answer'].startswith("Based on Wikipedia (en):\nAlbert Einstein was a theoretical physicist.\n\n")
+    assert "relativity" not in body['answer']
+    # The text travels once, in the chat answer; the result carries the rest.
+    assert 'text' not in body['result']
+    assert body['result']['title'] == "Albert Einstein"
+
+
+def fake_article(monkeypatch, title, lead, sections):
+    """Serves ``title`` for any search, and its full text for a section fetch."""
+    calls = []
+
+    def fake_http_get(url, params=None, **kwargs):
+        calls.append(params)
+        extract = lead if "exintro" in params else lead + "\n" + sections
+        return FakeResponse({"query": {"pages": [{
+            "index": 1, "title": title, "extract": extract,
+            "fullurl": f"https://en.wikipedia.org/wiki/{title.replace(' ', '_')}",
+        }]}})
+
+    monkeypatch.setattr(wiki_lookup, 'http_get', fake_http_get)
+    monkeypatch.setattr(app2, 'wikipedia_cache', WikipediaContentCache(store=TieredCache()))
+    return calls
+
+
+@pytest.mark.parametrize('query, title', [
+    ("Black holes", "Black hole"),
+    ("What are black holes?", "Black hole"),
+    ("Tell me about USA", "United States"),
+    ("Explain photosynthesis", "Photosynthesis"),
+])
+def test_topic_questions_are_answered_from_the_lead(monkeypatch, query, title):
+    lead = f"{title} is the subject of this article. It is well known."
+    calls = fake_article(monkeypatch, title, lead, "== History ==\nIts history is long and the subject has changed.")
+    answer = app2.process_user_query(query)
+    assert answer.title == title
+    assert answer.text == lead
+    assert answer.section is None
+    assert len(calls) == 1
+
+
+def test_questions_about_part_of_a_topic_rank_passages(monkeypatch):
+    lead = "Rome is the capital city of Italy."
+    calls = fake_article(monkeypatch, "Rome", lead, "== History ==\nThe history of Rome spans 28 centuries.")
+    answer = app2.process_user_query("history of Rome")
+    assert answer.section == "History"
+    assert "28 centuries" in answer.text
+    assert len(calls) == 2
@@ -0,0 +1,78 @@
+# Sentence-level TF-IDF matrix for one article.
+#
+# Every sentence of the article becomes an L2-normalized row of sublinear
+# TF-IDF weights stored as CSR arrays (data, column indices, row pointers).
+# Built once per article and cached, it lets each new question be answered
+# with a query vectorization and a single sparse matrix-vector product,
+# without re-tokenizing the article.
+import math
+from collections import Counter
+
+from lazy_imports import lazy_import
+from segmenter import iter_sentences, tokenize
+
+np = lazy_import('numpy')
+
+
+class SentenceMatrix:
+    """
+    TF-IDF rows for the sentences of a list of paragraphs.
+
+    Attributes:
+      sentences: Sentence texts in article order; row i is sentences[i].
+      paragraph_ptr: Rows paragraph_ptr[p]:paragraph_ptr[p + 1] are the
+        sentences of paragraph p.
+      vocabulary: Term -> column.
+      idf: Smoothed inverse document frequency per column.
+    """
+
+    def __init__(self, paragraphs, lang='en'):
+        sentences, paragraph_ptr = [], [0]
+        vocabulary = {}
+        indices, counts, indptr = [], [], [0]
+        for text in paragraphs:
+            for sentence in iter_sentences(text, lang):
+                tf = Counter(vocabulary.setdefault(token, len(vocabulary)) for token in tokenize(sentence))
+                sentences.append(sentence)
+                indices.extend(tf.keys())
+                counts.extend(tf.values())
+                indptr.append(len(indices))
+            paragraph_ptr.append(len(sentences))
+        self.sentences = sentences
+        self.paragraph_ptr = np.asarray(paragraph_ptr, dtype=np.int64)
+        self.vocabulary = vocabulary
+
+        n = len(sentences)
+        self._indices = np.asarray(indices, dtype=np.int64)
+        self._indptr = np.asarray(indptr, dtype=np.int64)
+        df = np.bincount(self._indices, minlength=len(vocabulary))
+        self.idf = np.log((1 + n) / (1 + df)) + 1
+
+        data = (1 + np.log(np.asarray(counts, dtype=np.float64))) * self.idf[self._indices]
+        norms = np.sqrt(self._row_sums(data * data))
+        self._data = data / np.repeat(np.where(norms > 0, norms, 1), np.diff(self._indptr))
+
+    def _row_sums(self, values):
+        """Sums ``values`` (one per stored entry) over each row; empty rows sum to 0."""
+        totals = np.concatenate(([0.0], np.cumsum(values)))
+        return totals[self._indptr[1:]] - totals[self._indptr[:-1]]
+
+    def query_vector(self, query):
+        """Dense, L2-normalized TF-IDF vector for ``query`` over the article's vocabulary."""
+        vector = np.zeros(len(self.vocabulary))
+        for term, count in Counter(tokenize(query)).items():
+            column = self.vocabulary.get(term)
+            if column is not None:
+                vector[column] = (1 + math.log(count)) * self.idf[column]
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def scores(self, query):
+        """Cosine similarity of every sentence with ``query``."""
+        return self._row_sums(self._data * self.query_vector(query)[self._indices])
+
+    @property
+    def nbytes(self):
+        arrays = (self._data, self._indices, self._indptr, self.idf, self.paragraph_ptr)
+        text = sum(len(s) for s in self.sentences) + sum(len(t) for t in self.vocabulary)
+        return sum(a.nbytes for a in arrays) + text
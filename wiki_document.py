@@ -0,0 +1,113 @@
+# Structured, reusable representation of a fetched Wikipedia page.
+#
+# A WikiDocument is built once per fetch and read directly by the answer
+# extraction code, so answering a question never needs a second download
+# or a second parse of the same page. Documents round-trip through plain
+# dicts for the JSON content cache.
+import hashlib
+import re
+
+# Plaintext extracts fetched with exsectionformat=wiki mark headings as
+# "== Heading ==", "=== Subheading ===" and so on.
+_HEADING = re.compile(r'^(={2,6})\s*(.*?)\s*\1$')
+
+
+def parse_plaintext_extract(text):
+    """
+    Splits a plaintext extract into sections.
+
+    Returns:
+      A list of {"heading", "level", "paragraphs"} dicts. The lead section
+      has an empty heading and level 1.
+    """
+    sections = [{"heading": "", "level": 1, "paragraphs": []}]
+    for line in (text or "").split("\n"):
+        line = line.strip()
+        if not line:
+            continue
+        match = _HEADING.match(line)
+        if match:
+            sections.append({"heading": match.group(2), "level": len(match.group(1)), "paragraphs": []})
+        else:
+            sections[-1]["paragraphs"].append(line)
+    return [s for s in sections if s["paragraphs"] or s["heading"]]
+
+
+class WikiDocument:
+    """
+    A Wikipedia page (or a failed lookup) as returned by get_wikipedia_content.
+
+    Attributes:
+      title: Resolved page title, or None if the lookup failed.
+      lang: Wikipedia language code.
+      sections: List of {"heading", "level", "paragraphs"} dicts, lead first.
+      image_url: Page thumbnail URL, if any.
+      images: Content image URLs, filled in when requested.
+      max_images: The largest number of images ``images`` was resolved for;
+        a smaller request is answered by a prefix of it.
+      url: Canonical page URL.
+      message: Explanation shown to the user when the lookup failed.
+      missing: True if Wikipedia has no page for the query (as opposed to an error).
+      complete: True if ``sections`` covers the whole article, not just the lead.
+    """
+
+    def __init__(self, title=None, lang='en', sections=None, image_url=None, images=None,
+                 url=None, message=None, missing=False, complete=False, max_images=0):
+        self.title = title
+        self.lang = lang
+        self.sections = sections or []
+        self.image_url = image_url
+        self.images = images or []
+        self.max_images = max_images
+        self.url = url
+        self.message = message
+        self.missing = missing
+        self.complete = complete
+
+    @classmethod
+    def failure(cls, message, lang='en', missing=False):
+        return cls(lang=lang, message=message, missing=missing)
+
+    @property
+    def found(self):
+        return self.title is not None
+
+    @property
+    def summary(self):
+        """The lead section's text, or the failure message."""
+        if not self.found:
+            return self.message
+        if self.sections and not self.sections[0]["heading"]:
+            return "\n".join(self.sections[0]["paragraphs"])
+        return ""
+
+    def paragraphs(self):
+        """Yields (section heading, paragraph) pairs in page order."""
+        for section in self.sections:
+            for paragraph in section["paragraphs"]:
+                yield section["heading"], paragraph
+
+    def fingerprint(self):
+        """Digest of the page text; changes whenever the content does."""
+        digest = hashlib.blake2b(digest_size=16)
+        for heading, paragraph in self.paragraphs():
+            digest.update(f"{heading}\x1f{paragraph}\x1e".encode('utf-8'))
+        return digest.hexdigest()
+
+    def to_dict(self):
+        return {
+            "title": self.title,
+            "lang": self.lang,
+            "sections": self.sections,
+            "image_url": self.image_url,
+            "images": self.images,
+            "max_images": self.max_images,
+            "url": self.url,
+            "message": self.message,
+            "missing": self.missing,
+            "complete": self.complete,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**data)
@@ -0,0 +1,407 @@
+# Registry of Wikipedia language editions.
+#
+# One compact table (code, English name, native name) is parsed once per
+# process, at import, into frozen MappingProxyType mappings that request
+# threads read without locks; nothing is rebuilt per request.
+import unicodedata
+from collections import namedtuple
+from types import MappingProxyType
+
+Language = namedtuple('Language', 'code english native')
+
+# code<TAB>English name<TAB>native name, one edition per line.
+_EDITIONS = """\
+ab	Abkhaz	Аԥсшәа
+ace	Acehnese	Bahsa Acèh
+ady	Adyghe	Адыгабзэ
+af	Afrikaans	Afrikaans
+als	Alemannic	Alemannisch
+alt	Southern Altai	Алтай
+am	Amharic	አማርኛ
+ami	Amis	Pangcah
+an	Aragonese	Aragonés
+ang	Old English	Ænglisc
+anp	Angika	अंगिका
+ar	Arabic	العربية
+arc	Aramaic	ܐܪܡܝܐ
+ary	Moroccan Arabic	الدارجة
+arz	Egyptian Arabic	مصرى
+as	Assamese	অসমীয়া
+ast	Asturian	Asturianu
+atj	Atikamekw	Atikamekw
+av	Avar	Авар
+avk	Kotava	Kotava
+awa	Awadhi	अवधी
+ay	Aymara	Aymar aru
+az	Azerbaijani	Azərbaycanca
+azb	South Azerbaijani	تۆرکجه
+ba	Bashkir	Башҡортса
+ban	Balinese	Basa Bali
+bar	Bavarian	Boarisch
+bat-smg	Samogitian	Žemaitėška
+bcl	Central Bikol	Bikol Central
+be	Belarusian	Беларуская
+be-tarask	Belarusian (Taraškievica)	Беларуская (тарашкевіца)
+bg	Bulgarian	Български
+bh	Bhojpuri	भोजपुरी
+bi	Bislama	Bislama
+bjn	Banjar	Banjar
+blk	Pa'O	ပအိုဝ်ႏဘာႏသာႏ
+bm	Bambara	Bamanankan
+bn	Bengali	বাংলা
+bo	Tibetan	བོད་ཡིག
+bpy	Bishnupriya Manipuri	বিষ্ণুপ্রিয়া মণিপুরী
+br	Breton	Brezhoneg
+bs	Bosnian	Bosanski
+bug	Buginese	Basa Ugi
+bxr	Buryat	Буряад
+ca	Catalan	Català
+cbk-zam	Chavacano	Chavacano de Zamboanga
+cdo	Min Dong	Mìng-dĕ̤ng-ngṳ̄
+ce	Chechen	Нохчийн
+ceb	Cebuano	Cebuano
+ch	Chamorro	Chamoru
+chr	Cherokee	ᏣᎳᎩ
+chy	Cheyenne	Tsetsêhestâhese
+ckb	Central Kurdish	کوردی
+co	Corsican	Corsu
+cr	Cree	ᓀᐦᐃᔭᐍᐏᐣ
+crh	Crimean Tatar	Qırımtatarca
+cs	Czech	Čeština
+csb	Kashubian	Kaszëbsczi
+cu	Church Slavonic	Словѣньскъ
+cv	Chuvash	Чӑвашла
+cy	Welsh	Cymraeg
+da	Danish	Dansk
+dag	Dagbani	Dagbanli
+de	German	Deutsch
+din	Dinka	Thuɔŋjäŋ
+diq	Zazaki	Zazaki
+dsb	Lower Sorbian	Dolnoserbski
+dty	Doteli	डोटेली
+dv	Divehi	ދިވެހިބަސް
+dz	Dzongkha	རྫོང་ཁ
+ee	Ewe	Eʋegbe
+el	Greek	Ελληνικά
+eml	Emilian-Romagnol	Emiliàn e rumagnòl
+en	English	English
+eo	Esperanto	Esperanto
+es	Spanish	Español
+et	Estonian	Eesti
+eu	Basque	Euskara
+ext	Extremaduran	Estremeñu
+fa	Persian	فارسی
+fat	Fante	Mfantse
+ff	Fula	Fulfulde
+fi	Finnish	Suomi
+fiu-vro	Võro	Võro
+fj	Fijian	Na Vosa Vakaviti
+fo	Faroese	Føroyskt
+fon	Fon	Fɔ̀ngbè
+fr	French	Français
+frp	Arpitan	Arpetan
+frr	North Frisian	Nordfriisk
+fur	Friulian	Furlan
+fy	West Frisian	Frysk
+ga	Irish	Gaeilge
+gag	Gagauz	Gagauz
+gan	Gan Chinese	贛語
+gcr	Guianan Creole	Kriyòl gwiyannen
+gd	Scottish Gaelic	Gàidhlig
+gl	Galician	Galego
+glk	Gilaki	گیلکی
+gn	Guarani	Avañe'ẽ
+gom	Konkani	गोंयची कोंकणी
+gor	Gorontalo	Bahasa Hulontalo
+got	Gothic	𐌲𐌿𐍄𐌹𐍃𐌺
+gpe	Ghanaian Pidgin	Ghanaian Pidgin
+gu	Gujarati	ગુજરાતી
+guc	Wayuu	Wayuunaiki
+gur	Frafra	Farefare
+guw	Gun	Gungbe
+gv	Manx	Gaelg
+ha	Hausa	Hausa
+hak	Hakka Chinese	客家語
+haw	Hawaiian	Hawaiʻi
+he	Hebrew	עברית
+hi	Hindi	हिन्दी
+hif	Fiji Hindi	Fiji Hindi
+hr	Croatian	Hrvatski
+hsb	Upper Sorbian	Hornjoserbsce
+ht	Haitian Creole	Kreyòl ayisyen
+hu	Hungarian	Magyar
+hy	Armenian	Հայերեն
+hyw	Western Armenian	Արեւմտահայերէն
+ia	Interlingua	Interlingua
+id	Indonesian	Bahasa Indonesia
+ie	Interlingue	Interlingue
+ig	Igbo	Igbo
+ik	Inupiaq	Iñupiatun
+ilo	Ilocano	Ilokano
+inh	Ingush	Гӏалгӏай
+io	Ido	Ido
+is	Icelandic	Íslenska
+it	Italian	Italiano
+iu	Inuktitut	ᐃᓄᒃᑎᑐᑦ
+ja	Japanese	日本語
+jam	Jamaican Patois	Patois
+jbo	Lojban	La .lojban.
+jv	Javanese	Basa Jawa
+ka	Georgian	ქართული
+kaa	Karakalpak	Qaraqalpaqsha
+kab	Kabyle	Taqbaylit
+kbd	Kabardian	Адыгэбзэ
+kbp	Kabiye	Kabɩyɛ
+kcg	Tyap	Tyap
+kg	Kongo	Kongo
+ki	Kikuyu	Gĩkũyũ
+kk	Kazakh	Қазақша
+kl	Greenlandic	Kalaallisut
+km	Khmer	ភាសាខ្មែរ
+kn	Kannada	ಕನ್ನಡ
+ko	Korean	한국어
+koi	Komi-Permyak	Перем коми
+krc	Karachay-Balkar	Къарачай-малкъар
+ks	Kashmiri	कॉशुर
+ksh	Colognian	Ripoarisch
+ku	Kurdish	Kurdî
+kv	Komi	Коми
+kw	Cornish	Kernowek
+ky	Kyrgyz	Кыргызча
+la	Latin	Latina
+lad	Ladino	Ladino
+lb	Luxembourgish	Lëtzebuergesch
+lbe	Lak	Лакку
+lez	Lezgian	Лезги
+lfn	Lingua Franca Nova	Lingua Franca Nova
+lg	Luganda	Luganda
+li	Limburgish	Limburgs
+lij	Ligurian	Ligure
+lld	Ladin	Ladin
+lmo	Lombard	Lombard
+ln	Lingala	Lingála
+lo	Lao	ລາວ
+lt	Lithuanian	Lietuvių
+ltg	Latgalian	Latgaļu
+lv	Latvian	Latviešu
+mad	Madurese	Madhurâ
+mai	Maithili	मैथिली
+map-bms	Banyumasan	Basa Banyumasan
+mdf	Moksha	Мокшень
+mg	Malagasy	Malagasy
+mhr	Meadow Mari	Олык марий
+mi	Maori	Māori
+min	Minangkabau	Minangkabau
+mk	Macedonian	Македонски
+ml	Malayalam	മലയാളം
+mn	Mongolian	Монгол
+mni	Meitei	ꯃꯤꯇꯩ ꯂꯣꯟ
+mnw	Mon	ဘာသာ မန်
+mr	Marathi	मराठी
+mrj	Hill Mari	Кырык мары
+ms	Malay	Bahasa Melayu
+mt	Maltese	Malti
+mwl	Mirandese	Mirandés
+my	Burmese	မြန်မာဘာသာ
+myv	Erzya	Эрзянь
+mzn	Mazanderani	مازِرونی
+nah	Nahuatl	Nāhuatl
+nap	Neapolitan	Napulitano
+nds	Low German	Plattdüütsch
+nds-nl	Dutch Low Saxon	Nedersaksies
+ne	Nepali	नेपाली
+new	Newar	नेपाल भाषा
+nia	Nias	Li Niha
+nl	Dutch	Nederlands
+nn	Norwegian Nynorsk	Norsk nynorsk
+no	Norwegian	Norsk bokmål
+nov	Novial	Novial
+nqo	N'Ko	ߒߞߏ
+nrm	Norman	Nouormand
+nso	Northern Sotho	Sesotho sa Leboa
+nv	Navajo	Diné bizaad
+ny	Chichewa	Chi-Chewa
+oc	Occitan	Occitan
+olo	Livvi-Karelian	Livvinkarjala
+om	Oromo	Oromoo
+or	Odia	ଓଡ଼ିଆ
+os	Ossetian	Ирон
+pa	Punjabi	ਪੰਜਾਬੀ
+pag	Pangasinan	Pangasinan
+pam	Kapampangan	Kapampangan
+pap	Papiamento	Papiamentu
+pcd	Picard	Picard
+pcm	Nigerian Pidgin	Naijá
+pdc	Pennsylvania German	Deitsch
+pfl	Palatine German	Pälzisch
+pi	Pali	पालि
+pih	Norfuk	Norfuk / Pitkern
+pl	Polish	Polski
+pms	Piedmontese	Piemontèis
+pnb	Western Punjabi	پنجابی
+pnt	Pontic Greek	Ποντιακά
+ps	Pashto	پښتو
+pt	Portuguese	Português
+pwn	Paiwan	Pinayuanan
+qu	Quechua	Runa Simi
+rm	Romansh	Rumantsch
+rmy	Romani	Romani čhib
+rn	Kirundi	Ikirundi
+ro	Romanian	Română
+roa-rup	Aromanian	Armãneashti
+roa-tara	Tarantino	Tarandíne
+ru	Russian	Русский
+rue	Rusyn	Русиньскый
+rw	Kinyarwanda	Ikinyarwanda
+sa	Sanskrit	संस्कृतम्
+sah	Yakut	Саха тыла
+sat	Santali	ᱥᱟᱱᱛᱟᱲᱤ
+sc	Sardinian	Sardu
+scn	Sicilian	Sicilianu
+sco	Scots	Scots
+sd	Sindhi	سنڌي
+se	Northern Sami	Davvisámegiella
+sg	Sango	Sängö
+sh	Serbo-Croatian	Srpskohrvatski
+shi	Tachelhit	Taclḥit
+shn	Shan	ၽႃႇသႃႇတႆး
+si	Sinhala	සිංහල
+simple	Simple English	Simple English
+sk	Slovak	Slovenčina
+skr	Saraiki	سرائیکی
+sl	Slovene	Slovenščina
+sm	Samoan	Gagana Samoa
+smn	Inari Sami	Anarâškielâ
+sn	Shona	ChiShona
+so	Somali	Soomaaliga
+sq	Albanian	Shqip
+sr	Serbian	Српски
+srn	Sranan Tongo	Sranantongo
+ss	Swazi	SiSwati
+st	Sesotho	Sesotho
+stq	Saterland Frisian	Seeltersk
+su	Sundanese	Sunda
+sv	Swedish	Svenska
+sw	Swahili	Kiswahili
+szl	Silesian	Ślůnski
+szy	Sakizaya	Sakizaya
+ta	Tamil	தமிழ்
+tay	Atayal	Tayal
+tcy	Tulu	ತುಳು
+te	Telugu	తెలుగు
+tet	Tetum	Tetun
+tg	Tajik	Тоҷикӣ
+th	Thai	ไทย
+ti	Tigrinya	ትግርኛ
+tk	Turkmen	Türkmençe
+tl	Tagalog	Tagalog
+tly	Talysh	Tolışi
+tn	Tswana	Setswana
+to	Tongan	Lea faka-Tonga
+tpi	Tok Pisin	Tok Pisin
+tr	Turkish	Türkçe
+trv	Seediq	Seediq
+ts	Tsonga	Xitsonga
+tt	Tatar	Татарча
+tum	Tumbuka	ChiTumbuka
+tw	Twi	Twi
+ty	Tahitian	Reo tahiti
+tyv	Tuvan	Тыва дыл
+udm	Udmurt	Удмурт
+ug	Uyghur	ئۇيغۇرچە
+uk	Ukrainian	Українська
+ur	Urdu	اردو
+uz	Uzbek	Oʻzbekcha
+ve	Venda	Tshivenda
+vec	Venetian	Vèneto
+vep	Veps	Vepsän kel'
+vi	Vietnamese	Tiếng Việt
+vls	West Flemish	West-Vlams
+vo	Volapük	Volapük
+wa	Walloon	Walon
+war	Waray	Winaray
+wo	Wolof	Wolof
+wuu	Wu Chinese	吴语
+xal	Kalmyk	Хальмг
+xh	Xhosa	IsiXhosa
+xmf	Mingrelian	მარგალური
+yi	Yiddish	ייִדיש
+yo	Yoruba	Yorùbá
+za	Zhuang	Vahcuengh
+zea	Zeelandic	Zeêuws
+zh	Chinese	中文
+zh-classical	Classical Chinese	文言
+zh-min-nan	Min Nan	Bân-lâm-gú
+zh-yue	Cantonese	粵語
+zu	Zulu	IsiZulu
+"""
+
+
+# Editions selected by a bare "in <language>" in a query. Many other
+# editions are named like ordinary words ("Mon", "Gun", "Ido", "Scots",
+# "Norman", "Patois"), so they need "in <language> language" or
+# "in <language> Wikipedia", unless their name is written in a non-Latin
+# script, which cannot be mistaken for English.
+MARKER_CODES = frozenset("""
+af am ar az be bg bn bs ca cs cy da de el en eo es et eu fa fi fr ga gl gu ha he hi hr hu hy id ig
+is it ja ka kk km kn ko ku la lo lt lv mk ml mr ms my ne nl nn no pa pl ps pt ro ru si simple sk sl
+so sq sr sv sw ta te th tl tr uk ur uz vi xh yo zh zu
+""".split())
+
+
+def _fold(name):
+    """Case- and accent-insensitive form of a language name."""
+    decomposed = unicodedata.normalize('NFKD', name.casefold())
+    return ''.join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def _load(table):
+    languages = {}
+    names = {}
+    for line in table.splitlines():
+        code, english, native = line.split('\t')
+        languages[code] = Language(code, english, native)
+        for name in (english, native):
+            names.setdefault(_fold(name), code)
+    return MappingProxyType(languages), MappingProxyType(names)
+
+
+LANGUAGES, _NAMES = _load(_EDITIONS)
+
+
+def get_language(code):
+    """Returns the Language for a Wikipedia code, or None if there is no such edition."""
+    return LANGUAGES.get(code)
+
+
+def code_for_name(name):
+    """Maps an English or native language name ("German", "Deutsch", "हिन्दी") to its code."""
+    return _NAMES.get(_fold(name.strip()))
+
+
+def language_names():
+    """
+    All English and native names, plus their unaccented forms ("espanol"),
+    mapped to language codes, for building query patterns.
+    """
+    names = {}
+    for language in LANGUAGES.values():
+        for name in (language.english, language.native):
+            names.setdefault(name, language.code)
+            names.setdefault(_fold(name), language.code)
+    return names
+
+
+def _is_latin(name):
+    return all(not c.isalpha() or unicodedata.name(c, '').startswith('LATIN') for c in name)
+
+
+def marker_names():
+    """
+    The subset of language_names() that may follow a bare "in": names of
+    MARKER_CODES editions and names written in a non-Latin script.
+    """
+    return {
+        name: code for name, code in language_names().items()
+        if code in MARKER_CODES or not _is_latin(name)
+    }
@@ -0,0 +1,245 @@
+# Single-round-trip Wikipedia lookup.
+#
+# One MediaWiki API request uses generator=search to pick the best page for
+# the query and, in the same response, returns its plaintext lead section
+# (prop=extracts with exintro), its thumbnail (prop=pageimages) and its
+# canonical URL (prop=info), with redirects resolved. Nothing is parsed as
+# HTML; the rest of the article's sections are fetched only on demand.
+# This replaces the wikipedia-api page fetch plus the separate pageimages
+# call. Full image lists come from generator=images, which resolves file
+# URLs in the same paginated stream.
+# For other language editions, find_langlink maps the English search hit to
+# its localized title so the page can be fetched by exact title.
+import re
+
+from html_extract import iter_paragraphs
+from http_client import http_get
+from wiki_document import WikiDocument, parse_plaintext_extract
+
+THUMBNAIL_SIZE = 300
+
+# Streamed article HTML is read in chunks of this many bytes.
+STREAM_CHUNK_SIZE = 16 * 1024
+
+
+def api_url(lang):
+    return f"https://{lang}.wikipedia.org/w/api.php"
+
+
+def page_params(thumb_size=THUMBNAIL_SIZE, intro_only=True):
+    """Query parameters for a page's text, thumbnail and URL; add a page selector."""
+    params = {
+        "action": "query",
+        "format": "json",
+        "formatversion": 2,
+        "prop": "extracts|pageimages|info",
+        "explaintext": 1,
+        "exsectionformat": "wiki",
+        "piprop": "thumbnail",
+        "pithumbsize": thumb_size,
+        "inprop": "url",
+        "redirects": 1,
+    }
+    if intro_only:
+        params["exintro"] = 1
+    return params
+
+
+def lookup_params(query, thumb_size=THUMBNAIL_SIZE, intro_only=True):
+    return dict(page_params(thumb_size, intro_only), generator="search", gsrsearch=query, gsrlimit=1)
+
+
+def parse_lookup_response(data, lang='en', intro_only=True):
+    """
+    Builds a WikiDocument for the best page in a generator=search response.
+
+    Returns:
+      The WikiDocument, or None if the search found nothing.
+    """
+    pages = (data or {}).get("query", {}).get("pages") or []
+    if not pages:
+        return None
+    # generator=search tags each page with its rank as "index".
+    page = min(pages, key=lambda p: p.get("index", 0))
+    return WikiDocument(
+        title=page["title"],
+        lang=lang,
+        sections=parse_plaintext_extract(page.get("extract", "")),
+        image_url=page.get("thumbnail", {}).get("source"),
+        url=page.get("fullurl"),
+        complete=not intro_only,
+    )
+
+
+def lookup_page(query, lang='en', thumb_size=THUMBNAIL_SIZE, intro_only=True):
+    """
+    Finds the page best matching ``query`` and returns it as a WikiDocument.
+
+    Args:
+      intro_only: Fetch only the lead section (enough for summary answers).
+
+    Raises:
+      requests.exceptions.RequestException: If the API request fails.
+    """
+    params = lookup_params(query, thumb_size, intro_only)
+    response = http_get(api_url(lang), params=params)
+    response.raise_for_status()
+    return parse_lookup_response(response.json(), lang, intro_only)
+
+
+def lookup_title(title, lang='en', thumb_size=THUMBNAIL_SIZE, intro_only=True):
+    """
+    Like lookup_page, for an exact title (no search).
+
+    Raises:
+      requests.exceptions.RequestException: If the API request fails.
+    """
+    params = dict(page_params(thumb_size, intro_only), titles=title)
+    response = http_get(api_url(lang), params=params)
+    response.raise_for_status()
+    data = response.json()
+    pages = [p for p in data.get("query", {}).get("pages") or [] if not p.get("missing")]
+    return parse_lookup_response({"query": {"pages": pages}}, lang, intro_only)
+
+
+def find_langlink(query, lang, source_lang='en'):
+    """
+    Finds the page for ``query`` on the ``source_lang`` Wikipedia and the
+    title of the same article in ``lang``, in one request.
+
+    Returns:
+      (source title, localized title) where the localized title is None if
+      the article has no ``lang`` edition, or None if the search found nothing.
+
+    Raises:
+      requests.exceptions.RequestException: If the API request fails.
+    """
+    params = {
+        "action": "query",
+        "format": "json",
+        "formatversion": 2,
+        "generator": "search",
+        "gsrsearch": query,
+        "gsrlimit": 1,
+        "prop": "langlinks",
+        "lllang": lang,
+        "redirects": 1,
+    }
+    response = http_get(api_url(source_lang), params=params)
+    response.raise_for_status()
+    pages = response.json().get("query", {}).get("pages") or []
+    if not pages:
+        return None
+    page = min(pages, key=lambda p: p.get("index", 0))
+    links = page.get("langlinks") or []
+    return page["title"], (links[0].get("title") if links else None)
+
+
+def fetch_sections(title, lang='en'):
+    """
+    Fetches every section of a page as plaintext.
+
+    Raises:
+      requests.exceptions.RequestException: If the API request fails.
+    """
+    params = {
+        "action": "query",
+        "format": "json",
+        "formatversion": 2,
+        "titles": title,
+        "redirects": 1,
+        "prop": "extracts",
+        "explaintext": 1,
+        "exsectionformat": "wiki",
+    }
+    response = http_get(api_url(lang), params=params)
+    response.raise_for_status()
+    pages = response.json().get("query", {}).get("pages") or [{}]
+    return parse_plaintext_extract(pages[0].get("extract", ""))
+
+
+def stream_lead_paragraphs(title, lang='en', max_paragraphs=3, min_words=0, chunk_size=STREAM_CHUNK_SIZE):
+    """
+    Reads a page's rendered HTML incrementally and returns its first lead paragraphs.
+
+    The body is parsed as it downloads and the connection is closed as soon
+    as ``max_paragraphs`` paragraphs of at least ``min_words`` words have
+    been seen, so long articles are never transferred in full.
+
+    Raises:
+      requests.exceptions.RequestException: If the request fails.
+    """
+    response = http_get(f"https://{lang}.wikipedia.org/w/index.php",
+                        params={"title": title, "action": "render"}, stream=True)
+    try:
+        response.raise_for_status()
+        response.encoding = response.encoding or "utf-8"
+        paragraphs = []
+        for paragraph in iter_paragraphs(response.iter_content(chunk_size, decode_unicode=True), lead_only=True):
+            if len(paragraph.split()) >= min_words:
+                paragraphs.append(paragraph)
+                if len(paragraphs) >= max_paragraphs:
+                    break
+        return paragraphs
+    finally:
+        response.close()
+
+
+# Only raster formats make sense as answer illustrations.
+CONTENT_IMAGE_MIMES = frozenset({"image/jpeg", "image/png", "image/gif", "image/webp"})
+MIN_IMAGE_SIDE = 100
+_NON_CONTENT_TITLE = re.compile(r"\b(icon|logo|flag|symbol|stub|padlock|wiktionary|commons)\b|[-_ ]?ambox", re.IGNORECASE)
+
+
+def is_content_image(title, info):
+    """True for photos and figures; False for icons, logos, flags and tiny graphics."""
+    if info.get("mime") not in CONTENT_IMAGE_MIMES:
+        return False
+    if min(info.get("width", 0), info.get("height", 0)) < MIN_IMAGE_SIDE:
+        return False
+    return not _NON_CONTENT_TITLE.search(title)
+
+
+def images_params(title, batch_size):
+    return {
+        "action": "query",
+        "format": "json",
+        "formatversion": 2,
+        "titles": title,
+        "redirects": 1,
+        "generator": "images",
+        "gimlimit": batch_size,
+        "prop": "imageinfo",
+        "iiprop": "url|size|mime",
+    }
+
+
+def get_page_images(title, lang='en', max_images=5, batch_size=50):
+    """
+    Returns up to ``max_images`` content image URLs for a page.
+
+    generator=images with prop=imageinfo resolves the file list and each
+    file's URL, size and MIME type in the same response. Continuation
+    requests are only made while fewer than ``max_images`` usable images
+    have been found.
+
+    Raises:
+      requests.exceptions.RequestException: If an API request fails.
+    """
+    params = images_params(title, batch_size)
+    image_urls = []
+    while True:
+        response = http_get(api_url(lang), params=params)
+        response.raise_for_status()
+        data = response.json()
+
+        for page in data.get("query", {}).get("pages", []):
+            info = (page.get("imageinfo") or [{}])[0]
+            if info.get("url") and is_content_image(page.get("title", ""), info):
+                image_urls.append(info["url"])
+                if len(image_urls) >= max_images:
+                    return image_urls
+
+        if "continue" not in data:
+            return image_urls
+        params = dict(images_params(title, batch_size), **data["continue"])